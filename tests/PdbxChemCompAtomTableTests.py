@@ -0,0 +1,125 @@
+##
+#
+# File:    PdbxChemCompAtomTableTests.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Test cases for building and reading the columnar chemical component atom table.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import glob
+import inspect
+import os
+import platform
+import sys
+import time
+import traceback
+import unittest
+
+import numpy as np
+from mmcif_utils.persist.PdbxCoreIoAdapter import PdbxCoreIoAdapter as PdbxIoAdapter
+from mmcif_utils.persist.PdbxPersist import PdbxPersist
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompAtomTable import PdbxChemCompAtomTable
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompPersist import PdbxChemCompAtomIt
+
+
+class PdbxChemCompAtomTableTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stdout
+        self.__verbose = True
+        here = os.path.abspath(os.path.dirname(__file__))
+        outdir = os.path.join(here, "test-output", platform.python_version())
+        if not os.path.exists(outdir):  # pragma: no cover
+            os.makedirs(outdir)
+        self.__persistStorePath = os.path.join(outdir, "chemcomp.db")
+        self.__tablePath = os.path.join(outdir, "chemcomp-atom-table")
+        if not glob.glob(self.__persistStorePath + "*"):  # pragma: no cover
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            for pth in sorted(glob.glob(os.path.join(here, "data", "ligand-dict-v3", "*.cif"))):
+                myReader.read(pdbxFilePath=pth)
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.setContainerList(myReader.getContainerList())
+            myPersist.store(dbFileName=self.__persistStorePath)
+
+    def tearDown(self):
+        pass
+
+    def testCreateAtomTable(self):
+        """Test case -  create and read the columnar atom table and compare with the accessor classes"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            aTab = PdbxChemCompAtomTable(verbose=self.__verbose, log=self.__lfh)
+            nAtoms = aTab.makeTable(storePath=self.__persistStorePath, tablePath=self.__tablePath)
+            self.assertGreater(nAtoms, 0)
+            tableD = aTab.readTable(tablePath=self.__tablePath)
+            self.assertEqual(int(tableD["atomOffset"][-1]), nAtoms)
+            self.assertEqual(tableD["modelXyz"].shape, (nAtoms, 3))
+            aromaticA = aTab.getFlags(tableD, "aromaticFlag")
+            leavingA = aTab.getFlags(tableD, "leavingFlag")
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.open(dbFileName=self.__persistStorePath)
+            atNoCounts = {}
+            for ccId in tableD["ccId"]:
+                sl = aTab.getComponentSlice(tableD, ccId)
+                dC = myPersist.fetchObject(containerName=str(ccId), objectName="chem_comp_atom")
+                if dC is None:
+                    self.assertEqual(sl.start, sl.stop)
+                    continue
+                self.assertEqual(sl.stop - sl.start, dC.getRowCount())
+                for ii, atom in enumerate(PdbxChemCompAtomIt(dC, self.__verbose, self.__lfh), start=sl.start):
+                    self.assertEqual(tableD["atomName"][ii], atom.getName())
+                    self.assertEqual(tableD["elementCode"][ii], atom.getAtNo())
+                    self.assertEqual(tableD["charge"][ii], atom.getFormalCharge())
+                    self.assertEqual(aromaticA[ii], atom.isAromatic())
+                    self.assertEqual(leavingA[ii], atom.getLeavingAtomFlag() == "Y")
+                    if atom.hasIdealCoordinates():
+                        self.assertTrue(np.allclose(tableD["idealXyz"][ii], atom.getIdealCoordinates(), atol=1.0e-3))
+                    atNoCounts[atom.getAtNo()] = atNoCounts.get(atom.getAtNo(), 0) + 1
+            myPersist.close()
+            self.assertEqual(aTab.getElementCounts(tableD), atNoCounts)
+            self.__lfh.write("Atom table length %d element counts %r\n" % (nAtoms, atNoCounts))
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+
+def suiteChemCompAtomTable():  # pragma: no cover
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(PdbxChemCompAtomTableTests("testCreateAtomTable"))
+    return suiteSelect
+
+
+if __name__ == "__main__":  # pragma: no cover
+    mySuite = suiteChemCompAtomTable()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
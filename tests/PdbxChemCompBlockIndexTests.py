@@ -0,0 +1,122 @@
+##
+#
+# File:    PdbxChemCompBlockIndexTests.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Test cases for the byte offset data block index of a dictionary file.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import builtins
+import glob
+import inspect
+import os
+import platform
+import sys
+import time
+import traceback
+import unittest
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompBlockIndex import (
+    PdbxChemCompBlockIndex,
+)
+
+
+class PdbxChemCompBlockIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stdout
+        self.__verbose = True
+        here = os.path.abspath(os.path.dirname(__file__))
+        outdir = os.path.join(here, "test-output", platform.python_version())
+        if not os.path.exists(outdir):  # pragma: no cover
+            os.makedirs(outdir)
+        self.__pathList = sorted(glob.glob(os.path.join(here, "data", "ligand-dict-v3", "*.cif")))
+        self.__dictPath = os.path.join(outdir, "Components-block-v3.cif")
+        self.__blockIndexPath = os.path.join(outdir, "chemcomp-block-index.pic")
+        with builtins.open(self.__dictPath, "w", encoding="utf-8") as fout:
+            for pth in self.__pathList:
+                with builtins.open(pth, encoding="utf-8") as fin:
+                    fout.write(fin.read())
+                fout.write("\n")
+
+    def tearDown(self):
+        pass
+
+    def testBlockIndex(self):
+        """Test case -  index the data blocks of a dictionary file and fetch raw text and byte ranges"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            bIndx = PdbxChemCompBlockIndex(verbose=self.__verbose, log=self.__lfh)
+            indexD = bIndx.makeIndex(self.__dictPath, indexPath=self.__blockIndexPath)
+            self.assertEqual(bIndx.readIndex(indexPath=self.__blockIndexPath), indexD)
+            self.assertEqual(bIndx.readIndex(indexPath=self.__blockIndexPath + "-missing"), {})
+            self.assertTrue(bIndx.isCurrent(indexD, self.__dictPath))
+            self.assertFalse(bIndx.isCurrent(indexD, self.__dictPath + "-missing"))
+            ccIdList = [os.path.splitext(os.path.basename(pth))[0] for pth in self.__pathList]
+            self.assertEqual([ccId for ccId, _, _ in indexD["blockList"]], ccIdList)
+            # The raw text of each block starts with the text of the source definition --
+            for ccId, pth in zip(ccIdList, self.__pathList):
+                with builtins.open(pth, encoding="utf-8") as fin:
+                    text = fin.read()
+                self.assertTrue(bIndx.fetchText(indexD, self.__dictPath, ccId).startswith(text[text.index("data_") :]))
+            self.assertIsNone(bIndx.fetchText(indexD, self.__dictPath, "XXX"))
+            # Byte ranges hold whole blocks and cover all blocks --
+            with builtins.open(self.__dictPath, "rb") as fin:
+                data = fin.read()
+            for blocksPerRange in [1, 2, 100]:
+                rangeList = bIndx.getRangeList(indexD, blocksPerRange)
+                self.assertEqual(sum(nBlock for _, _, nBlock in rangeList), len(ccIdList))
+                self.assertEqual(rangeList[0][0], indexD["blockList"][0][1])
+                self.assertEqual(rangeList[-1][0] + rangeList[-1][1], len(data))
+                for offset, length, _ in rangeList:
+                    self.assertTrue(data[offset : offset + length].startswith(b"data_"))
+            # data_ lines inside text fields do not start blocks --
+            with builtins.open(self.__dictPath, "ab") as fout:
+                fout.write(b"data_ZZZ\n_chem_comp.id ZZZ\n_chem_comp.name\n;\ndata_YYY\n;\n")
+            blockList = bIndx.scan(self.__dictPath)
+            self.assertEqual([ccId for ccId, _, _ in blockList], ccIdList + ["ZZZ"])
+            self.assertFalse(bIndx.isCurrent(indexD, self.__dictPath))
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+
+def suiteBlockIndex():  # pragma: no cover
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(PdbxChemCompBlockIndexTests("testBlockIndex"))
+    return suiteSelect
+
+
+if __name__ == "__main__":  # pragma: no cover
+    mySuite = suiteBlockIndex()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,134 @@
+##
+#
+# File:    PdbxChemCompBondGraphTests.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Test cases for per-component and dictionary-wide CSR bond graphs.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import glob
+import inspect
+import os
+import platform
+import sys
+import time
+import traceback
+import unittest
+
+import numpy as np
+from mmcif_utils.persist.PdbxCoreIoAdapter import PdbxCoreIoAdapter as PdbxIoAdapter
+from mmcif_utils.persist.PdbxPersist import PdbxPersist
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompBondGraph import (
+    PdbxChemCompBondGraph,
+    PdbxChemCompDictBondGraph,
+)
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompPersist import PdbxChemCompBondIt
+
+
+class PdbxChemCompBondGraphTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stdout
+        self.__verbose = True
+        here = os.path.abspath(os.path.dirname(__file__))
+        outdir = os.path.join(here, "test-output", platform.python_version())
+        if not os.path.exists(outdir):  # pragma: no cover
+            os.makedirs(outdir)
+        self.__persistStorePath = os.path.join(outdir, "chemcomp.db")
+        self.__graphPath = os.path.join(outdir, "chemcomp-bond-graph")
+        if not glob.glob(self.__persistStorePath + "*"):  # pragma: no cover
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            for pth in sorted(glob.glob(os.path.join(here, "data", "ligand-dict-v3", "*.cif"))):
+                myReader.read(pdbxFilePath=pth)
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.setContainerList(myReader.getContainerList())
+            myPersist.store(dbFileName=self.__persistStorePath)
+
+    def tearDown(self):
+        pass
+
+    def __checkGraph(self, gr, bC):
+        """Compare graph neighbors with the bond list of the input bond category."""
+        nameL = gr.getAtomNameList()
+        pairS = set()
+        if bC is not None:
+            for bond in PdbxChemCompBondIt(bC, self.__verbose, self.__lfh):
+                pairS.add(frozenset(bond.getBond()))
+        self.assertEqual(gr.getBondCount(), len(pairS))
+        self.assertEqual(int(np.sum(np.diff(gr.getIndptr()))), 2 * gr.getBondCount())
+        for ii in range(gr.getAtomCount()):
+            for jj, bId in zip(gr.getNeighbors(ii), gr.getNeighborBonds(ii)):
+                self.assertIn(frozenset((nameL[ii], nameL[jj])), pairS)
+                self.assertIn(ii, gr.getBondAtoms()[bId])
+
+    def testComponentBondGraph(self):
+        """Test case -  build per-component bond graphs and the dictionary-wide concatenated graph"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            dGraph = PdbxChemCompDictBondGraph(verbose=self.__verbose, log=self.__lfh)
+            nBonds = dGraph.makeGraph(storePath=self.__persistStorePath, graphPath=self.__graphPath)
+            self.assertGreater(nBonds, 0)
+            graphD = dGraph.readGraph(graphPath=self.__graphPath)
+            self.assertEqual(len(graphD["bondOrder"]), nBonds)
+
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.open(dbFileName=self.__persistStorePath)
+            for ccId in myPersist.getStoreContainerIndex():
+                aC = myPersist.fetchObject(containerName=ccId, objectName="chem_comp_atom")
+                bC = myPersist.fetchObject(containerName=ccId, objectName="chem_comp_bond")
+                if aC is None:
+                    continue
+                gr = PdbxChemCompBondGraph(aC, bC, self.__verbose, self.__lfh)
+                self.__checkGraph(gr, bC)
+                grD = dGraph.getComponentGraph(graphD, ccId)
+                self.assertEqual(grD.getAtomNameList(), gr.getAtomNameList())
+                self.assertTrue(np.array_equal(grD.getIndptr(), gr.getIndptr()))
+                self.assertTrue(np.array_equal(grD.getIndices(), gr.getIndices()))
+                self.assertTrue(np.array_equal(grD.getBondOrders(), gr.getBondOrders()))
+                self.assertTrue(np.array_equal(grD.getBondAromaticFlags(), gr.getBondAromaticFlags()))
+            myPersist.close()
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+
+def suiteChemCompBondGraph():  # pragma: no cover
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(PdbxChemCompBondGraphTests("testComponentBondGraph"))
+    return suiteSelect
+
+
+if __name__ == "__main__":  # pragma: no cover
+    mySuite = suiteChemCompBondGraph()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
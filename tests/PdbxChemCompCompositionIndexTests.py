@@ -0,0 +1,140 @@
+##
+#
+# File:    PdbxChemCompCompositionIndexTests.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Test cases for the element composition matrix and range queries.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import copy
+import glob
+import inspect
+import os
+import platform
+import sys
+import time
+import traceback
+import unittest
+
+import numpy as np
+from mmcif_utils.persist.PdbxCoreIoAdapter import PdbxCoreIoAdapter as PdbxIoAdapter
+from mmcif_utils.persist.PdbxPersist import PdbxPersist
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompCompositionIndex import (
+    PdbxChemCompCompositionIndex,
+)
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompDictIndex import PdbxChemCompDictIndex
+
+
+class PdbxChemCompCompositionIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stdout
+        self.__verbose = True
+        here = os.path.abspath(os.path.dirname(__file__))
+        outdir = os.path.join(here, "test-output", platform.python_version())
+        if not os.path.exists(outdir):  # pragma: no cover
+            os.makedirs(outdir)
+        self.__persistStorePath = os.path.join(outdir, "chemcomp.db")
+        self.__indexPath = os.path.join(outdir, "chemcomp-index.pic")
+        self.__compIndexPath = os.path.join(outdir, "chemcomp-composition-index")
+        if not glob.glob(self.__persistStorePath + "*"):  # pragma: no cover
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            for pth in sorted(glob.glob(os.path.join(here, "data", "ligand-dict-v3", "*.cif"))):
+                myReader.read(pdbxFilePath=pth)
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.setContainerList(myReader.getContainerList())
+            myPersist.store(dbFileName=self.__persistStorePath)
+
+    def tearDown(self):
+        pass
+
+    def testCompositionQuery(self):
+        """Test case -  build the composition matrix and compare element range queries with a scan"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            dIndx = PdbxChemCompDictIndex(verbose=self.__verbose, log=self.__lfh)
+            ccIdx = dIndx.makeIndex(storePath=self.__persistStorePath, indexPath=self.__indexPath)
+            cIndx = PdbxChemCompCompositionIndex(verbose=self.__verbose, log=self.__lfh)
+            self.assertEqual(cIndx.makeIndex(ccIdx, indexPath=self.__compIndexPath), len(ccIdx))
+            indexD = cIndx.readIndex(indexPath=self.__compIndexPath)
+            self.assertEqual(cIndx.readIndex(indexPath=self.__compIndexPath + "-missing"), {})
+            self.assertEqual(indexD["composition"].dtype, np.int32)
+            self.assertEqual(list(indexD["ccId"]), list(ccIdx.keys()))
+
+            # Compare the vectorized queries with a scan over the index typeCounts --
+            rangeD = {"C": (6, 10), "p": 1}
+            expL = [
+                ccId
+                for ccId, d in ccIdx.items()
+                if 6 <= d["typeCounts"].get("C", 0) <= 10 and d["typeCounts"].get("P", 0) == 1
+            ]
+            self.assertGreater(len(expL), 0)
+            self.assertEqual(cIndx.query(indexD, rangeD), expL)
+            self.assertEqual(cIndx.query(indexD, {"C": (6, 10), "P": np.int32(1)}), expL)
+            self.assertEqual(cIndx.query(indexD, {"N": (None, 0)}), ["RIB"])
+            self.assertEqual(cIndx.query(indexD, {"P": (2, None)}), ["ATP"])
+            self.assertEqual(cIndx.query(indexD), list(ccIdx.keys()))
+            self.assertEqual(cIndx.getFormulaCounts(indexD, "ATP"), ccIdx["ATP"]["typeCounts"])
+            self.assertIsNone(cIndx.getFormulaCounts(indexD, "XXX"))
+            self.assertRaises(ValueError, cIndx.query, indexD, {"Xx": 1})
+
+            # A metal complex is excluded by the no-metals predicate --
+            metalIdx = copy.deepcopy(ccIdx)
+            metalIdx["ZNX"] = {"typeCounts": {"ZN": 1, "C": 8, "P": 1}}
+            cIndx.makeIndex(metalIdx, indexPath=self.__compIndexPath)
+            indexD = cIndx.readIndex(indexPath=self.__compIndexPath)
+            self.assertIn("ZNX", cIndx.query(indexD, rangeD))
+            self.assertEqual(cIndx.query(indexD, rangeD, excludeMetals=True), expL)
+
+            # Counts beyond the int16 range and unknown atom types (counted in column 0) --
+            bigIdx = {"BIG": {"typeCounts": {"C": 40000, "H": 80002}}, "UNK": {"typeCounts": {"C": 2, "QQ": 3}}}
+            cIndx.makeIndex(bigIdx, indexPath=self.__compIndexPath)
+            indexD = cIndx.readIndex(indexPath=self.__compIndexPath)
+            self.assertEqual(cIndx.getFormulaCounts(indexD, "BIG"), {"H": 80002, "C": 40000})
+            self.assertEqual(cIndx.getFormulaCounts(indexD, "UNK"), {"?": 3, "C": 2})
+            self.assertEqual(cIndx.query(indexD, {"C": (30000, None)}), ["BIG"])
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+
+def suiteCompositionIndex():  # pragma: no cover
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(PdbxChemCompCompositionIndexTests("testCompositionQuery"))
+    return suiteSelect
+
+
+if __name__ == "__main__":  # pragma: no cover
+    mySuite = suiteCompositionIndex()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -22,15 +22,43 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Creative Commons Attribution 3.0 Unported"
 __version__ = "V0.01"
 
+import glob
 import inspect
 import os
 import platform
+import shutil
 import sys
 import time
 import traceback
 import unittest
+from typing import ClassVar
+
+from mmcif_utils.persist.PdbxCoreIoAdapter import PdbxCoreIoAdapter as PdbxIoAdapter
+from mmcif_utils.persist.PdbxPersist import PdbxPersist
 
 from wwpdb.utils.cc_dict_util.persist.PdbxChemCompDictIndex import PdbxChemCompDictIndex
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompDictIndexers import (
+    PdbxChemCompIndexerBase,
+)
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompNameIndex import PdbxChemCompNameIndex
+
+
+class AtomCountIndexer(PdbxChemCompIndexerBase):
+    """Example indexer counting the atoms of each component."""
+
+    _name: ClassVar[str] = "atomCount"
+    _objectNameList: ClassVar[list[str]] = ["chem_comp_atom"]
+
+    def __init__(self):
+        super(AtomCountIndexer, self).__init__(verbose=False)
+        self.__countD = {}
+
+    def add(self, ccId, categoryD):
+        dC = categoryD["chem_comp_atom"]
+        self.__countD[ccId] = dC.getRowCount() if dC is not None else 0
+
+    def getIndex(self):
+        return self.__countD
 
 
 # pylint: disable=protected-access
@@ -83,6 +111,213 @@ class PdbxChemCompDictIndexTests(unittest.TestCase):
             )
         )
 
+    def testCreateIndexMulti(self):
+        """Test case -  create search index from persistent store with multiple processes"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            dIndx = PdbxChemCompDictIndex(verbose=self.__verbose, log=self.__lfh)
+            ccIdx = dIndx.makeIndex(storePath=self.__persistStorePath, indexPath=self.__indexPath)
+            ccIdxMulti = dIndx.makeIndex(storePath=self.__persistStorePath, indexPath=self.__indexPath, numProc=2)
+            self.assertGreater(len(ccIdx), 0)
+            self.assertEqual(ccIdxMulti, ccIdx)
+            self.assertEqual(list(ccIdxMulti.keys()), list(ccIdx.keys()))
+            self.assertEqual(dIndx.readIndex(indexPath=self.__indexPath), ccIdx)
+        except:  # noqa: E722 pylint: disable=bare-except
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%d seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+    def testUpdateIndex(self):
+        """Test case -  incremental update of the search and parent indices after a store update"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            here = os.path.abspath(os.path.dirname(__file__))
+            outdir = os.path.dirname(self.__persistStorePath)
+            storePath = os.path.join(outdir, "chemcomp-update.db")
+            indexPath = os.path.join(outdir, "chemcomp-update-index.pic")
+            parentIndexPath = os.path.join(outdir, "chemcomp-update-parent-index.pic")
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            for pth in sorted(glob.glob(os.path.join(here, "data", "ligand-dict-v3", "*.cif"))):
+                myReader.read(pdbxFilePath=pth)
+            containerList = myReader.getContainerList()
+            self.__storeContainers(storePath, containerList)
+            dIndx = PdbxChemCompDictIndex(verbose=self.__verbose, log=self.__lfh)
+            dIndx.makeIndex(storePath=storePath, indexPath=indexPath)
+            dIndx.makeParentComponentIndex(storePath=storePath, indexPath=parentIndexPath)
+            self.assertEqual(dIndx.findChangedComponents(storePath, indexPath), ([], []))
+            #
+            # Modify the first two components and drop the last --
+            c0, c1 = containerList[0], containerList[1]
+            c0.getObj("chem_comp").setValue("2099-01-01", "pdbx_modified_date", 0)
+            c0.getObj("chem_comp").setValue("UPDATED NAME", "name", 0)
+            c1.getObj("chem_comp").setValue("2099-01-01", "pdbx_modified_date", 0)
+            c1.getObj("chem_comp").setValue(c0.getName(), "mon_nstd_parent_comp_id", 0)
+            self.__storeContainers(storePath, containerList[:-1])
+            changedIdList, removedIdList = dIndx.findChangedComponents(storePath, indexPath)
+            self.assertEqual(changedIdList, [c0.getName(), c1.getName()])
+            self.assertEqual(removedIdList, [containerList[-1].getName()])
+
+            # Parent index update with change detection against the search index before its update --
+            shutil.copyfile(parentIndexPath, parentIndexPath + "-copy")
+            pD, cD = dIndx.updateParentComponentIndex(
+                storePath=storePath, indexPath=parentIndexPath + "-copy", searchIndexPath=indexPath
+            )
+            nameIndexPath = os.path.join(outdir, "chemcomp-update-name-index.pic")
+            retD = dIndx.updateIndices(
+                storePath=storePath, indexPath=indexPath, parentIndexPath=parentIndexPath, nameIndexPath=nameIndexPath
+            )
+            ccIdx = retD["search"]
+            nameD = PdbxChemCompNameIndex(self.__verbose, self.__lfh).readIndex(indexPath=nameIndexPath)
+            self.assertEqual(nameD["ccIdList"], list(ccIdx.keys()))
+            self.assertIn("UPDATED NAME", nameD["nameList"][0])
+            self.assertEqual(retD["parent"], (pD, cD))
+            self.assertEqual(dIndx.findChangedComponents(storePath, indexPath), ([], []))
+            self.assertEqual(ccIdx[c0.getName()]["name"], "UPDATED NAME")
+            self.assertEqual(pD, {c0.getName(): [c1.getName()]})
+            self.assertEqual(dIndx.readIndex(indexPath=indexPath), ccIdx)
+            self.assertEqual(dIndx.readParentComponentIndex(indexPath=parentIndexPath), (pD, cD))
+            # Compare with a full rebuild --
+            fullIdx = dIndx.makeIndex(storePath=storePath, indexPath=indexPath)
+            self.assertEqual(list(ccIdx.items()), list(fullIdx.items()))
+            self.assertEqual(dIndx.makeParentComponentIndex(storePath=storePath, indexPath=parentIndexPath), (pD, cD))
+        except:  # noqa: E722 pylint: disable=bare-except
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%d seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+    def __storeContainers(self, storePath, containerList):
+        for pth in glob.glob(storePath + "*"):
+            os.remove(pth)
+        myPersist = PdbxPersist(self.__verbose, self.__lfh)
+        myPersist.setContainerList(containerList)
+        myPersist.store(dbFileName=storePath)
+
+    def testCreateIndicesSinglePass(self):
+        """Test case -  create the search and parent indices with additional indexers in a single pass"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            dIndx = PdbxChemCompDictIndex(verbose=self.__verbose, log=self.__lfh)
+            ccIdx = dIndx.makeIndex(storePath=self.__persistStorePath, indexPath=self.__indexPath)
+            pD, cD = dIndx.makeParentComponentIndex(storePath=self.__persistStorePath, indexPath=self.__parentIndexPath)
+            retD = dIndx.makeIndices(
+                storePath=self.__persistStorePath,
+                indexPath=self.__indexPath,
+                parentIndexPath=self.__parentIndexPath,
+                indexerList=[AtomCountIndexer()],
+            )
+            self.assertEqual(retD["search"], ccIdx)
+            self.assertEqual(retD["parent"], (pD, cD))
+            self.assertEqual(dIndx.readIndex(indexPath=self.__indexPath), ccIdx)
+            self.assertEqual(dIndx.readParentComponentIndex(indexPath=self.__parentIndexPath), (pD, cD))
+            for ccId, d in ccIdx.items():
+                self.assertEqual(retD["atomCount"][ccId], sum(d["typeCounts"].values()))
+            self.assertEqual(set(dIndx.getTimingDict()), {"fetch", "search", "parent", "atomCount"})
+            # An indexer without getIndex() cannot be instantiated --
+            incompleteIndexer = type("IncompleteIndexer", (PdbxChemCompIndexerBase,), {"add": AtomCountIndexer.add})
+            self.assertRaises(TypeError, incompleteIndexer)
+        except:  # noqa: E722 pylint: disable=bare-except
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%d seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+    def testMappedIndex(self):
+        """Test case -  write and read the memory-mapped search index"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            dIndx = PdbxChemCompDictIndex(verbose=self.__verbose, log=self.__lfh)
+            ccIdx = dIndx.makeIndex(storePath=self.__persistStorePath, indexPath=self.__indexPath)
+            mappedIndexPath = os.path.join(os.path.dirname(self.__indexPath), "chemcomp-index.idx")
+            self.assertEqual(dIndx.writeMappedIndex(ccIdx, mappedIndexPath), len(ccIdx))
+            mIdx = dIndx.readMappedIndex(mappedIndexPath)
+            self.assertEqual(len(mIdx), len(ccIdx))
+            self.assertEqual(list(mIdx), list(ccIdx))
+            self.assertEqual(dict(mIdx.items()), ccIdx)
+            for ccId, d in ccIdx.items():
+                self.assertIn(ccId, mIdx)
+                self.assertEqual(mIdx[ccId], d)
+                self.assertEqual(mIdx.get(ccId + "-X"), None)
+            self.assertNotIn("", mIdx)
+            mIdx.close()
+            self.assertEqual(dIndx.readMappedIndex(self.__indexPath), {})
+            self.assertEqual(dIndx.writeMappedIndex({}, mappedIndexPath), 0)
+            self.assertEqual(len(dIndx.readMappedIndex(mappedIndexPath)), 0)
+        except:  # noqa: E722 pylint: disable=bare-except
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%d seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
     def testCreateParentIndex(self):
         """Test case -  create search index for parent residues from persistent store"""
         startTime = time.time()
@@ -150,6 +385,10 @@ class PdbxChemCompDictIndexTests(unittest.TestCase):
 def suiteChemCompBuildIndex():  # pgragma: no cover
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(PdbxChemCompDictIndexTests("testCreateIndex"))
+    suiteSelect.addTest(PdbxChemCompDictIndexTests("testCreateIndexMulti"))
+    suiteSelect.addTest(PdbxChemCompDictIndexTests("testUpdateIndex"))
+    suiteSelect.addTest(PdbxChemCompDictIndexTests("testCreateIndicesSinglePass"))
+    suiteSelect.addTest(PdbxChemCompDictIndexTests("testMappedIndex"))
     suiteSelect.addTest(PdbxChemCompDictIndexTests("testReadIndex"))
     return suiteSelect
 
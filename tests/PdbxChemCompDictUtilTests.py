@@ -7,6 +7,10 @@
 # Updates:
 #   23-Feb-2012 Add directory path list generator and update example from prd cc data.
 #    2-Feb-2017 jdw unified with chem_ref_data
+#   18-Oct-2026     add local tests of the parallel store build from a path list
+#   18-Oct-2026     add a local test of the batched store update from a path list
+#   18-Oct-2026     add a local test of the streaming store build
+#   18-Oct-2026     add parallel batches to the streaming store build test
 ##
 """
 Test cases for PdbxChemCompDictUtil demonstrating creation and updating of serialized
@@ -24,14 +28,20 @@ __version__ = "V0.01"
 #    from io import open as open
 import builtins
 import fnmatch
+import glob
 import inspect
 import os
 import os.path
+import platform
+import shutil
 import sys
 import time
 import traceback
 import unittest
 
+from mmcif_utils.persist.PdbxCoreIoAdapter import PdbxCoreIoAdapter as PdbxIoAdapter
+from mmcif_utils.persist.PdbxPersist import PdbxPersist
+
 from wwpdb.utils.cc_dict_util.persist.PdbxChemCompDictUtil import PdbxChemCompDictUtil
 from wwpdb.utils.config.ConfigInfo import ConfigInfo, getSiteId
 
@@ -233,6 +243,324 @@ class PdbxChemCompDictUtilTests(unittest.TestCase):
         )
 
 
+class PdbxChemCompDictUtilLocalTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stdout
+        self.__verbose = True
+        here = os.path.abspath(os.path.dirname(__file__))
+        self.__outDir = os.path.join(here, "test-output", platform.python_version())
+        if not os.path.exists(self.__outDir):  # pragma: no cover
+            os.makedirs(self.__outDir)
+        self.__pathList = sorted(glob.glob(os.path.join(here, "data", "ligand-dict-v3", "*.cif")))
+        self.__missingPath = os.path.join(here, "data", "ligand-dict-v3", "MISSING.cif")
+        self.__storePath1 = os.path.join(self.__outDir, "chemcomp-util-1.db")
+
+    def __getStoreContent(self, storePath):
+        myPersist = PdbxPersist(self.__verbose, self.__lfh)
+        myPersist.open(dbFileName=storePath)
+        contentL = []
+        for ccId in myPersist.getStoreContainerIndex():
+            for objName in ["chem_comp", "chem_comp_atom", "chem_comp_bond", "pdbx_chem_comp_descriptor"]:
+                dC = myPersist.fetchObject(containerName=ccId, objectName=objName)
+                contentL.append((ccId, objName, dC.get() if dC is not None else None))
+        myPersist.close()
+        return contentL
+
+    def tearDown(self):
+        pass
+
+    def testCreateStorePathListMulti(self):
+        """Test case -  create persistent stores from a path list with serial and parallel parsing"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            pathList = self.__pathList[:2] + [self.__missingPath] + self.__pathList[2:]
+            for numProc in [1, 2]:
+                dUtil = PdbxChemCompDictUtil(verbose=self.__verbose, log=self.__lfh)
+                storePath = os.path.join(self.__outDir, "chemcomp-util-%d.db" % numProc)
+                ok = dUtil.makeStoreFromPathList(pathList=pathList, storePath=storePath, numProc=numProc)
+                self.assertTrue(ok)
+                self.assertEqual(dUtil.getFailedPathList(), [(self.__missingPath, "read failed")])
+                self.assertEqual(dUtil.getContainerCount(), len(self.__pathList))
+                self.assertEqual(self.__getStoreContent(storePath), self.__getStoreContent(self.__storePath1))
+        except:  # noqa: E722 pylint: disable=bare-except
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+    def testUpdateStorePathListBatch(self):
+        """Test case -  update a persistent store from a path list with duplicate and new definitions in one batch"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            storePath = os.path.join(self.__outDir, "chemcomp-util-update.db")
+            for pth in glob.glob(storePath + "*"):
+                os.remove(pth)
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            for pth in self.__pathList[:3]:
+                myReader.read(pdbxFilePath=pth)
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.setContainerList(myReader.getContainerList())
+            myPersist.store(dbFileName=storePath)
+            storeNameList = [container.getName() for container in myReader.getContainerList()]
+            #
+            # A second copy of the first definition supersedes the first copy --
+            dupPath = os.path.join(self.__outDir, "dup-" + os.path.basename(self.__pathList[0]))
+            shutil.copyfile(self.__pathList[0], dupPath)
+            pathList = [self.__pathList[0], *self.__pathList[3:], self.__missingPath, dupPath]
+            dUtil = PdbxChemCompDictUtil(verbose=self.__verbose, log=self.__lfh)
+            summaryD = dUtil.updateStoreByFileBatch(pathList=pathList, storePath=storePath, numProc=2)
+            self.assertEqual(dUtil.getFailedPathList(), [(self.__missingPath, "read failed")])
+            self.assertEqual(len(summaryD), len(self.__pathList) - 2)
+            self.assertEqual(summaryD[storeNameList[0]]["status"], "updated")
+            self.assertEqual(summaryD[storeNameList[0]]["path"], dupPath)
+            self.assertEqual(summaryD[storeNameList[0]]["supersededPathList"], [self.__pathList[0]])
+            for name, d in summaryD.items():
+                if name != storeNameList[0]:
+                    self.assertEqual(d["status"], "added")
+                    self.assertEqual(d["supersededPathList"], [])
+
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.open(dbFileName=storePath)
+            ccIdList = myPersist.getStoreContainerIndex()
+            myPersist.close()
+            self.assertEqual(ccIdList, storeNameList + [name for name in summaryD if name not in storeNameList])
+            self.assertTrue(dUtil.updateStoreByFile(pathList=self.__pathList, storePath=storePath))
+            self.assertFalse(dUtil.updateStoreByFile(pathList=[self.__missingPath], storePath=storePath))
+            self.assertEqual(dUtil.getFailedPathList(), [(self.__missingPath, "read failed")])
+            self.assertIsNone(dUtil.updateStoreByFileBatch(pathList=self.__pathList, storePath=storePath + "-missing"))
+        except:  # noqa: E722 pylint: disable=bare-except
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+    def testCreateStoreStreaming(self):
+        """Test case -  create persistent stores from a dictionary file in bounded (parallel) batches and in one read"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            dictPath = os.path.join(self.__outDir, "Components-util-v3.cif")
+            with builtins.open(dictPath, "w", encoding="utf-8") as fout:
+                for pth in self.__pathList:
+                    with builtins.open(pth, encoding="utf-8") as fin:
+                        fout.write(fin.read())
+                    fout.write("\n")
+            dUtil = PdbxChemCompDictUtil(verbose=self.__verbose, log=self.__lfh)
+            storePath = os.path.join(self.__outDir, "chemcomp-util-dict.db")
+            self.assertTrue(dUtil.makeStoreFromFile(dictPath=dictPath, storePath=storePath))
+            self.assertEqual(dUtil.getContainerCount(), len(self.__pathList))
+            contentL = self.__getStoreContent(storePath)
+            for batchSize, numProc in [(1, 1), (2, 1), (100, 1), (0, 2), (1, 2), (2, 2)]:
+                storePath = os.path.join(self.__outDir, "chemcomp-util-stream-%d-%d.db" % (batchSize, numProc))
+                ok = dUtil.makeStoreFromFile(
+                    dictPath=dictPath, storePath=storePath, batchSize=batchSize, numProc=numProc
+                )
+                self.assertTrue(ok)
+                self.assertEqual(dUtil.getContainerCount(), len(self.__pathList))
+                self.assertEqual(self.__getStoreContent(storePath), contentL)
+                self.assertEqual(glob.glob(storePath + "-tmpstore*"), [])
+            self.assertFalse(dUtil.makeStoreFromFile(dictPath=self.__missingPath, storePath=storePath, batchSize=2))
+            # A range that is not valid UTF-8 fails the build --
+            badPath = os.path.join(self.__outDir, "Components-util-bad-v3.cif")
+            with builtins.open(dictPath, "rb") as fin:
+                dictBytes = fin.read()
+            ii = dictBytes.index(b"\n", dictBytes.index(b"data_")) + 1
+            with builtins.open(badPath, "wb") as fout:
+                fout.write(dictBytes[:ii] + b"# \xff\n" + dictBytes[ii:])
+            for numProc in [1, 2]:
+                storePath = os.path.join(self.__outDir, "chemcomp-util-bad-%d.db" % numProc)
+                self.assertFalse(
+                    dUtil.makeStoreFromFile(dictPath=badPath, storePath=storePath, batchSize=1, numProc=numProc)
+                )
+                self.assertEqual(glob.glob(storePath + "*"), [])
+            # Rejected builds leave no temporary store files --
+            storePath = os.path.join(self.__outDir, "chemcomp-util-rejected.db")
+            for batchSize in [0, 2]:
+                self.assertFalse(
+                    dUtil.makeStoreFromFile(dictPath=dictPath, storePath=storePath, minSize=10**9, batchSize=batchSize)
+                )
+                self.assertEqual(glob.glob(storePath + "*"), [])
+        except:  # noqa: E722 pylint: disable=bare-except
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+    def testSyncStorePathList(self):
+        """Test case -  synchronize a persistent store with new, changed, touched and removed definition files"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            syncDir = os.path.join(self.__outDir, "sync-definitions")
+            if os.path.exists(syncDir):
+                shutil.rmtree(syncDir)
+            os.makedirs(syncDir)
+            pathList = []
+            for pth in self.__pathList:
+                pathList.append(os.path.join(syncDir, os.path.basename(pth)))
+                shutil.copyfile(pth, pathList[-1])
+            storePath = os.path.join(self.__outDir, "chemcomp-util-sync.db")
+            for pth in glob.glob(storePath + "*"):
+                os.remove(pth)
+            dUtil = PdbxChemCompDictUtil(verbose=self.__verbose, log=self.__lfh)
+            #
+            # Store without a manifest -- full build
+            countD = dUtil.syncStoreFromPathList(pathList=pathList, storePath=storePath)
+            self.assertEqual(countD, {"added": len(pathList), "changed": 0, "removed": 0, "unchanged": 0, "failed": 0})
+            self.assertTrue(os.path.exists(dUtil.getManifestPath(storePath)))
+            countD = dUtil.syncStoreFromPathList(pathList=pathList, storePath=storePath)
+            self.assertEqual(countD, {"added": 0, "changed": 0, "removed": 0, "unchanged": len(pathList), "failed": 0})
+            #
+            # Touched but unmodified, modified without one category, removed and new definition files --
+            os.utime(pathList[0], (time.time() + 10, time.time() + 10))
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            myReader.read(pdbxFilePath=pathList[1])
+            myReader.getContainerList()[0].remove("pdbx_chem_comp_descriptor")
+            myReader.write(pdbxFilePath=pathList[1])
+            os.remove(pathList[2])
+            newPath = os.path.join(syncDir, "NEW.cif")
+            shutil.copyfile(self.__pathList[2], newPath)
+            syncPathList = [*pathList[:2], *pathList[3:], newPath, self.__missingPath]
+            countD = dUtil.syncStoreFromPathList(pathList=syncPathList, storePath=storePath, numProc=2)
+            self.assertEqual(
+                countD, {"added": 1, "changed": 1, "removed": 1, "unchanged": len(pathList) - 2, "failed": 1}
+            )
+            self.assertEqual(dUtil.getFailedPathList(), [(self.__missingPath, "read failed")])
+            countD = dUtil.syncStoreFromPathList(pathList=syncPathList[:-1], storePath=storePath)
+            self.assertEqual(countD["unchanged"], len(pathList))
+            self.assertEqual(countD["added"] + countD["changed"] + countD["removed"], 0)
+            #
+            # The synchronized store matches a store built from the current files --
+            refStorePath = os.path.join(self.__outDir, "chemcomp-util-sync-ref.db")
+            self.assertTrue(dUtil.makeStoreFromPathList(pathList=syncPathList[:-1], storePath=refStorePath))
+            # (a replaced container keeps its position in the synchronized store)
+            self.assertEqual(
+                sorted(self.__getStoreContent(storePath), key=lambda t: t[:2]),
+                sorted(self.__getStoreContent(refStorePath), key=lambda t: t[:2]),
+            )
+            #
+            # A file update supersedes the container of a file in the manifest, which is read again --
+            extraPath = os.path.join(syncDir, "EXTRA.cif")
+            shutil.copyfile(pathList[3], extraPath)
+            self.assertTrue(dUtil.updateStoreByFile(pathList=[extraPath], storePath=storePath))
+            countD = dUtil.syncStoreFromPathList(pathList=syncPathList[:-1], storePath=storePath)
+            self.assertEqual(countD["changed"], 1)
+            self.assertEqual(countD["removed"], 1)
+            self.assertEqual(
+                sorted(self.__getStoreContent(storePath), key=lambda t: t[:2]),
+                sorted(self.__getStoreContent(refStorePath), key=lambda t: t[:2]),
+            )
+            self.assertTrue(dUtil.makeStoreFromPathList(pathList=syncPathList[:-1], storePath=storePath))
+            self.assertEqual(dUtil.getContainerCount(), len(pathList))
+            #
+            # A listed file which cannot be read is dropped from the store as in a full build --
+            os.rename(pathList[0], pathList[0] + "-hidden")
+            countD = dUtil.syncStoreFromPathList(pathList=syncPathList[:-1], storePath=storePath)
+            self.assertEqual(
+                countD, {"added": 0, "changed": 0, "removed": 1, "unchanged": len(pathList) - 1, "failed": 1}
+            )
+            self.assertEqual(dUtil.getContainerCount(), len(pathList) - 1)
+            self.assertTrue(dUtil.makeStoreFromPathList(pathList=syncPathList[1:-1], storePath=refStorePath))
+            self.assertEqual(
+                sorted(self.__getStoreContent(storePath), key=lambda t: t[:2]),
+                sorted(self.__getStoreContent(refStorePath), key=lambda t: t[:2]),
+            )
+            os.rename(pathList[0] + "-hidden", pathList[0])
+            self.assertTrue(
+                dUtil.makeStoreFromPathList(pathList=syncPathList[:-1], storePath=storePath, incremental=True)
+            )
+            self.assertEqual(dUtil.getContainerCount(), len(pathList))
+            self.assertTrue(dUtil.makeStoreFromPathList(pathList=syncPathList[:-1], storePath=refStorePath))
+            self.assertEqual(
+                sorted(self.__getStoreContent(storePath), key=lambda t: t[:2]),
+                sorted(self.__getStoreContent(refStorePath), key=lambda t: t[:2]),
+            )
+            #
+            # Updates which are not made from files invalidate the manifest --
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            myReader.read(pdbxFilePath=pathList[0])
+            dUtil.updateStoreByContainer(myReader.getContainerList(), storePath=storePath)
+            self.assertFalse(os.path.exists(dUtil.getManifestPath(storePath)))
+            countD = dUtil.syncStoreFromPathList(pathList=syncPathList[:-1], storePath=storePath)
+            self.assertEqual(countD["added"], len(pathList))
+            #
+            # Removal of every file in the store --
+            countD = dUtil.syncStoreFromPathList(pathList=[], storePath=storePath)
+            self.assertEqual(countD["removed"], len(pathList))
+            self.assertEqual(self.__getStoreContent(storePath), [])
+        except:  # noqa: E722 pylint: disable=bare-except
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+
 def suiteChemCompBuildStore():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(PdbxChemCompDictUtilTests("testCreateStorePathListFS"))
@@ -241,6 +569,15 @@ def suiteChemCompBuildStore():
     return suiteSelect
 
 
+def suiteChemCompLocalStore():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(PdbxChemCompDictUtilLocalTests("testCreateStorePathListMulti"))
+    suiteSelect.addTest(PdbxChemCompDictUtilLocalTests("testUpdateStorePathListBatch"))
+    suiteSelect.addTest(PdbxChemCompDictUtilLocalTests("testCreateStoreStreaming"))
+    suiteSelect.addTest(PdbxChemCompDictUtilLocalTests("testSyncStorePathList"))
+    return suiteSelect
+
+
 def suiteChemCompUpdateStore():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(PdbxChemCompDictUtilTests("testUpdateStorePathList"))
@@ -0,0 +1,127 @@
+##
+#
+# File:    PdbxChemCompInChIKeyIndexTests.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Test cases for the reverse InChIKey and InChIKey14 component index.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import copy
+import glob
+import inspect
+import os
+import platform
+import sys
+import time
+import traceback
+import unittest
+
+from mmcif_utils.persist.PdbxCoreIoAdapter import PdbxCoreIoAdapter as PdbxIoAdapter
+from mmcif_utils.persist.PdbxPersist import PdbxPersist
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompDictIndex import PdbxChemCompDictIndex
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompInChIKeyIndex import (
+    PdbxChemCompInChIKeyIndex,
+)
+
+
+class PdbxChemCompInChIKeyIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stdout
+        self.__verbose = True
+        here = os.path.abspath(os.path.dirname(__file__))
+        outdir = os.path.join(here, "test-output", platform.python_version())
+        if not os.path.exists(outdir):  # pragma: no cover
+            os.makedirs(outdir)
+        self.__persistStorePath = os.path.join(outdir, "chemcomp.db")
+        self.__indexPath = os.path.join(outdir, "chemcomp-index.pic")
+        self.__keyIndexPath = os.path.join(outdir, "chemcomp-inchikey-index.pic")
+        if not glob.glob(self.__persistStorePath + "*"):  # pragma: no cover
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            for pth in sorted(glob.glob(os.path.join(here, "data", "ligand-dict-v3", "*.cif"))):
+                myReader.read(pdbxFilePath=pth)
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.setContainerList(myReader.getContainerList())
+            myPersist.store(dbFileName=self.__persistStorePath)
+
+    def tearDown(self):
+        pass
+
+    def testInChIKeyLookup(self):
+        """Test case -  build the reverse InChIKey index and look up batches of keys"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            dIndx = PdbxChemCompDictIndex(verbose=self.__verbose, log=self.__lfh)
+            ccIdx = dIndx.makeIndex(storePath=self.__persistStorePath, indexPath=self.__indexPath)
+            kIndx = PdbxChemCompInChIKeyIndex(verbose=self.__verbose, log=self.__lfh)
+            keyD = kIndx.makeIndex(ccIdx, indexPath=self.__keyIndexPath)
+            self.assertEqual(kIndx.readIndex(indexPath=self.__keyIndexPath), keyD)
+            self.assertEqual(kIndx.readIndex(indexPath=self.__keyIndexPath + "-missing"), {})
+
+            keyList = [d["InChIKey"] for d in ccIdx.values() if d["InChIKey"]]
+            self.assertGreater(len(keyList), 0)
+            retD = kIndx.lookup(keyD, keyList + ["NOT-A-KEY"])
+            for ccId, d in ccIdx.items():
+                if d["InChIKey"]:
+                    self.assertIn(ccId, retD[d["InChIKey"]])
+            self.assertEqual(retD["NOT-A-KEY"], [])
+            atpKey = ccIdx["ATP"]["InChIKey"]
+            retD = kIndx.lookup(keyD, ["InChIKey=" + atpKey, atpKey[:14]])
+            self.assertEqual(retD["InChIKey=" + atpKey], ["ATP"])
+            self.assertEqual(retD[atpKey[:14]], ["ATP"])
+            self.assertEqual(kIndx.lookup(keyD, [atpKey], keyType="InChIKey14"), {atpKey: []})
+            self.assertEqual(kIndx.getDuplicateGroups(keyD), {})
+
+            # A stereo variant sharing the connectivity layer of ATP --
+            dupIdx = copy.deepcopy(ccIdx)
+            dupIdx["ATP-X"] = copy.deepcopy(ccIdx["ATP"])
+            dupIdx["ATP-X"]["ccId"] = "ATP-X"
+            dupIdx["ATP-X"]["InChIKey"] = atpKey[:14] + "-XXXXXXXXSA-N"
+            keyD = kIndx.makeIndex(dupIdx, indexPath=self.__keyIndexPath)
+            self.assertEqual(kIndx.getDuplicateGroups(keyD), {atpKey[:14]: ["ATP", "ATP-X"]})
+            self.assertEqual(kIndx.getDuplicateGroups(keyD, keyType="InChIKey"), {})
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+
+def suiteInChIKeyIndex():  # pragma: no cover
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(PdbxChemCompInChIKeyIndexTests("testInChIKeyLookup"))
+    return suiteSelect
+
+
+if __name__ == "__main__":  # pragma: no cover
+    mySuite = suiteInChIKeyIndex()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
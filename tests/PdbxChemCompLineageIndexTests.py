@@ -0,0 +1,166 @@
+##
+#
+# File:    PdbxChemCompLineageIndexTests.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Test cases for the component lineage closure index.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import copy
+import glob
+import inspect
+import os
+import platform
+import sys
+import time
+import traceback
+import unittest
+
+from mmcif_utils.persist.PdbxCoreIoAdapter import PdbxCoreIoAdapter as PdbxIoAdapter
+from mmcif_utils.persist.PdbxPersist import PdbxPersist
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompDictIndex import PdbxChemCompDictIndex
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompDictIndexers import (
+    PdbxChemCompLineageIndexer,
+)
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompLineageIndex import (
+    PdbxChemCompLineageIndex,
+)
+
+
+class PdbxChemCompLineageIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stdout
+        self.__verbose = True
+        here = os.path.abspath(os.path.dirname(__file__))
+        outdir = os.path.join(here, "test-output", platform.python_version())
+        if not os.path.exists(outdir):  # pragma: no cover
+            os.makedirs(outdir)
+        self.__persistStorePath = os.path.join(outdir, "chemcomp.db")
+        self.__indexPath = os.path.join(outdir, "chemcomp-index.pic")
+        self.__parentIndexPath = os.path.join(outdir, "chemcomp-parent-index.pic")
+        self.__lineageIndexPath = os.path.join(outdir, "chemcomp-lineage-index")
+        if not glob.glob(self.__persistStorePath + "*"):  # pragma: no cover
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            for pth in sorted(glob.glob(os.path.join(here, "data", "ligand-dict-v3", "*.cif"))):
+                myReader.read(pdbxFilePath=pth)
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.setContainerList(myReader.getContainerList())
+            myPersist.store(dbFileName=self.__persistStorePath)
+
+    def tearDown(self):
+        pass
+
+    def testLineageQuery(self):
+        """Test case -  build the lineage closure of parent and subcomponent links and run batch queries"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            # Multi-parent, long identifier and subcomponent links --
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.open(dbFileName=self.__persistStorePath)
+            dC = myPersist.fetchObject(containerName="ATP", objectName="chem_comp")
+            myPersist.close()
+            indexer = PdbxChemCompLineageIndexer(self.__verbose, self.__lfh)
+            for ccId, parentId, subCompList in [
+                ("MSE", "MET", "?"),
+                ("XYZ", "MSE,ALA", "?"),
+                ("A1AAA", "XYZ", "?"),
+                ("PEP", "?", "ALA GLY A1AAA"),
+                ("CY1", "CY2", "?"),
+                ("CY2", "CY1", "?"),
+                ("ATP", "?", "?"),
+            ]:
+                tC = copy.deepcopy(dC)
+                tC.setValue(ccId, "id", 0)
+                tC.setValue(parentId, "mon_nstd_parent_comp_id", 0)
+                tC.setValue(subCompList, "pdbx_subcomponent_list", 0)
+                indexer.add(ccId, {"chem_comp": tC})
+            linkD = indexer.getIndex()
+            self.assertEqual(linkD["XYZ"], ["MSE", "ALA"])
+            self.assertEqual(linkD["PEP"], ["ALA", "GLY", "A1AAA"])
+            self.assertNotIn("ATP", linkD)
+
+            lIndx = PdbxChemCompLineageIndex(verbose=self.__verbose, log=self.__lfh)
+            self.assertEqual(lIndx.makeIndex(linkD, indexPath=self.__lineageIndexPath), 9)
+            indexD = lIndx.readIndex(indexPath=self.__lineageIndexPath)
+            self.assertEqual(lIndx.readIndex(indexPath=self.__lineageIndexPath + "-missing"), {})
+            retD = lIndx.getLineage(indexD, ["A1AAA", "MET", "CY1", "ATP"])
+            self.assertEqual(retD["A1AAA"]["parent"], ["XYZ"])
+            self.assertEqual(retD["A1AAA"]["ancestor"], ["XYZ", "MSE", "ALA", "MET"])
+            self.assertEqual(retD["A1AAA"]["descendant"], ["PEP"])
+            self.assertEqual(retD["MET"]["ancestor"], [])
+            self.assertEqual(retD["MET"]["descendant"], ["A1AAA", "MSE", "PEP", "XYZ"])
+            self.assertEqual(retD["CY1"], {"parent": ["CY2"], "ancestor": ["CY2"], "descendant": ["CY2"]})
+            self.assertEqual(retD["ATP"], {"parent": [], "ancestor": [], "descendant": []})
+            self.assertEqual(
+                lIndx.getRoots(indexD, ["PEP", "MSE", "MET"]), {"PEP": ["ALA", "GLY", "MET"], "MSE": ["MET"], "MET": []}
+            )
+            self.assertEqual(lIndx.getAncestors(indexD, ["MSE"]), {"MSE": ["MET"]})
+            self.assertEqual(lIndx.getDescendants(indexD, ["ALA"]), {"ALA": ["A1AAA", "PEP", "XYZ"]})
+            self.assertRaises(ValueError, lIndx.getRelated, indexD, ["MSE"], "sibling")
+
+            # The closure of the one-level parent index is consistent with the lineage closure --
+            cD = {ccId: pL for ccId, pL in linkD.items() if ccId != "PEP"}
+            lIndx.makeIndex(cD, indexPath=self.__lineageIndexPath)
+            indexD = lIndx.readIndex(indexPath=self.__lineageIndexPath)
+            self.assertEqual(lIndx.getDescendants(indexD, ["ALA"]), {"ALA": ["A1AAA", "XYZ"]})
+
+            # Built in the single pass over the store --
+            dIndx = PdbxChemCompDictIndex(verbose=self.__verbose, log=self.__lfh)
+            retD = dIndx.makeIndices(
+                storePath=self.__persistStorePath,
+                indexPath=self.__indexPath,
+                parentIndexPath=self.__parentIndexPath,
+                lineageIndexPath=self.__lineageIndexPath,
+            )
+            self.assertEqual(retD["lineage"], {})
+            indexD = lIndx.readIndex(indexPath=self.__lineageIndexPath)
+            self.assertEqual(len(indexD["ccId"]), 0)
+            self.assertEqual(
+                lIndx.getLineage(indexD, ["ATP"]), {"ATP": {"parent": [], "ancestor": [], "descendant": []}}
+            )
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+
+def suiteLineageIndex():  # pragma: no cover
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(PdbxChemCompLineageIndexTests("testLineageQuery"))
+    return suiteSelect
+
+
+if __name__ == "__main__":  # pragma: no cover
+    mySuite = suiteLineageIndex()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
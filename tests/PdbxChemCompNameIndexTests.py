@@ -0,0 +1,146 @@
+##
+#
+# File:    PdbxChemCompNameIndexTests.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Test cases for the inverted token and trigram name index.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import glob
+import inspect
+import os
+import platform
+import sys
+import time
+import traceback
+import unittest
+
+from mmcif_utils.persist.PdbxCoreIoAdapter import PdbxCoreIoAdapter as PdbxIoAdapter
+from mmcif_utils.persist.PdbxPersist import PdbxPersist
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompDictIndex import PdbxChemCompDictIndex
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompNameIndex import PdbxChemCompNameIndex
+
+
+class PdbxChemCompNameIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stdout
+        self.__verbose = True
+        here = os.path.abspath(os.path.dirname(__file__))
+        outdir = os.path.join(here, "test-output", platform.python_version())
+        if not os.path.exists(outdir):  # pragma: no cover
+            os.makedirs(outdir)
+        self.__persistStorePath = os.path.join(outdir, "chemcomp.db")
+        self.__indexPath = os.path.join(outdir, "chemcomp-index.pic")
+        self.__nameIndexPath = os.path.join(outdir, "chemcomp-name-index.pic")
+        self.__parentIndexPath = os.path.join(outdir, "chemcomp-name-parent-index.pic")
+        if not glob.glob(self.__persistStorePath + "*"):  # pragma: no cover
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            for pth in sorted(glob.glob(os.path.join(here, "data", "ligand-dict-v3", "*.cif"))):
+                myReader.read(pdbxFilePath=pth)
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.setContainerList(myReader.getContainerList())
+            myPersist.store(dbFileName=self.__persistStorePath)
+
+    def tearDown(self):
+        pass
+
+    def testNameSearch(self):
+        """Test case -  build the inverted name index and run exact, prefix, substring and fuzzy searches"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            dIndx = PdbxChemCompDictIndex(verbose=self.__verbose, log=self.__lfh)
+            ccIdx = dIndx.makeIndex(storePath=self.__persistStorePath, indexPath=self.__indexPath)
+            nIndx = PdbxChemCompNameIndex(verbose=self.__verbose, log=self.__lfh)
+            indexD = nIndx.makeIndex(ccIdx, indexPath=self.__nameIndexPath)
+            self.assertEqual(indexD["ccIdList"], list(ccIdx.keys()))
+            rD = nIndx.readIndex(indexPath=self.__nameIndexPath)
+            self.assertEqual(rD["tokenList"], indexD["tokenList"])
+
+            hitL = nIndx.search(rD, "adenosine-5'-triphosphate", mode="exact")
+            self.assertEqual([t[0] for t in hitL], ["ATP"])
+            self.assertEqual(hitL[0][1], 1.0)
+            # type-ahead -- the shorter matching name ranks first
+            hitL = nIndx.search(rD, "Adenosine 5 tri", mode="prefix")
+            self.assertEqual([t[0] for t in hitL], ["ATP"])
+            hitL = nIndx.search(rD, "adenosine", mode="prefix")
+            self.assertEqual(sorted(t[0] for t in hitL), ["A", "ATP"])
+            self.assertEqual(nIndx.search(rD, "ribose", mode="prefix")[0][:2], ("RIB", 1.0))
+            hitL = nIndx.search(rD, "monophos", mode="substring")
+            self.assertEqual([t[0] for t in hitL], ["A"])
+            hitL = nIndx.search(rD, "adenosin triphosphat", mode="fuzzy")
+            self.assertEqual(hitL[0][0], "ATP")
+            self.assertGreater(hitL[0][1], hitL[-1][1])
+            # mid-token substrings shorter than a trigram --
+            for query in ["in", "os", "5"]:
+                hitS = {t[0] for t in nIndx.search(rD, query, mode="substring", maxHits=len(ccIdx))}
+                expS = {
+                    ccId
+                    for ccId, normL in zip(rD["ccIdList"], rD["nameList"])
+                    if any(query.upper() in normName for normName in normL)
+                }
+                self.assertEqual(hitS, expS)
+            self.assertIn("ATP", {t[0] for t in nIndx.search(rD, "in", mode="substring")})
+            self.assertEqual(nIndx.search(rD, "q", mode="substring"), [])
+            self.assertEqual(nIndx.search(rD, "zzzz", mode="fuzzy"), [])
+            self.assertEqual(nIndx.search(rD, "", mode="prefix"), [])
+            self.assertEqual(len(nIndx.search(rD, "a", mode="prefix", maxHits=1)), 1)
+            with self.assertRaises(ValueError):
+                nIndx.search(rD, "adenosine", mode="regex")
+            # The name index built in the single pass over the store matches --
+            retD = dIndx.makeIndices(
+                storePath=self.__persistStorePath,
+                indexPath=self.__indexPath,
+                parentIndexPath=self.__parentIndexPath,
+                nameIndexPath=self.__nameIndexPath,
+            )
+            self.assertEqual(retD["search"], ccIdx)
+            rD = nIndx.readIndex(indexPath=self.__nameIndexPath)
+            for ky in ["ccIdList", "nameList", "tokenList"]:
+                self.assertEqual(rD[ky], indexD[ky])
+            self.assertEqual(sorted(rD["trigramD"]), sorted(indexD["trigramD"]))
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+
+def suiteNameIndex():  # pragma: no cover
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(PdbxChemCompNameIndexTests("testNameSearch"))
+    return suiteSelect
+
+
+if __name__ == "__main__":  # pragma: no cover
+    mySuite = suiteNameIndex()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -43,7 +43,9 @@ import builtins
 from mmcif.io.IoAdapterCore import IoAdapterCore as PdbxIoAdapter
 from mmcif_utils.persist.PdbxPersist import PdbxPersist
 
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompConstants import PdbxChemCompConstants
 from wwpdb.utils.cc_dict_util.persist.PdbxChemCompPersist import (
+    PdbxAttributeIndex,
     PdbxChemCompAtomIt,
     PdbxChemCompDescriptorIt,
     PdbxChemCompIdentifierIt,
@@ -66,6 +68,7 @@ class PdbxChemCompPersistTests(unittest.TestCase):
         self.__pathList = os.path.join(TESTOUTPUT, "PATHLIST-v3")
         self.__persistStorePath = os.path.join(TESTOUTPUT, "chemcomp.db")
         self.__indexPath = os.path.join(TESTOUTPUT, "chemcomp-index.pic")
+        self.__pathAtpFile = os.path.join(DATAINP, "ATP.cif")
         self.__createFiles(DATAINP, self.__pathChemCompDictFile, self.__pathList)
 
     def __createFiles(self, source, combined, pathlist):
@@ -436,6 +439,298 @@ class PdbxChemCompPersistTests(unittest.TestCase):
             )
         )
 
+    def testChemCompAccessorSchema(self):
+        """Test case -  row accessors share compiled attribute positions and return None for missing attributes"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            cList = myReader.readFile(inputFilePath=self.__pathAtpFile)
+            dC = cList[0].getObj("chem_comp_atom")
+            aL = dC.getAttributeList()
+            self.assertIs(PdbxAttributeIndex.get(aL), PdbxAttributeIndex.get(list(aL)))
+            self.assertEqual(PdbxAttributeIndex.get(aL).index("atom_id"), aL.index("atom_id"))
+            self.assertIsNone(PdbxAttributeIndex.get(aL).index("not_an_attribute"))
+            nAtoms = 0
+            for atom in PdbxChemCompAtomIt(dC, self.__verbose, self.__lfh):
+                self.assertEqual(atom.getName(), dC.getValue("atom_id", nAtoms))
+                self.assertEqual(atom.getType(), dC.getValue("type_symbol", nAtoms))
+                self.assertIsNone(atom._getAttribute("not_an_attribute"))
+                nAtoms += 1
+            self.assertEqual(nAtoms, dC.getRowCount())
+            for row in PdbxChemCompIt(cList[0].getObj("chem_comp"), self.__verbose, self.__lfh):
+                self.assertEqual(row.getId(), "ATP")
+                self.assertIsNone(row.set(None).getName())
+                self.assertIsNone(row.set([]).getName())
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%d seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+    def testChemCompCoordinateArrays(self):
+        """Test case -  bulk coordinate extraction agrees with per-atom accessors"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            cList = myReader.readFile(inputFilePath=self.__pathChemCompDictFile)
+            for container in cList:
+                dC = container.getObj("chem_comp_atom")
+                if dC is None:
+                    continue
+                atomIt = PdbxChemCompAtomIt(dC, self.__verbose, self.__lfh)
+                mXyz, mMissing = atomIt.getModelCoordinateArray()
+                iXyz, iMissing = atomIt.getIdealCoordinateArray()
+                self.assertEqual(mXyz.shape, (dC.getRowCount(), 3))
+                self.assertEqual(iMissing.shape, (dC.getRowCount(),))
+                for ii, atom in enumerate(atomIt):
+                    self.assertEqual(bool(mMissing[ii]), not atom.hasModelCoordinates())
+                    self.assertEqual(bool(iMissing[ii]), not atom.hasIdealCoordinates())
+                    if not mMissing[ii]:
+                        self.assertEqual(tuple(mXyz[ii]), atom.getModelCoordinates())
+                    if not iMissing[ii]:
+                        self.assertEqual(tuple(iXyz[ii]), atom.getIdealCoordinates())
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%d seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+    def testChemCompElementTables(self):
+        """Test case -  element lookup tables and vectorized type symbol encoding agree with per-atom getters"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            pT = PdbxChemCompConstants._periodicTable
+            for ii, sym in enumerate(pT):
+                self.assertEqual(PdbxChemCompConstants._atomicNumberD[sym], ii + 1)
+                self.assertIn(sym, PdbxChemCompConstants._averageMassD)
+                self.assertIn(sym, PdbxChemCompConstants._monoisotopicMassD)
+            self.assertAlmostEqual(PdbxChemCompConstants._monoisotopicMassD["C"], 12.0)
+            atNoA, isoA = PdbxChemCompConstants.encodeTypeSymbols(["C", "d", "T", "Cl", "XX"])
+            self.assertEqual(atNoA.tolist(), [6, 1, 1, 17, 0])
+            self.assertEqual(isoA.tolist(), [0, 2, 3, 0, 0])
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            cList = myReader.readFile(inputFilePath=self.__pathChemCompDictFile)
+            for container in cList:
+                dC = container.getObj("chem_comp_atom")
+                if dC is None:
+                    continue
+                atomIt = PdbxChemCompAtomIt(dC, self.__verbose, self.__lfh)
+                atNoA, isoA = PdbxChemCompConstants.encodeTypeSymbols(atomIt.getColumn("type_symbol"))
+                for ii, atom in enumerate(atomIt):
+                    self.assertEqual(atNoA[ii], atom.getAtNo())
+                    self.assertEqual(isoA[ii], atom.getIsotope())
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%d seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+    def testChemCompRowFilter(self):
+        """Test case -  row filters and projections are applied to raw rows before accessors are bound"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            cList = myReader.readFile(inputFilePath=self.__pathChemCompDictFile)
+            for container in cList:
+                dC = container.getObj("pdbx_chem_comp_descriptor")
+                if dC is None:
+                    continue
+                allL = [(r.getType(), r.getProgram(), r.getDescriptor()) for r in PdbxChemCompDescriptorIt(dC)]
+                # equality and projection to accessors on the projected schema
+                smiL = [
+                    (r.getType(), r.getDescriptor(), r.getProgram())
+                    for r in PdbxChemCompDescriptorIt(
+                        dC, rowFilter=[("type", "eq", "SMILES")], selectList=["type", "descriptor"]
+                    )
+                ]
+                self.assertEqual(smiL, [(t, d, None) for t, _, d in allL if t == "SMILES"])
+                # membership and prefix returning tuples
+                tupL = list(
+                    PdbxChemCompDescriptorIt(
+                        dC,
+                        rowFilter=[("type", "in", ["InChI", "InChIKey"]), ("program", "prefix", "InChI")],
+                        selectList=["descriptor", "not_an_attribute"],
+                        asTuple=True,
+                    )
+                )
+                self.assertEqual(
+                    tupL, [(d, None) for t, p, d in allL if t in ("InChI", "InChIKey") and p.startswith("InChI")]
+                )
+                self.assertEqual(list(PdbxChemCompDescriptorIt(dC, rowFilter=[("not_an_attribute", "eq", "X")])), [])
+                self.assertEqual(len(list(PdbxChemCompDescriptorIt(dC, asTuple=True))), len(allL))
+            with self.assertRaises(ValueError):
+                PdbxChemCompDescriptorIt(dC, rowFilter=[("type", "gt", "SMILES")])
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%d seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+    def testChemCompFrozenRows(self):
+        """Test case -  frozen row accessors may be retained across iterations and materialized"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            cList = myReader.readFile(inputFilePath=self.__pathChemCompDictFile)
+            for container in cList:
+                dC = container.getObj("pdbx_chem_comp_descriptor")
+                if dC is None:
+                    continue
+                rowL = dC.getRowList()
+                keptL = list(PdbxChemCompDescriptorIt(dC, frozen=True))
+                self.assertEqual(len(keptL), len(rowL))
+                for row, dA in zip(rowL, keptL):
+                    self.assertTrue(dA.isFrozen())
+                    self.assertEqual(dA.getDescriptor(), row[dC.getAttributeList().index("descriptor")])
+                with self.assertRaises(AttributeError):
+                    keptL[0].set(rowL[-1])
+                matL = PdbxChemCompDescriptorIt(dC).materialize()
+                self.assertEqual([d.getDescriptor() for d in matL], [d.getDescriptor() for d in keptL])
+                # the default shared accessor is rebound on each row
+                sharedL = list(PdbxChemCompDescriptorIt(dC))
+                self.assertTrue(all(d is sharedL[0] for d in sharedL))
+                self.assertFalse(sharedL[0].isFrozen())
+                tupL = PdbxChemCompDescriptorIt(dC, selectList=["type"], asTuple=True).materialize()
+                self.assertEqual(tupL, [(d.getType(),) for d in keptL])
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%d seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+    def testChemCompSliceChunks(self):
+        """Test case -  random access, slicing, chunked and windowed iteration over category rows"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            aC = myReader.readFile(inputFilePath=self.__pathAtpFile)[0].getObj("chem_comp_atom")
+            atomIt = PdbxChemCompAtomIt(aC, self.__verbose, self.__lfh)
+            nameL = [atom.getName() for atom in atomIt]
+            self.assertEqual(len(atomIt), len(nameL))
+            self.assertEqual(atomIt[0].getName(), nameL[0])
+            self.assertEqual(atomIt[-1].getName(), nameL[-1])
+            with self.assertRaises(IndexError):
+                _ = atomIt[len(nameL)]
+            subIt = atomIt[5:20:2]
+            self.assertEqual(len(subIt), len(nameL[5:20:2]))
+            self.assertEqual([atom.getName() for atom in subIt], nameL[5:20:2])
+            self.assertEqual([atom.getName() for atom in subIt.reverse()], nameL[5:20:2][::-1])
+            chunkL = list(atomIt.chunks(10))
+            self.assertEqual([len(c) for c in chunkL], [min(10, len(nameL) - ii) for ii in range(0, len(nameL), 10)])
+            self.assertEqual([atom.getName() for c in chunkL for atom in c], nameL)
+            self.assertEqual(chunkL[1].getModelCoordinateArray()[0].shape, (10, 3))
+            self.assertEqual([atom.getName() for atom in atomIt.window(3, 30, 4)], nameL[3:30:4])
+            self.assertEqual([atom.getName() for atom in atomIt.window(40)], nameL[40:])
+            with self.assertRaises(ValueError):
+                next(atomIt.chunks(0))
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%d seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
     def testChemCompCompareDescriptors(self):
         """Test case -  read component dictionary index and compare all descriptors."""
         if not os.path.exists(self.__persistStorePath):  # pragma: no cover
@@ -458,7 +753,7 @@ class PdbxChemCompPersistTests(unittest.TestCase):
                 dC = myPersist.fetchObject(containerName=ccId, objectName="pdbx_chem_comp_descriptor")
                 if dC is None:
                     continue
-                dIt = PdbxChemCompDescriptorIt(dC, self.__verbose, self.__lfh)
+                dIt = PdbxChemCompDescriptorIt(dC, self.__verbose, self.__lfh, frozen=True)
                 for dA in dIt:
                     desA = dA.getDescriptor()
                     desTypeA = dA.getType()
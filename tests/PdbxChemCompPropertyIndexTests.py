@@ -0,0 +1,129 @@
+##
+#
+# File:    PdbxChemCompPropertyIndexTests.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Test cases for the sorted formula weight and heavy atom count property index.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import copy
+import glob
+import inspect
+import os
+import platform
+import sys
+import time
+import traceback
+import unittest
+
+from mmcif_utils.persist.PdbxCoreIoAdapter import PdbxCoreIoAdapter as PdbxIoAdapter
+from mmcif_utils.persist.PdbxPersist import PdbxPersist
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompDictIndex import PdbxChemCompDictIndex
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompPropertyIndex import (
+    PdbxChemCompPropertyIndex,
+)
+
+
+class PdbxChemCompPropertyIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stdout
+        self.__verbose = True
+        here = os.path.abspath(os.path.dirname(__file__))
+        outdir = os.path.join(here, "test-output", platform.python_version())
+        if not os.path.exists(outdir):  # pragma: no cover
+            os.makedirs(outdir)
+        self.__persistStorePath = os.path.join(outdir, "chemcomp.db")
+        self.__indexPath = os.path.join(outdir, "chemcomp-index.pic")
+        self.__propIndexPath = os.path.join(outdir, "chemcomp-property-index")
+        if not glob.glob(self.__persistStorePath + "*"):  # pragma: no cover
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            for pth in sorted(glob.glob(os.path.join(here, "data", "ligand-dict-v3", "*.cif"))):
+                myReader.read(pdbxFilePath=pth)
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.setContainerList(myReader.getContainerList())
+            myPersist.store(dbFileName=self.__persistStorePath)
+
+    def tearDown(self):
+        pass
+
+    def testPropertyQuery(self):
+        """Test case -  build the sorted property arrays and compare range, nearest and top-k queries with a scan"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            dIndx = PdbxChemCompDictIndex(verbose=self.__verbose, log=self.__lfh)
+            ccIdx = dIndx.makeIndex(storePath=self.__persistStorePath, indexPath=self.__indexPath)
+            pIndx = PdbxChemCompPropertyIndex(verbose=self.__verbose, log=self.__lfh)
+            self.assertEqual(pIndx.makeIndex(ccIdx, indexPath=self.__propIndexPath), len(ccIdx))
+            indexD = pIndx.readIndex(indexPath=self.__propIndexPath)
+            self.assertEqual(pIndx.readIndex(indexPath=self.__propIndexPath + "-missing"), {})
+
+            # Compare the binary search queries with a scan over the index --
+            fwD = {ccId: float(d["formulaWeight"]) for ccId, d in ccIdx.items()}
+            haD = {ccId: sum(c for t, c in d["typeCounts"].items() if t != "H") for ccId, d in ccIdx.items()}
+            self.assertEqual(pIndx.rangeQuery(indexD, "formulaWeight"), sorted(fwD.items(), key=lambda t: t[1]))
+            self.assertEqual(pIndx.massWindow(indexD, 507.0, tolerance=0.5), [("ATP", fwD["ATP"])])
+            self.assertEqual(pIndx.massWindow(indexD, 1000.0), [])
+            expL = sorted([(ccId, float(v)) for ccId, v in haD.items() if 15 <= v <= 30], key=lambda t: t[1])
+            self.assertEqual(pIndx.rangeQuery(indexD, "heavyAtomCount", 15, 30), expL)
+            self.assertEqual(pIndx.rangeQuery(indexD, "heavyAtomCount", 30, 15), [])
+            expL = sorted(fwD.items(), key=lambda t: abs(t[1] - 350.0))[:3]
+            self.assertEqual(pIndx.nearest(indexD, "formulaWeight", 350.0, k=3), expL)
+            self.assertEqual(len(pIndx.nearest(indexD, "formulaWeight", 0.0, k=100)), len(ccIdx))
+            expL = sorted([(ccId, float(v)) for ccId, v in haD.items()], key=lambda t: -t[1])[:2]
+            self.assertEqual(pIndx.topK(indexD, "heavyAtomCount", k=2), expL)
+            self.assertEqual(pIndx.topK(indexD, "formulaWeight", k=1, largest=False), [("RIB", fwD["RIB"])])
+            self.assertRaises(ValueError, pIndx.topK, indexD, "charge")
+
+            # Components with missing weights are omitted --
+            missIdx = copy.deepcopy(ccIdx)
+            missIdx["ATP"]["formulaWeight"] = "?"
+            pIndx.makeIndex(missIdx, indexPath=self.__propIndexPath)
+            indexD = pIndx.readIndex(indexPath=self.__propIndexPath)
+            self.assertEqual(len(indexD["formulaWeight"]), len(ccIdx) - 1)
+            self.assertEqual(len(indexD["heavyAtomCount"]), len(ccIdx))
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+
+def suitePropertyIndex():  # pragma: no cover
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(PdbxChemCompPropertyIndexTests("testPropertyQuery"))
+    return suiteSelect
+
+
+if __name__ == "__main__":  # pragma: no cover
+    mySuite = suitePropertyIndex()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,120 @@
+##
+#
+# File:    PdbxChemCompProxyTests.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Test cases for the lazy chemical component proxy over a persistent store.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import glob
+import inspect
+import os
+import platform
+import sys
+import time
+import traceback
+import unittest
+
+from mmcif_utils.persist.PdbxCoreIoAdapter import PdbxCoreIoAdapter as PdbxIoAdapter
+from mmcif_utils.persist.PdbxPersist import PdbxPersist
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompProxy import PdbxChemCompProxy
+
+
+class PdbxChemCompProxyTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stdout
+        self.__verbose = True
+        here = os.path.abspath(os.path.dirname(__file__))
+        outdir = os.path.join(here, "test-output", platform.python_version())
+        if not os.path.exists(outdir):  # pragma: no cover
+            os.makedirs(outdir)
+        self.__persistStorePath = os.path.join(outdir, "chemcomp.db")
+        if not glob.glob(self.__persistStorePath + "*"):  # pragma: no cover
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            for pth in sorted(glob.glob(os.path.join(here, "data", "ligand-dict-v3", "*.cif"))):
+                myReader.read(pdbxFilePath=pth)
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.setContainerList(myReader.getContainerList())
+            myPersist.store(dbFileName=self.__persistStorePath)
+
+    def tearDown(self):
+        pass
+
+    def testLazyProxy(self):
+        """Test case -  fetch component categories on demand through the proxy"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.open(dbFileName=self.__persistStorePath)
+            for ccId in myPersist.getStoreContainerIndex():
+                cc = PdbxChemCompProxy(ccId, myPersist, self.__verbose, self.__lfh)
+                self.assertFalse(cc.isLoaded("chem_comp_atom"))
+                atomIt = cc.getAtoms()
+                self.assertTrue(cc.isLoaded("chem_comp_atom"))
+                self.assertFalse(cc.isLoaded("chem_comp_bond"))
+                self.assertIs(atomIt, cc.getAtoms())
+                dC = myPersist.fetchObject(containerName=ccId, objectName="chem_comp_atom")
+                self.assertEqual(len(atomIt), dC.getRowCount())
+                self.assertEqual(next(iter(cc.getChemComp())).getId(), ccId)
+                smilesIt = cc.getDescriptors(rowFilter=[("type", "eq", "SMILES")])
+                smilesL = [des.getDescriptor() for des in smilesIt] if smilesIt is not None else []
+                desIt = cc.getDescriptors()
+                if desIt is not None:
+                    typeL = desIt.getColumn("type")
+                    self.assertEqual(
+                        smilesL, [d for t, d in zip(typeL, desIt.getColumn("descriptor")) if t == "SMILES"]
+                    )
+                self.assertIsNone(cc.getCategory("not_a_category"))
+                cc.invalidate("chem_comp_atom")
+                self.assertFalse(cc.isLoaded("chem_comp_atom"))
+                self.assertTrue(cc.isLoaded("chem_comp"))
+                self.assertIsNot(atomIt, cc.getAtoms())
+                cc.invalidate()
+                self.assertFalse(cc.isLoaded("chem_comp"))
+            myPersist.close()
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+
+def suiteChemCompProxy():  # pragma: no cover
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(PdbxChemCompProxyTests("testLazyProxy"))
+    return suiteSelect
+
+
+if __name__ == "__main__":  # pragma: no cover
+    mySuite = suiteChemCompProxy()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
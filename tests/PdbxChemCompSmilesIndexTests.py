@@ -0,0 +1,126 @@
+##
+#
+# File:    PdbxChemCompSmilesIndexTests.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Test cases for the reverse SMILES component index.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import glob
+import inspect
+import os
+import platform
+import sys
+import time
+import traceback
+import unittest
+
+from mmcif_utils.persist.PdbxCoreIoAdapter import PdbxCoreIoAdapter as PdbxIoAdapter
+from mmcif_utils.persist.PdbxPersist import PdbxPersist
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompDictIndex import PdbxChemCompDictIndex
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompSmilesIndex import (
+    PdbxChemCompSmilesIndex,
+)
+
+
+class PdbxChemCompSmilesIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stdout
+        self.__verbose = True
+        here = os.path.abspath(os.path.dirname(__file__))
+        outdir = os.path.join(here, "test-output", platform.python_version())
+        if not os.path.exists(outdir):  # pragma: no cover
+            os.makedirs(outdir)
+        self.__persistStorePath = os.path.join(outdir, "chemcomp.db")
+        self.__indexPath = os.path.join(outdir, "chemcomp-index.pic")
+        self.__parentIndexPath = os.path.join(outdir, "chemcomp-parent-index.pic")
+        self.__smilesIndexPath = os.path.join(outdir, "chemcomp-smiles-index.pic")
+        if not glob.glob(self.__persistStorePath + "*"):  # pragma: no cover
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            for pth in sorted(glob.glob(os.path.join(here, "data", "ligand-dict-v3", "*.cif"))):
+                myReader.read(pdbxFilePath=pth)
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.setContainerList(myReader.getContainerList())
+            myPersist.store(dbFileName=self.__persistStorePath)
+
+    def tearDown(self):
+        pass
+
+    def testSmilesLookup(self):
+        """Test case -  build the reverse SMILES index with the search index and look up descriptors"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            dIndx = PdbxChemCompDictIndex(verbose=self.__verbose, log=self.__lfh)
+            retD = dIndx.makeIndices(
+                storePath=self.__persistStorePath,
+                indexPath=self.__indexPath,
+                parentIndexPath=self.__parentIndexPath,
+                smilesIndexPath=self.__smilesIndexPath,
+            )
+            ccIdx = retD["search"]
+            sIndx = PdbxChemCompSmilesIndex(verbose=self.__verbose, log=self.__lfh)
+            smilesD = sIndx.readIndex(indexPath=self.__smilesIndexPath)
+            self.assertEqual(smilesD, retD["smiles"])
+            self.assertEqual(sIndx.readIndex(indexPath=self.__smilesIndexPath + "-missing"), {})
+
+            # Every SMILES in the search index finds its component --
+            for ccId, d in ccIdx.items():
+                self.assertGreater(len(d["smilesList"]), 0)
+                retD = sIndx.lookup(smilesD, d["smilesList"])
+                for smiles in d["smilesList"]:
+                    self.assertIn(ccId, retD[smiles])
+            atpSmiles = "c1nc(c2c(n1)n(cn2)[C@H]3[C@@H]([C@@H]([C@H](O3)CO[P@@](=O)(O)O[P@](=O)(O)OP(=O)(O)O)O)O)N"
+            self.assertEqual(sIndx.lookup(smilesD, [" " + atpSmiles + "\n"]), {" " + atpSmiles + "\n": ["ATP"]})
+            self.assertEqual(sIndx.lookup(smilesD, [atpSmiles], program="openeye  oetoolkits")[atpSmiles], ["ATP"])
+            self.assertEqual(sIndx.lookup(smilesD, [atpSmiles], program="CACTVS")[atpSmiles], [])
+            self.assertEqual(sIndx.lookup(smilesD, [atpSmiles], descriptorType="SMILES")[atpSmiles], [])
+            self.assertEqual(sIndx.lookup(smilesD, ["C"]), {"C": []})
+            self.assertEqual(sIndx.getEntries(smilesD, atpSmiles), [("ATP", "SMILES_CANONICAL", "OPENEYE OETOOLKITS")])
+            self.assertEqual(sIndx.lookup(smilesD, [atpSmiles], descriptorType="SMILES_CANONICAL")[atpSmiles], ["ATP"])
+            self.assertEqual(ccIdx["ATP"]["smilesStereo"], atpSmiles)
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+
+def suiteSmilesIndex():  # pragma: no cover
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(PdbxChemCompSmilesIndexTests("testSmilesLookup"))
+    return suiteSelect
+
+
+if __name__ == "__main__":  # pragma: no cover
+    mySuite = suiteSmilesIndex()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
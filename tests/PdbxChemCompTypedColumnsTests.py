@@ -0,0 +1,118 @@
+##
+#
+# File:    PdbxChemCompTypedColumnsTests.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Test cases for typed column extraction driven by the chemical component category definitions.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import inspect
+import math
+import os
+import sys
+import time
+import traceback
+import unittest
+
+import numpy as np
+from mmcif_utils.persist.PdbxCoreIoAdapter import PdbxCoreIoAdapter as PdbxIoAdapter
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompPersist import PdbxChemCompAtomIt
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompTypedColumns import (
+    PdbxChemCompTypedColumns,
+)
+
+
+class PdbxChemCompTypedColumnsTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stdout
+        self.__verbose = True
+        here = os.path.abspath(os.path.dirname(__file__))
+        self.__pathAtpFile = os.path.join(here, "data", "ligand-dict-v3", "ATP.cif")
+
+    def tearDown(self):
+        pass
+
+    def testTypedColumns(self):
+        """Test case -  convert chem_comp and chem_comp_atom columns using the category definitions"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            self.assertEqual(PdbxChemCompTypedColumns.getItemType("chem_comp_atom", "model_Cartn_x"), "float")
+            self.assertEqual(PdbxChemCompTypedColumns.getItemType("chem_comp", "pdbx_formal_charge"), "int")
+            self.assertEqual(PdbxChemCompTypedColumns.getItemType("pdbx_chem_comp_audit", "date"), "str")
+            self.assertEqual(PdbxChemCompTypedColumns.getItemType("chem_comp", "not_an_attribute"), "str")
+
+            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
+            myReader.read(pdbxFilePath=self.__pathAtpFile)
+            container = myReader.getContainerList()[0]
+            tc = PdbxChemCompTypedColumns(self.__verbose, self.__lfh)
+            ccD = tc.convertColumns(container.getObj("chem_comp"), ["formula_weight", "pdbx_formal_charge", "id"])
+            self.assertTrue(math.isclose(ccD["formula_weight"][0], 507.181, abs_tol=1.0e-3))
+            self.assertEqual(int(ccD["pdbx_formal_charge"][0]), 0)
+            self.assertEqual(ccD["id"], ["ATP"])
+
+            aC = container.getObj("chem_comp_atom")
+            xA = tc.getComponentColumn("ATP", aC, "pdbx_model_Cartn_x_ideal")
+            self.assertIs(xA, tc.getComponentColumn("ATP", aC, "pdbx_model_Cartn_x_ideal"))
+            xyz, _ = PdbxChemCompAtomIt(aC).getIdealCoordinateArray()
+            self.assertTrue(np.array_equal(xA, xyz[:, 0], equal_nan=True))
+            chA = tc.getComponentColumn("ATP", aC, "charge")
+            self.assertEqual(chA.dtype, np.int64)
+            self.assertEqual(len(chA), aC.getRowCount())
+            self.assertIsNone(tc.getComponentColumn("ATP", aC, "not_an_attribute"))
+            tc.clearCache("ATP")
+            self.assertIsNot(xA, tc.getComponentColumn("ATP", aC, "pdbx_model_Cartn_x_ideal"))
+
+            # missing and unparsable values
+            aC.setValue("?", "charge", 0)
+            aC.setValue("x", "charge", 1)
+            aC.setValue(".", "pdbx_model_Cartn_x_ideal", 0)
+            chA = tc.convertColumn(aC, "charge")
+            self.assertEqual(chA[0], tc.intMissingValue)
+            self.assertEqual(chA[1], tc.intMissingValue)
+            self.assertTrue(np.isnan(tc.convertColumn(aC, "pdbx_model_Cartn_x_ideal")[0]))
+        except:  # noqa: E722 pylint: disable=bare-except  # pragma: no cover
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+
+def suiteTypedColumns():  # pragma: no cover
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(PdbxChemCompTypedColumnsTests("testTypedColumns"))
+    return suiteSelect
+
+
+if __name__ == "__main__":  # pragma: no cover
+    mySuite = suiteTypedColumns()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,88 @@
+##
+#
+# File:    PdbxChemCompValueConversionTests.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Test cases for the bulk conversion of CIF string values to NumPy numeric arrays.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import inspect
+import math
+import sys
+import time
+import traceback
+import unittest
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompValueConversion import (
+    toFloatArray,
+    toIntArray,
+)
+
+
+class PdbxChemCompValueConversionTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stdout
+
+    def tearDown(self):
+        pass
+
+    def testConvertValues(self):
+        """Test case -  convert float and integer values with missing and malformed entries"""
+        startTime = time.time()
+        self.__lfh.write(
+            "\nStarting %s %s at %s\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+            )
+        )
+        try:
+            fA, missing = toFloatArray(["1.5", "?", "-2", ".", "x"])
+            self.assertEqual(list(missing), [False, True, False, True, True])
+            self.assertEqual(fA[0], 1.5)
+            self.assertEqual(fA[2], -2.0)
+            self.assertTrue(all(math.isnan(fA[ii]) for ii in (1, 3, 4)))
+            iA, missing = toIntArray(["1", "?", "-2", "."], 0)
+            self.assertEqual(list(iA), [1, 0, -2, 0])
+            self.assertEqual(list(missing), [False, True, False, True])
+            iA, missing = toIntArray(["3", "1.5"], -1)
+            self.assertEqual(list(iA), [3, -1])
+            self.assertEqual(list(missing), [False, True])
+        except:  # noqa: E722 pylint: disable=bare-except
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+        endTime = time.time()
+        self.__lfh.write(
+            "\nCompleted %s %s at %s (%.3f seconds)\n"
+            % (
+                self.__class__.__name__,
+                inspect.currentframe().f_back.f_code.co_name,
+                time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
+                endTime - startTime,
+            )
+        )
+
+
+def suiteValueConversion():  # pragma: no cover
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(PdbxChemCompValueConversionTests("testConvertValues"))
+    return suiteSelect
+
+
+if __name__ == "__main__":  # pragma: no cover
+    mySuite = suiteValueConversion()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,195 @@
+##
+# File: PdbxChemCompAtomTable.py
+# Date: 18-Oct-2026
+#
+# Update:
+#  18-Oct-2026     convert formal charges with the shared value conversion helpers
+##
+"""
+Dictionary-wide columnar (struct-of-arrays) table of chemical component atom data
+built from the persistent store.
+
+Each column is stored as a separate NumPy .npy file within the table directory so
+that the table may be memory-mapped on reading.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import shutil
+import sys
+import traceback
+
+import numpy as np
+from mmcif_utils.persist.PdbxPersist import PdbxPersist
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompConstants import PdbxChemCompConstants
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompPersist import PdbxChemCompAtomIt
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompValueConversion import toIntArray
+
+
+class PdbxChemCompAtomTable(PdbxChemCompConstants):
+    """Builds and reads a columnar table of chem_comp_atom data for all components in a persistent store.
+
+    Table columns:
+
+        ccId          (C,)     component identifiers in store order
+        atomOffset    (C+1,)   int64 offsets of each component's atoms within the atom columns
+        atomName      (N,)     atom identifiers
+        elementCode   (N,)     uint8 atomic numbers (0 if unknown)
+        charge        (N,)     int8 formal charges
+        aromaticFlag  packed   bit array of atom aromatic flags
+        stereoFlag    packed   bit array of atom stereo flags
+        leavingFlag   packed   bit array of leaving atom flags
+        modelXyz      (N,3)    float32 model coordinates (NaN if missing)
+        idealXyz      (N,3)    float32 ideal coordinates (NaN if missing)
+    """
+
+    _columnNameList = (
+        "ccId",
+        "atomOffset",
+        "atomName",
+        "elementCode",
+        "charge",
+        "aromaticFlag",
+        "stereoFlag",
+        "leavingFlag",
+        "modelXyz",
+        "idealXyz",
+    )
+    _flagNameList = ("aromaticFlag", "stereoFlag", "leavingFlag")
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        self.__verbose = verbose
+        self.__debug = False
+        self.__lfh = log
+
+    def makeTable(self, storePath="chemcomp.db", tablePath="chemcomp-atom-table"):
+        """Create the columnar atom table from the contents of a persistent store of
+        a chemical dictionary.  Column files are written to the directory tablePath.
+
+        Returns the number of atoms stored or 0 on failure.
+        """
+        return self.__makeTable(storePath=storePath, tablePath=tablePath)
+
+    def readTable(self, tablePath="chemcomp-atom-table", mmapMode="r"):
+        """Read and return the columnar atom table as a dictionary of arrays.
+
+        Columns are memory-mapped unless mmapMode is None.  Flag columns are returned
+        in their packed form (see getFlags()).
+        """
+        return self.__readTable(tablePath=tablePath, mmapMode=mmapMode)
+
+    @staticmethod
+    def getFlags(tableD, flagName):
+        """Return the unpacked boolean array for the input flag column."""
+        nAtoms = int(tableD["atomOffset"][-1])
+        return np.unpackbits(tableD[flagName], count=nAtoms).astype(bool)
+
+    @staticmethod
+    def getComponentSlice(tableD, ccId):
+        """Return the slice of the atom columns for the input component or None."""
+        idxL = np.flatnonzero(tableD["ccId"] == ccId)
+        if len(idxL) == 0:
+            return None
+        ii = int(idxL[0])
+        return slice(int(tableD["atomOffset"][ii]), int(tableD["atomOffset"][ii + 1]))
+
+    @staticmethod
+    def getElementCounts(tableD):
+        """Return a dictionary of dictionary-wide atom counts keyed by atomic number."""
+        cA = np.bincount(tableD["elementCode"], minlength=1)
+        return {ii: int(cnt) for ii, cnt in enumerate(cA) if cnt > 0}
+
+    def __makeTable(self, storePath, tablePath):
+        """Read the serialized component dictionary in a single pass and write the atom table columns."""
+        nAtoms = 0
+        try:
+            ccIdL = []
+            offsetL = [0]
+            colD = {name: [] for name in self._columnNameList[2:]}
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.open(dbFileName=storePath)
+            containerList = myPersist.getStoreContainerIndex()
+            for ccId in containerList:
+                ccIdL.append(ccId)
+                dC = myPersist.fetchObject(containerName=ccId, objectName="chem_comp_atom")
+                if dC is None or dC.getRowCount() == 0:
+                    offsetL.append(nAtoms)
+                    continue
+                atomIt = PdbxChemCompAtomIt(dC, self.__verbose, self.__lfh)
+                sA = atomIt.getColumnArray(
+                    [
+                        "atom_id",
+                        "type_symbol",
+                        "charge",
+                        "pdbx_aromatic_flag",
+                        "pdbx_stereo_config",
+                        "pdbx_leaving_atom_flag",
+                    ]
+                )
+                colD["atomName"].append(sA[:, 0])
+                colD["elementCode"].append(self.encodeTypeSymbols(sA[:, 1])[0])
+                colD["charge"].append(toIntArray(sA[:, 2], 0)[0].astype(np.int8))
+                colD["aromaticFlag"].append(sA[:, 3] != "N")
+                colD["stereoFlag"].append(sA[:, 4] != "N")
+                colD["leavingFlag"].append(sA[:, 5] == "Y")
+                colD["modelXyz"].append(atomIt.getModelCoordinateArray()[0].astype(np.float32))
+                colD["idealXyz"].append(atomIt.getIdealCoordinateArray()[0].astype(np.float32))
+                nAtoms += dC.getRowCount()
+                offsetL.append(nAtoms)
+            myPersist.close()
+
+            outD = {}
+            outD["ccId"] = np.asarray(ccIdL, dtype=str)
+            outD["atomOffset"] = np.asarray(offsetL, dtype=np.int64)
+            outD["atomName"] = np.concatenate(colD["atomName"]) if nAtoms else np.zeros(0, dtype=str)
+            outD["elementCode"] = np.concatenate(colD["elementCode"]) if nAtoms else np.zeros(0, dtype=np.uint8)
+            outD["charge"] = np.concatenate(colD["charge"]) if nAtoms else np.zeros(0, dtype=np.int8)
+            for flagName in self._flagNameList:
+                fA = np.concatenate(colD[flagName]) if nAtoms else np.zeros(0, dtype=bool)
+                outD[flagName] = np.packbits(fA)
+            for name in ("modelXyz", "idealXyz"):
+                outD[name] = np.concatenate(colD[name]) if nAtoms else np.zeros((0, 3), dtype=np.float32)
+            #
+            # Write the columns to a temporary directory and swap it into place --
+            tmpPath = tablePath + "-tmp"
+            if os.path.exists(tmpPath):
+                shutil.rmtree(tmpPath)
+            os.makedirs(tmpPath)
+            for name in self._columnNameList:
+                np.save(os.path.join(tmpPath, name + ".npy"), outD[name], allow_pickle=False)
+            if os.path.exists(tablePath):
+                shutil.rmtree(tablePath)
+            os.rename(tmpPath, tablePath)
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompAtomTable(__makeTable) stored %d atoms for %d components\n" % (nAtoms, len(ccIdL))
+                )
+            return nAtoms
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompAtomTable(__makeTable) table creation failed for %s table %s\n"
+                    % (storePath, tablePath)
+                )
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+        return 0
+
+    def __readTable(self, tablePath, mmapMode):
+        """Internal method to recover the column files of the atom table."""
+        tableD = {}
+        try:
+            for name in self._columnNameList:
+                tableD[name] = np.load(os.path.join(tablePath, name + ".npy"), mmap_mode=mmapMode, allow_pickle=False)
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return {}
+        return tableD
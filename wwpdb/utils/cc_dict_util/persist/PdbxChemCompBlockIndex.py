@@ -0,0 +1,153 @@
+##
+# File: PdbxChemCompBlockIndex.py
+# Date: 18-Oct-2026
+#
+# Update:
+#
+##
+"""
+Byte offset index of the data blocks in a monolithic chemical component dictionary file
+(e.g. Components-all-v3.cif).
+
+The index supports fetching the raw text of a single component definition and splitting
+the file into byte ranges of whole data blocks which may be parsed independently.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import mmap
+import os
+import re
+import sys
+import traceback
+
+try:
+    import cPickle as pickle  # type: ignore[import-not-found]  # noqa: S301,N813,S403
+except ImportError:
+    import pickle  # noqa: S301,S403
+
+# data block headers and the semicolon delimiters of multi-line text fields at the start of a line
+_BLOCK_TOKEN = re.compile(rb"^(?:[dD][aA][tT][aA]_(\S*)|;)", re.MULTILINE)
+
+
+class PdbxChemCompBlockIndex:
+    """Builds, reads and uses the byte offset index of the data blocks in a dictionary file.
+
+    The index is a dictionary:
+
+        {"fileSize": size of the indexed file,
+         "mtime": modification time of the indexed file,
+         "blockList": [(ccId, offset, length), ...] in file order,
+         "blockD": {ccId: (offset, length), ...}}
+
+    Lines starting with data_ inside semicolon delimited text fields do not start a block.
+    If a block name is repeated, blockD refers to the last block with that name.
+    """
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        self.__verbose = verbose
+        self.__debug = False
+        self.__lfh = log
+
+    @staticmethod
+    def scan(dictPath):
+        """Return [(ccId, offset, length), ...] for the data blocks in dictPath in file order."""
+        blockList = []
+        fileSize = os.path.getsize(dictPath)
+        if fileSize == 0:
+            return blockList
+        with open(dictPath, "rb") as ifh, mmap.mmap(ifh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            inText = False
+            lastName = None
+            lastOffset = 0
+            for match in _BLOCK_TOKEN.finditer(mm):
+                if match.group(1) is None:
+                    inText = not inText
+                elif not inText:
+                    if lastName is not None:
+                        blockList.append((lastName, lastOffset, match.start() - lastOffset))
+                    lastName = match.group(1).decode("ascii", errors="replace")
+                    lastOffset = match.start()
+            if lastName is not None:
+                blockList.append((lastName, lastOffset, fileSize - lastOffset))
+        return blockList
+
+    def makeIndex(self, dictPath, indexPath="chemcomp-block-index.pic"):
+        """Scan dictPath and store the data block index in indexPath.  Returns the index or {} on failure."""
+        try:
+            st = os.stat(dictPath)
+            blockList = self.scan(dictPath)
+            indexD = {
+                "fileSize": st.st_size,
+                "mtime": st.st_mtime,
+                "blockList": blockList,
+                "blockD": {ccId: (offset, length) for ccId, offset, length in blockList},
+            }
+            tmpPath = indexPath + "-tmp"
+            with open(tmpPath, "wb") as fout:
+                pickle.dump(indexD, fout, 2)
+            os.replace(tmpPath, indexPath)
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompBlockIndex(makeIndex) indexed %d data blocks in %s\n" % (len(blockList), dictPath)
+                )
+            return indexD
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write("PdbxChemCompBlockIndex(makeIndex) index creation failed for %s\n" % dictPath)
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+        return {}
+
+    def readIndex(self, indexPath="chemcomp-block-index.pic"):
+        """Read and return the data block index or {} on failure."""
+        try:
+            with open(indexPath, "rb") as fin:
+                return pickle.load(fin)  # noqa: S301
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return {}
+
+    @staticmethod
+    def isCurrent(indexD, dictPath):
+        """Return True if the index was built from the current version of dictPath."""
+        try:
+            st = os.stat(dictPath)
+            return indexD["fileSize"] == st.st_size and indexD["mtime"] == st.st_mtime
+        except (OSError, KeyError):
+            return False
+
+    @staticmethod
+    def readRange(dictPath, offset, length):
+        """Return the bytes of dictPath in the range [offset, offset + length)."""
+        with open(dictPath, "rb") as ifh:
+            ifh.seek(offset)
+            return ifh.read(length)
+
+    @classmethod
+    def fetchText(cls, indexD, dictPath, ccId):
+        """Return the raw CIF text of the data block ccId in dictPath or None if ccId is not indexed."""
+        if ccId not in indexD.get("blockD", {}):
+            return None
+        offset, length = indexD["blockD"][ccId]
+        return cls.readRange(dictPath, offset, length).decode("utf-8", errors="replace")
+
+    @staticmethod
+    def getRangeList(indexD, blocksPerRange):
+        """Return a list of (offset, length, blockCount) byte ranges of consecutive whole data blocks
+        with at most blocksPerRange blocks in each range, in file order.
+        """
+        rangeList = []
+        blockList = indexD.get("blockList", [])
+        nBlock = max(1, blocksPerRange)
+        for ii in range(0, len(blockList), nBlock):
+            chunkL = blockList[ii : ii + nBlock]
+            offset = chunkL[0][1]
+            rangeList.append((offset, chunkL[-1][1] + chunkL[-1][2] - offset, len(chunkL)))
+        return rangeList
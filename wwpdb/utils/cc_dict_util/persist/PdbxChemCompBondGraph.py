@@ -0,0 +1,320 @@
+##
+# File: PdbxChemCompBondGraph.py
+# Date: 18-Oct-2026
+#
+# Update:
+#
+##
+"""
+Compressed sparse row (CSR) bond graphs for chemical components, for single components
+and concatenated over all components in a persistent store.
+
+Atom indices are aligned with the row order of the chem_comp_atom category.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import shutil
+import sys
+import traceback
+from typing import ClassVar
+
+import numpy as np
+from mmcif_utils.persist.PdbxPersist import PdbxPersist
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompPersist import (
+    PdbxChemCompAtomIt,
+    PdbxChemCompBondIt,
+)
+
+
+class PdbxChemCompBondGraph:
+    """CSR adjacency of the bonds in a single chemical component.
+
+    The neighbors of atom i are indices[indptr[i]:indptr[i+1]] and the corresponding
+    bonds are edgeBond[indptr[i]:indptr[i+1]].  Per-bond arrays are indexed by the
+    row order of the chem_comp_bond category.
+    """
+
+    _bondOrderD: ClassVar = {"SING": 1, "DOUB": 2, "TRIP": 3, "QUAD": 4}
+
+    def __init__(self, atomCategory=None, bondCategory=None, verbose=True, log=sys.stderr):
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__atomNameList = []
+        self.__indptr = np.zeros(1, dtype=np.int64)
+        self.__indices = np.zeros(0, dtype=np.int32)
+        self.__edgeBond = np.zeros(0, dtype=np.int32)
+        self.__bondAtoms = np.zeros((0, 2), dtype=np.int32)
+        self.__bondOrder = np.zeros(0, dtype=np.int8)
+        self.__bondAromatic = np.zeros(0, dtype=bool)
+        self.__bondStereo = np.zeros(0, dtype=bool)
+        if atomCategory is not None:
+            self.__build(atomCategory, bondCategory)
+
+    @classmethod
+    def fromArrays(cls, atomNameList, indptr, indices, edgeBond, bondAtoms, bondOrder, bondAromatic, bondStereo):
+        """Return a graph instance wrapping precomputed CSR and bond arrays."""
+        gr = cls()
+        gr.__setArrays(atomNameList, indptr, indices, edgeBond, bondAtoms, bondOrder, bondAromatic, bondStereo)
+        return gr
+
+    def getAtomCount(self):
+        return len(self.__indptr) - 1
+
+    def getBondCount(self):
+        return len(self.__bondAtoms)
+
+    def getAtomNameList(self):
+        return self.__atomNameList
+
+    def getIndptr(self):
+        return self.__indptr
+
+    def getIndices(self):
+        return self.__indices
+
+    def getEdgeBond(self):
+        return self.__edgeBond
+
+    def getBondAtoms(self):
+        """Returns the (B,2) array of atom index pairs for each bond."""
+        return self.__bondAtoms
+
+    def getBondOrders(self):
+        """Returns the integer bond orders (1-4, 0 if undefined)."""
+        return self.__bondOrder
+
+    def getBondAromaticFlags(self):
+        return self.__bondAromatic
+
+    def getBondStereoFlags(self):
+        return self.__bondStereo
+
+    def getDegree(self, atomIndex):
+        return int(self.__indptr[atomIndex + 1] - self.__indptr[atomIndex])
+
+    def getNeighbors(self, atomIndex):
+        """Returns the atom indices bonded to the input atom index."""
+        return self.__indices[self.__indptr[atomIndex] : self.__indptr[atomIndex + 1]]
+
+    def getNeighborBonds(self, atomIndex):
+        """Returns the bond indices of the bonds to the input atom index."""
+        return self.__edgeBond[self.__indptr[atomIndex] : self.__indptr[atomIndex + 1]]
+
+    @staticmethod
+    def makeCsr(nAtoms, bondAtoms):
+        """Returns (indptr, indices, edgeBond) for the undirected bonds in the (B,2) array bondAtoms."""
+        nBonds = len(bondAtoms)
+        src = np.concatenate((bondAtoms[:, 0], bondAtoms[:, 1]))
+        dst = np.concatenate((bondAtoms[:, 1], bondAtoms[:, 0]))
+        eid = np.concatenate((np.arange(nBonds, dtype=np.int32), np.arange(nBonds, dtype=np.int32)))
+        order = np.argsort(src, kind="stable")
+        indptr = np.zeros(nAtoms + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=nAtoms), out=indptr[1:])
+        return indptr, dst[order].astype(np.int32), eid[order]
+
+    def __setArrays(self, atomNameList, indptr, indices, edgeBond, bondAtoms, bondOrder, bondAromatic, bondStereo):
+        self.__atomNameList = atomNameList
+        self.__indptr = indptr
+        self.__indices = indices
+        self.__edgeBond = edgeBond
+        self.__bondAtoms = bondAtoms
+        self.__bondOrder = bondOrder
+        self.__bondAromatic = bondAromatic
+        self.__bondStereo = bondStereo
+
+    def __build(self, atomCategory, bondCategory):
+        atomNameList = PdbxChemCompAtomIt(atomCategory, self.__verbose, self.__lfh).getColumn("atom_id") or []
+        nameD = {name: ii for ii, name in enumerate(atomNameList)}
+        pairL = []
+        orderL = []
+        aromaticL = []
+        stereoL = []
+        if bondCategory is not None:
+            for bond in PdbxChemCompBondIt(bondCategory, self.__verbose, self.__lfh):
+                aName1, aName2 = bond.getBond()
+                if aName1 not in nameD or aName2 not in nameD:
+                    if self.__verbose:
+                        self.__lfh.write(
+                            "PdbxChemCompBondGraph(__build) skipping bond with undefined atom %s %s\n"
+                            % (aName1, aName2)
+                        )
+                    continue
+                pairL.append((nameD[aName1], nameD[aName2]))
+                orderL.append(self._bondOrderD.get(bond.getType(), 0))
+                aromaticL.append(bond.isAromatic())
+                stereoL.append(bond.hasStereo())
+        bondAtoms = np.asarray(pairL, dtype=np.int32).reshape(len(pairL), 2)
+        indptr, indices, edgeBond = self.makeCsr(len(atomNameList), bondAtoms)
+        self.__setArrays(
+            atomNameList,
+            indptr,
+            indices,
+            edgeBond,
+            bondAtoms,
+            np.asarray(orderL, dtype=np.int8),
+            np.asarray(aromaticL, dtype=bool),
+            np.asarray(stereoL, dtype=bool),
+        )
+
+
+class PdbxChemCompDictBondGraph:
+    """Builds and reads the concatenated CSR bond graph for all components in a persistent store.
+
+    Graph columns:
+
+        ccId          (C,)     component identifiers in store order
+        atomOffset    (C+1,)   int64 offsets of each component's atoms
+        bondOffset    (C+1,)   int64 offsets of each component's bonds
+        atomName      (N,)     atom identifiers
+        indptr        (N+1,)   int64 CSR row pointers over all atoms
+        indices       (2B,)    int32 global neighbor atom indices
+        edgeBond      (2B,)    int32 global bond index of each adjacency entry
+        bondAtoms     (B,2)    int32 global atom index pairs
+        bondOrder     (B,)     int8 bond orders
+        bondAromatic  (B,)     bool aromatic bond flags
+        bondStereo    (B,)     bool stereo bond flags
+    """
+
+    _columnNameList = (
+        "ccId",
+        "atomOffset",
+        "bondOffset",
+        "atomName",
+        "indptr",
+        "indices",
+        "edgeBond",
+        "bondAtoms",
+        "bondOrder",
+        "bondAromatic",
+        "bondStereo",
+    )
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        self.__verbose = verbose
+        self.__debug = False
+        self.__lfh = log
+
+    def makeGraph(self, storePath="chemcomp.db", graphPath="chemcomp-bond-graph"):
+        """Create the concatenated bond graph from the contents of a persistent store of
+        a chemical dictionary.  Column files are written to the directory graphPath.
+
+        Returns the number of bonds stored or -1 on failure.
+        """
+        return self.__makeGraph(storePath=storePath, graphPath=graphPath)
+
+    def readGraph(self, graphPath="chemcomp-bond-graph", mmapMode="r"):
+        """Read and return the concatenated bond graph as a dictionary of (memory-mapped) arrays."""
+        graphD = {}
+        try:
+            for name in self._columnNameList:
+                graphD[name] = np.load(os.path.join(graphPath, name + ".npy"), mmap_mode=mmapMode, allow_pickle=False)
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return {}
+        return graphD
+
+    @staticmethod
+    def getNeighbors(graphD, atomIndex):
+        """Returns the global atom indices bonded to the input global atom index."""
+        return graphD["indices"][graphD["indptr"][atomIndex] : graphD["indptr"][atomIndex + 1]]
+
+    @staticmethod
+    def getComponentGraph(graphD, ccId):
+        """Return a PdbxChemCompBondGraph for the input component with component-local atom indices, or None."""
+        idxL = np.flatnonzero(graphD["ccId"] == ccId)
+        if len(idxL) == 0:
+            return None
+        ii = int(idxL[0])
+        aB, aE = int(graphD["atomOffset"][ii]), int(graphD["atomOffset"][ii + 1])
+        bB, bE = int(graphD["bondOffset"][ii]), int(graphD["bondOffset"][ii + 1])
+        indptr = np.asarray(graphD["indptr"][aB : aE + 1]) - graphD["indptr"][aB]
+        eB, eE = int(graphD["indptr"][aB]), int(graphD["indptr"][aE])
+        return PdbxChemCompBondGraph.fromArrays(
+            list(graphD["atomName"][aB:aE]),
+            indptr,
+            np.asarray(graphD["indices"][eB:eE]) - aB,
+            np.asarray(graphD["edgeBond"][eB:eE]) - bB,
+            np.asarray(graphD["bondAtoms"][bB:bE]) - aB,
+            np.asarray(graphD["bondOrder"][bB:bE]),
+            np.asarray(graphD["bondAromatic"][bB:bE]),
+            np.asarray(graphD["bondStereo"][bB:bE]),
+        )
+
+    def __makeGraph(self, storePath, graphPath):
+        """Read the serialized component dictionary in a single pass and write the bond graph columns."""
+        try:
+            ccIdL = []
+            atomOffsetL = [0]
+            bondOffsetL = [0]
+            atomNameL = []
+            bondAtomsL = []
+            bondOrderL = []
+            bondAromaticL = []
+            bondStereoL = []
+            nAtoms = 0
+            nBonds = 0
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.open(dbFileName=storePath)
+            containerList = myPersist.getStoreContainerIndex()
+            for ccId in containerList:
+                ccIdL.append(ccId)
+                aC = myPersist.fetchObject(containerName=ccId, objectName="chem_comp_atom")
+                if aC is not None:
+                    bC = myPersist.fetchObject(containerName=ccId, objectName="chem_comp_bond")
+                    gr = PdbxChemCompBondGraph(aC, bC, self.__verbose, self.__lfh)
+                    atomNameL.extend(gr.getAtomNameList())
+                    bondAtomsL.append(gr.getBondAtoms() + nAtoms)
+                    bondOrderL.append(gr.getBondOrders())
+                    bondAromaticL.append(gr.getBondAromaticFlags())
+                    bondStereoL.append(gr.getBondStereoFlags())
+                    nAtoms += gr.getAtomCount()
+                    nBonds += gr.getBondCount()
+                atomOffsetL.append(nAtoms)
+                bondOffsetL.append(nBonds)
+            myPersist.close()
+
+            outD = {}
+            outD["ccId"] = np.asarray(ccIdL, dtype=str)
+            outD["atomOffset"] = np.asarray(atomOffsetL, dtype=np.int64)
+            outD["bondOffset"] = np.asarray(bondOffsetL, dtype=np.int64)
+            outD["atomName"] = np.asarray(atomNameL, dtype=str)
+            outD["bondAtoms"] = np.concatenate(bondAtomsL) if bondAtomsL else np.zeros((0, 2), dtype=np.int32)
+            outD["bondOrder"] = np.concatenate(bondOrderL) if bondOrderL else np.zeros(0, dtype=np.int8)
+            outD["bondAromatic"] = np.concatenate(bondAromaticL) if bondAromaticL else np.zeros(0, dtype=bool)
+            outD["bondStereo"] = np.concatenate(bondStereoL) if bondStereoL else np.zeros(0, dtype=bool)
+            outD["indptr"], outD["indices"], outD["edgeBond"] = PdbxChemCompBondGraph.makeCsr(nAtoms, outD["bondAtoms"])
+            #
+            # Write the columns to a temporary directory and swap it into place --
+            tmpPath = graphPath + "-tmp"
+            if os.path.exists(tmpPath):
+                shutil.rmtree(tmpPath)
+            os.makedirs(tmpPath)
+            for name in self._columnNameList:
+                np.save(os.path.join(tmpPath, name + ".npy"), outD[name], allow_pickle=False)
+            if os.path.exists(graphPath):
+                shutil.rmtree(graphPath)
+            os.rename(tmpPath, graphPath)
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompDictBondGraph(__makeGraph) stored %d bonds %d atoms for %d components\n"
+                    % (nBonds, nAtoms, len(ccIdL))
+                )
+            return nBonds
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompDictBondGraph(__makeGraph) graph creation failed for %s graph %s\n"
+                    % (storePath, graphPath)
+                )
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+        return -1
@@ -3,7 +3,8 @@
 # Date: 21-Feb-2012  John Westbrook
 #
 # Updates:
-#
+#  18-Oct-2026     add float and int item types for numeric items and correct item prefixes
+#                  for the audit and import categories
 ##
 """
 A definitions of data categories used in the chemical component dictionary.
@@ -40,14 +41,14 @@ class PdbxChemCompCategoryDefinitions:
             ("_chem_comp.formula", "%s", "str", ""),
             ("_chem_comp.mon_nstd_parent_comp_id", "%s", "str", ""),
             ("_chem_comp.pdbx_synonyms", "%s", "str", ""),
-            ("_chem_comp.pdbx_formal_charge", "%s", "str", ""),
+            ("_chem_comp.pdbx_formal_charge", "%d", "int", ""),
             ("_chem_comp.pdbx_initial_date", "%s", "str", ""),
             ("_chem_comp.pdbx_modified_date", "%s", "str", ""),
             ("_chem_comp.pdbx_ambiguous_flag", "%s", "str", ""),
             ("_chem_comp.pdbx_release_status", "%s", "str", ""),
             ("_chem_comp.pdbx_replaced_by", "%s", "str", ""),
             ("_chem_comp.pdbx_replaces", "%s", "str", ""),
-            ("_chem_comp.formula_weight", "%s", "str", ""),
+            ("_chem_comp.formula_weight", "%f", "float", ""),
             ("_chem_comp.one_letter_code", "%s", "str", ""),
             ("_chem_comp.three_letter_code", "%s", "str", ""),
             ("_chem_comp.pdbx_model_coordinates_details", "%s", "str", ""),
@@ -63,20 +64,20 @@ class PdbxChemCompCategoryDefinitions:
             ("_chem_comp_atom.atom_id", "%s", "str", ""),
             ("_chem_comp_atom.alt_atom_id", "%s", "str", ""),
             ("_chem_comp_atom.type_symbol", "%s", "str", ""),
-            ("_chem_comp_atom.charge", "%s", "str", ""),
+            ("_chem_comp_atom.charge", "%d", "int", ""),
             ("_chem_comp_atom.pdbx_align", "%s", "str", ""),
             ("_chem_comp_atom.pdbx_aromatic_flag", "%s", "str", ""),
             ("_chem_comp_atom.pdbx_leaving_atom_flag", "%s", "str", ""),
             ("_chem_comp_atom.pdbx_stereo_config", "%s", "str", ""),
-            ("_chem_comp_atom.model_Cartn_x", "%s", "str", ""),
-            ("_chem_comp_atom.model_Cartn_y", "%s", "str", ""),
-            ("_chem_comp_atom.model_Cartn_z", "%s", "str", ""),
-            ("_chem_comp_atom.pdbx_model_Cartn_x_ideal", "%s", "str", ""),
-            ("_chem_comp_atom.pdbx_model_Cartn_y_ideal", "%s", "str", ""),
-            ("_chem_comp_atom.pdbx_model_Cartn_z_ideal", "%s", "str", ""),
+            ("_chem_comp_atom.model_Cartn_x", "%f", "float", ""),
+            ("_chem_comp_atom.model_Cartn_y", "%f", "float", ""),
+            ("_chem_comp_atom.model_Cartn_z", "%f", "float", ""),
+            ("_chem_comp_atom.pdbx_model_Cartn_x_ideal", "%f", "float", ""),
+            ("_chem_comp_atom.pdbx_model_Cartn_y_ideal", "%f", "float", ""),
+            ("_chem_comp_atom.pdbx_model_Cartn_z_ideal", "%f", "float", ""),
             ("_chem_comp_atom.pdbx_component_atom_id", "%s", "str", ""),
             ("_chem_comp_atom.pdbx_component_comp_id", "%s", "str", ""),
-            ("_chem_comp_atom.pdbx_ordinal", "%s", "str", ""),
+            ("_chem_comp_atom.pdbx_ordinal", "%d", "int", ""),
         ],
         "chem_comp_bond": [
             ("_chem_comp_bond.comp_id", "%s", "str", ""),
@@ -85,7 +86,7 @@ class PdbxChemCompCategoryDefinitions:
             ("_chem_comp_bond.value_order", "%s", "str", ""),
             ("_chem_comp_bond.pdbx_aromatic_flag", "%s", "str", ""),
             ("_chem_comp_bond.pdbx_stereo_config", "%s", "str", ""),
-            ("_chem_comp_bond.pdbx_ordinal", "%s", "str", ""),
+            ("_chem_comp_bond.pdbx_ordinal", "%d", "int", ""),
         ],
         "chem_comp_descriptor": [
             ("_pdbx_chem_comp_descriptor.comp_id", "%s", "str", ""),
@@ -102,17 +103,17 @@ class PdbxChemCompCategoryDefinitions:
             ("_pdbx_chem_comp_identifier.identifier", "%s", "str", ""),
         ],
         "pdbx_chem_comp_import": [
-            ("_pdbx_chem_comp_identifier.comp_id", "%s", "str", ""),
-            ("_pdbx_chem_comp_identifier.comp_alias_id", "%s", "str", ""),
-            ("_pdbx_chem_comp_identifier.model_path", "%s", "str", ""),
+            ("_pdbx_chem_comp_import.comp_id", "%s", "str", ""),
+            ("_pdbx_chem_comp_import.comp_alias_id", "%s", "str", ""),
+            ("_pdbx_chem_comp_import.model_path", "%s", "str", ""),
         ],
         "pdbx_chem_comp_audit": [
-            ("_pdbx_chem_comp_identifier.comp_id", "%s", "str", ""),
-            ("_pdbx_chem_comp_identifier.action_type", "%s", "str", ""),
-            ("_pdbx_chem_comp_identifier.date", "%s", "str", ""),
-            ("_pdbx_chem_comp_identifier.processing_site", "%s", "str", ""),
-            ("_pdbx_chem_comp_identifier.annotator", "%s", "str", ""),
-            ("_pdbx_chem_comp_identifier.details", "%s", "str", ""),
+            ("_pdbx_chem_comp_audit.comp_id", "%s", "str", ""),
+            ("_pdbx_chem_comp_audit.action_type", "%s", "str", ""),
+            ("_pdbx_chem_comp_audit.date", "%s", "str", ""),
+            ("_pdbx_chem_comp_audit.processing_site", "%s", "str", ""),
+            ("_pdbx_chem_comp_audit.annotator", "%s", "str", ""),
+            ("_pdbx_chem_comp_audit.details", "%s", "str", ""),
         ],
         "pdbx_chem_comp_atom_edit": [
             ("_pdbx_chem_comp_atom_edit.ordinal", "%d", "int", ""),
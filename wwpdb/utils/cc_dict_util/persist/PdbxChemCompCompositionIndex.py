@@ -0,0 +1,140 @@
+##
+# File: PdbxChemCompCompositionIndex.py
+# Date: 18-Oct-2026
+#
+# Update:
+#  18-Oct-2026     store counts as int32 and report atom types without an element column
+##
+"""
+Element composition matrix (components x elements) built from the search index
+typeCounts with vectorized element range queries.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import numbers
+import os
+import shutil
+import sys
+import traceback
+
+import numpy as np
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompConstants import PdbxChemCompConstants
+
+
+class PdbxChemCompCompositionIndex(PdbxChemCompConstants):
+    """Builds, reads and queries an int32 composition matrix.
+
+    Column j of the matrix holds the count of atoms with atomic number j (column 0 counts
+    atoms of unknown type, which are reported when the index is built).  Deuterium and tritium are counted as hydrogen.  The matrix and
+    the component identifier list are stored as NumPy .npy files in the index directory and
+    are memory-mapped on reading.
+    """
+
+    _columnNameList = ("ccId", "composition")
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        self.__verbose = verbose
+        self.__debug = False
+        self.__lfh = log
+
+    def makeIndex(self, ccIdx, indexPath="chemcomp-composition-index"):
+        """Create the composition matrix from the search index ccIdx and store it in the directory indexPath.
+
+        Returns the number of components indexed or 0 on failure.
+        """
+        try:
+            nElements = len(self._periodicTable) + 1
+            ccIdList = list(ccIdx.keys())
+            compA = np.zeros((len(ccIdList), nElements), dtype=np.int32)
+            unknownD = {}
+            for ii, ccId in enumerate(ccIdList):
+                for aType, cnt in ccIdx[ccId].get("typeCounts", {}).items():
+                    jj = self._atomicNumberD.get(str(aType).upper(), 0)
+                    if jj == 0:
+                        unknownD.setdefault(aType, []).append(ccId)
+                    compA[ii, jj] += cnt
+            if self.__verbose:
+                for aType, uL in unknownD.items():
+                    self.__lfh.write(
+                        "PdbxChemCompCompositionIndex(makeIndex) atom type %r without element column in %d components: %s\n"
+                        % (aType, len(uL), " ".join(uL[:10]))
+                    )
+            tmpPath = indexPath + "-tmp"
+            if os.path.exists(tmpPath):
+                shutil.rmtree(tmpPath)
+            os.makedirs(tmpPath)
+            np.save(os.path.join(tmpPath, "ccId.npy"), np.asarray(ccIdList, dtype=str), allow_pickle=False)
+            np.save(os.path.join(tmpPath, "composition.npy"), compA, allow_pickle=False)
+            if os.path.exists(indexPath):
+                shutil.rmtree(indexPath)
+            os.rename(tmpPath, indexPath)
+            return len(ccIdList)
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write("PdbxChemCompCompositionIndex(makeIndex) index creation failed for %s\n" % indexPath)
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+        return 0
+
+    def readIndex(self, indexPath="chemcomp-composition-index", mmapMode="r"):
+        """Return the composition index as a dictionary of arrays (memory-mapped unless mmapMode is None) or {}."""
+        indexD = {}
+        try:
+            for name in self._columnNameList:
+                indexD[name] = np.load(os.path.join(indexPath, name + ".npy"), mmap_mode=mmapMode, allow_pickle=False)
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return {}
+        return indexD
+
+    @classmethod
+    def getElementColumn(cls, symbol):
+        """Return the matrix column for the input element symbol or None if the symbol is unknown."""
+        return cls._atomicNumberD.get(str(symbol).upper())
+
+    @classmethod
+    def getMask(cls, indexD, rangeD=None, excludeMetals=False):
+        """Return a boolean component mask for the input element count ranges.
+
+        rangeD is a dictionary of (minCount, maxCount) keyed by element symbol, where either
+        bound may be None.  An integer value n (Python or NumPy) is taken as (n, n).  If
+        excludeMetals is set, components containing any metallic element are excluded.
+        """
+        compA = indexD["composition"]
+        mask = np.ones(compA.shape[0], dtype=bool)
+        for symbol, bounds in (rangeD or {}).items():
+            jj = cls.getElementColumn(symbol)
+            if jj is None:
+                raise ValueError("Unknown element symbol %r" % symbol)
+            lo, hi = (bounds, bounds) if isinstance(bounds, numbers.Integral) else bounds
+            col = compA[:, jj]
+            if lo is not None:
+                mask &= col >= lo
+            if hi is not None:
+                mask &= col <= hi
+        if excludeMetals:
+            metalCols = [cls._atomicNumberD[sym] for sym in cls._metalList]
+            mask &= ~np.any(compA[:, metalCols] > 0, axis=1)
+        return mask
+
+    @classmethod
+    def query(cls, indexD, rangeD=None, excludeMetals=False):
+        """Return the list of component identifiers satisfying the input element count ranges (see getMask())."""
+        return [str(ccId) for ccId in indexD["ccId"][cls.getMask(indexD, rangeD, excludeMetals)]]
+
+    @classmethod
+    def getFormulaCounts(cls, indexD, ccId):
+        """Return the element counts of component ccId as a dictionary keyed by element symbol, or None."""
+        idxL = np.flatnonzero(indexD["ccId"] == ccId)
+        if len(idxL) == 0:
+            return None
+        row = indexD["composition"][int(idxL[0])]
+        return {cls._periodicTable[jj - 1] if jj > 0 else "?": int(row[jj]) for jj in np.flatnonzero(row)}
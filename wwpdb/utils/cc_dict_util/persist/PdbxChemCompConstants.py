@@ -5,6 +5,8 @@
 # Update:
 #  21-Feb-2012 jdw add to chemcomputil repository
 #   1-Feb-2017 jdw unified with chem_ref_data
+#  18-Oct-2026     add precomputed element lookup tables and vectorized type symbol encoding
+#  18-Oct-2026     add the list of metallic elements
 #
 ##
 """
@@ -20,8 +22,12 @@ __version__ = "V0.01"
 
 from typing import ClassVar
 
+import numpy as np
+
 
 class PdbxChemCompConstants:
+    __slots__ = ()
+
     _periodicTable: ClassVar = [  # noqa: N815
         "H",
         "HE",
@@ -133,3 +139,261 @@ class PdbxChemCompConstants:
         "UNO",
         "UNE",
     ]
+    #
+    # Lookup tables keyed by upper case type symbol -- deuterium and tritium are mapped to hydrogen.
+    _atomicNumberD: ClassVar = {sym: ii + 1 for ii, sym in enumerate(_periodicTable)}  # noqa: N815
+    _atomicNumberD.update({"D": 1, "T": 1})
+    _isotopeD: ClassVar = {"D": 2, "T": 3}  # noqa: N815
+    #
+    # Metallic elements -- alkali, alkaline earth, transition, post-transition, lanthanide and actinide metals.
+    _metalList: ClassVar = [  # noqa: N815
+        "LI", "BE", "NA", "MG", "AL", "K", "CA", "SC", "TI", "V", "CR", "MN", "FE", "CO", "NI", "CU", "ZN", "GA",
+        "RB", "SR", "Y", "ZR", "NB", "MO", "TC", "RU", "RH", "PD", "AG", "CD", "IN", "SN", "CS", "BA",
+        "LA", "CE", "PR", "ND", "PM", "SM", "EU", "GD", "TB", "DY", "HO", "ER", "TM", "YB", "LU",
+        "HF", "TA", "W", "RE", "OS", "IR", "PT", "AU", "HG", "TL", "PB", "BI", "PO", "FR", "RA",
+        "AC", "TH", "PA", "U", "NP", "PU", "AM", "CM", "BK", "CF", "ES", "FM", "MD", "NO", "LR",
+    ]  # fmt: skip
+    #
+    # Standard atomic weights (or the mass number of the most stable isotope for elements
+    # without a standard atomic weight).
+    _averageMassD: ClassVar = {  # noqa: N815
+        "H": 1.008,
+        "HE": 4.002602,
+        "LI": 6.94,
+        "BE": 9.0121831,
+        "B": 10.81,
+        "C": 12.011,
+        "N": 14.007,
+        "O": 15.999,
+        "F": 18.998403162,
+        "NE": 20.1797,
+        "NA": 22.98976928,
+        "MG": 24.305,
+        "AL": 26.9815384,
+        "SI": 28.085,
+        "P": 30.973761998,
+        "S": 32.06,
+        "CL": 35.45,
+        "AR": 39.95,
+        "K": 39.0983,
+        "CA": 40.078,
+        "SC": 44.955907,
+        "TI": 47.867,
+        "V": 50.9415,
+        "CR": 51.9961,
+        "MN": 54.938043,
+        "FE": 55.845,
+        "CO": 58.933194,
+        "NI": 58.6934,
+        "CU": 63.546,
+        "ZN": 65.38,
+        "GA": 69.723,
+        "GE": 72.63,
+        "AS": 74.921595,
+        "SE": 78.971,
+        "BR": 79.904,
+        "KR": 83.798,
+        "RB": 85.4678,
+        "SR": 87.62,
+        "Y": 88.905838,
+        "ZR": 91.224,
+        "NB": 92.90637,
+        "MO": 95.95,
+        "TC": 98.0,
+        "RU": 101.07,
+        "RH": 102.90549,
+        "PD": 106.42,
+        "AG": 107.8682,
+        "CD": 112.414,
+        "IN": 114.818,
+        "SN": 118.71,
+        "SB": 121.76,
+        "TE": 127.6,
+        "I": 126.90447,
+        "XE": 131.293,
+        "CS": 132.90545196,
+        "BA": 137.327,
+        "LA": 138.90547,
+        "CE": 140.116,
+        "PR": 140.90766,
+        "ND": 144.242,
+        "PM": 145.0,
+        "SM": 150.36,
+        "EU": 151.964,
+        "GD": 157.25,
+        "TB": 158.925354,
+        "DY": 162.5,
+        "HO": 164.930329,
+        "ER": 167.259,
+        "TM": 168.934219,
+        "YB": 173.045,
+        "LU": 174.9668,
+        "HF": 178.486,
+        "TA": 180.94788,
+        "W": 183.84,
+        "RE": 186.207,
+        "OS": 190.23,
+        "IR": 192.217,
+        "PT": 195.084,
+        "AU": 196.96657,
+        "HG": 200.592,
+        "TL": 204.38,
+        "PB": 207.2,
+        "BI": 208.9804,
+        "PO": 209.0,
+        "AT": 210.0,
+        "RN": 222.0,
+        "FR": 223.0,
+        "RA": 226.0,
+        "AC": 227.0,
+        "TH": 232.0377,
+        "PA": 231.03588,
+        "U": 238.02891,
+        "NP": 237.0,
+        "PU": 244.0,
+        "AM": 243.0,
+        "CM": 247.0,
+        "BK": 247.0,
+        "CF": 251.0,
+        "ES": 252.0,
+        "FM": 257.0,
+        "MD": 258.0,
+        "NO": 259.0,
+        "LR": 262.0,
+        "UNQ": 261.0,
+        "UNP": 262.0,
+        "UNH": 266.0,
+        "UNS": 264.0,
+        "UNO": 277.0,
+        "UNE": 268.0,
+        "D": 2.01410177784,
+        "T": 3.01604928132,
+    }
+    #
+    # Monoisotopic masses of the most abundant (or most stable) isotope.
+    _monoisotopicMassD: ClassVar = {  # noqa: N815
+        "H": 1.0078250319,
+        "HE": 4.0026032541,
+        "LI": 7.016003434,
+        "BE": 9.01218306,
+        "B": 11.009305167,
+        "C": 12.0,
+        "N": 14.0030740042,
+        "O": 15.9949146193,
+        "F": 18.9984031621,
+        "NE": 19.9924401753,
+        "NA": 22.989769282,
+        "MG": 23.985041689,
+        "AL": 26.98153841,
+        "SI": 27.9769265344,
+        "P": 30.9737619977,
+        "S": 31.9720711735,
+        "CL": 34.96885269,
+        "AR": 39.962383122,
+        "K": 38.963706485,
+        "CA": 39.962590851,
+        "SC": 44.9559071,
+        "TI": 47.94794068,
+        "V": 50.94395766,
+        "CR": 51.94050471,
+        "MN": 54.93804304,
+        "FE": 55.93493554,
+        "CO": 58.9331935,
+        "NI": 57.9353417,
+        "CU": 62.9295971,
+        "ZN": 63.9291418,
+        "GA": 68.9255735,
+        "GE": 73.921177761,
+        "AS": 74.9215946,
+        "SE": 79.9165218,
+        "BR": 78.9183376,
+        "KR": 83.911497727,
+        "RB": 84.911789736,
+        "SR": 87.905612254,
+        "Y": 88.9058382,
+        "ZR": 89.90469876,
+        "NB": 92.9063732,
+        "MO": 97.90540361,
+        "TC": 97.907211,
+        "RU": 101.9043403,
+        "RH": 102.9054941,
+        "PD": 105.9034803,
+        "AG": 106.9050915,
+        "CD": 113.903365,
+        "IN": 114.903878773,
+        "SN": 119.9022026,
+        "SB": 120.9038114,
+        "TE": 129.906222745,
+        "I": 126.904473,
+        "XE": 131.904155083,
+        "CS": 132.905451959,
+        "BA": 137.90524706,
+        "LA": 138.9063629,
+        "CE": 139.9054484,
+        "PR": 140.9076596,
+        "ND": 141.9077288,
+        "PM": 144.912756,
+        "SM": 151.9197386,
+        "EU": 152.9212368,
+        "GD": 157.9241112,
+        "TB": 158.9253537,
+        "DY": 163.9291808,
+        "HO": 164.9303291,
+        "ER": 165.9303011,
+        "TM": 168.934219,
+        "YB": 173.938867546,
+        "LU": 174.9407772,
+        "HF": 179.9465595,
+        "TA": 180.9479985,
+        "W": 183.9509332,
+        "RE": 186.9557522,
+        "OS": 191.9614788,
+        "IR": 192.9629238,
+        "PT": 194.9647943,
+        "AU": 196.9665701,
+        "HG": 201.9706436,
+        "TL": 204.9744273,
+        "PB": 207.976652,
+        "BI": 208.9803986,
+        "PO": 208.9824304,
+        "AT": 209.987147,
+        "RN": 222.017576,
+        "FR": 223.0197342,
+        "RA": 226.0254082,
+        "AC": 227.0277506,
+        "TH": 232.0380536,
+        "PA": 231.0358825,
+        "U": 238.0507869,
+        "NP": 237.0481716,
+        "PU": 244.0642044,
+        "AM": 243.0613799,
+        "CM": 247.070353,
+        "BK": 247.070306,
+        "CF": 251.079587,
+        "ES": 252.08298,
+        "FM": 257.095105,
+        "MD": 258.098434,
+        "NO": 259.100998,
+        "LR": 262.10962,
+        "UNQ": 261.10877,
+        "UNP": 262.11407,
+        "UNH": 266.12197,
+        "UNS": 264.12449,
+        "UNO": 277.15177,
+        "UNE": 268.13865,
+        "D": 2.01410177784,
+        "T": 3.01604928132,
+    }
+
+    @classmethod
+    def encodeTypeSymbols(cls, typeSymbolList):
+        """Encode a column of atom type symbols.
+
+        Returns (atNo, isotope) uint8 arrays.  Each distinct symbol is looked up once;
+        unknown symbols are encoded as atomic number 0.
+        """
+        sA = np.char.upper(np.asarray(typeSymbolList, dtype=str))
+        uA, invA = np.unique(sA, return_inverse=True)
+        atNoA = np.asarray([cls._atomicNumberD.get(ty, 0) for ty in uA], dtype=np.uint8)
+        isoA = np.asarray([cls._isotopeD.get(ty, 0) for ty in uA], dtype=np.uint8)
+        return atNoA[invA].reshape(sA.shape), isoA[invA].reshape(sA.shape)
@@ -10,6 +10,15 @@
 #   1-Feb-2017  jdw  Unified with chem_ref_data -
 #   1-Feb-2017  jdw  Expand index content
 #   1-May-2017  jdw  Index all SMILES -
+#  18-Oct-2026       Use row filters and projections for descriptor and identifier loops
+#  18-Oct-2026       Add parallel index build over lock-free read-only store handles
+#  18-Oct-2026       Add incremental index updates and write index files atomically
+#  18-Oct-2026       Add single pass build of all indices with pluggable indexers
+#  18-Oct-2026       Add memory-mapped search index format
+#  18-Oct-2026       Add the optional reverse SMILES index to the single pass build
+#  18-Oct-2026       Add the optional lineage closure index to the single pass build
+#  18-Oct-2026       Detect changes once for the incremental update of both indices
+#  18-Oct-2026       Add the optional inverted name index to the single pass build and index updates
 #
 ##
 """
@@ -24,7 +33,10 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Creative Commons Attribution 3.0 Unported"
 __version__ = "V0.01"
 
+import multiprocessing
+import os
 import sys
+import time
 import traceback
 
 try:
@@ -32,14 +44,39 @@ try:
 except ImportError:
     import pickle  # noqa: S301,S403
 
+from mmcif_utils.persist.LockFile import LockFile
 from mmcif_utils.persist.PdbxPersist import PdbxPersist
 
-from wwpdb.utils.cc_dict_util.persist.PdbxChemCompPersist import (
-    PdbxChemCompAtomIt,
-    PdbxChemCompDescriptorIt,
-    PdbxChemCompIdentifierIt,
-    PdbxChemCompIt,
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompDictIndexers import (
+    PdbxChemCompLineageIndexer,
+    PdbxChemCompNameIndexer,
+    PdbxChemCompParentIndexer,
+    PdbxChemCompSearchIndexer,
+    PdbxChemCompSmilesIndexer,
 )
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompLineageIndex import (
+    PdbxChemCompLineageIndex,
+)
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompMappedIndex import (
+    PdbxChemCompMappedIndex,
+)
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompNameIndex import (
+    PdbxChemCompNameIndex,
+)
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompPersist import PdbxChemCompIt
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompStore import PdbxChemCompStoreReader
+
+
+def _makeIndexShard(args):
+    """Worker -- index a contiguous shard of the store container list through a read-only handle."""
+    storePath, ccIdList = args
+    myReader = PdbxChemCompStoreReader(verbose=False)
+    if not myReader.open(dbFileName=storePath):
+        raise OSError("Cannot open store %s" % storePath)
+    try:
+        return PdbxChemCompDictIndex(verbose=False).indexComponents(myReader, ccIdList)
+    finally:
+        myReader.close()
 
 
 class PdbxChemCompDictIndex:
@@ -49,12 +86,15 @@ class PdbxChemCompDictIndex:
         self.__verbose = verbose
         self.__debug = False
         self.__lfh = log
+        self.__timingD = {}
 
-    def makeIndex(self, storePath="chemcomp.db", indexPath="chemcomp-index.pic"):
+    def makeIndex(self, storePath="chemcomp.db", indexPath="chemcomp-index.pic", numProc=1):
         """Create a search index from the contents of a persistent store of
         a chemical dictionary.  Store the index in indexPath.
+
+        If numProc > 1 the components are indexed in parallel worker processes.
         """
-        return self.__makeIndex(storePath=storePath, indexPath=indexPath)
+        return self.__makeIndex(storePath=storePath, indexPath=indexPath, numProc=numProc)
 
     def makeParentComponentIndex(self, storePath="chemcomp.db", indexPath="chemcomp-parent-index.pic"):
         """Create a search index for parent components from the contents of a persistent store of
@@ -66,11 +106,35 @@ class PdbxChemCompDictIndex:
         """Read and return search index."""
         return self.__readIndex(indexPath=indexPath)
 
+    def writeMappedIndex(self, ccIdx, indexPath="chemcomp-index.idx"):
+        """Write the search index ccIdx in the memory-mapped format.  Returns the number of entries or 0 on failure."""
+        try:
+            return PdbxChemCompMappedIndex.write(ccIdx, indexPath)
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write("PdbxChemCompDictIndex(writeMappedIndex) index write failed for %s\n" % indexPath)
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+        return 0
+
+    def readMappedIndex(self, indexPath="chemcomp-index.idx"):
+        """Return a read-only mapping over a memory-mapped search index or {} on failure.
+
+        Entries are decoded on access.  The mapping may be used in place of the dictionary
+        returned by readIndex().
+        """
+        try:
+            return PdbxChemCompMappedIndex(indexPath)
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+        return {}
+
     def readParentComponentIndex(self, indexPath="chemcomp-parent-index.pic"):
         """Read and return the parent component search index."""
         return self.__readParentIndex(indexPath=indexPath)
 
-    def __makeIndex(self, storePath, indexPath):
+    def __makeIndex(self, storePath, indexPath, numProc=1):
         """Read serialized component dictionary and build a search index.
 
         Index is a dictionary of selected items such as name, synonyns, formula, status and
@@ -78,101 +142,14 @@ class PdbxChemCompDictIndex:
         """
         ccIdx = {}
         try:
-            myPersist = PdbxPersist(self.__verbose, self.__lfh)
-            myPersist.open(dbFileName=storePath)
-            containerList = myPersist.getStoreContainerIndex()
-            for ccId in containerList:
-                d = {}
-                d["ccId"] = ccId
-                d["nameList"] = []
-                d["typeCounts"] = {}
-                d["InChI"] = None
-                d["InChIKey"] = None
-                d["InChIKey14"] = None
-                d["smiles"] = None
-                d["smilesList"] = []
-                d["smilesStereo"] = None
-                d["releaseStatus"] = None
-                d["subcomponentList"] = None
-                d["name"] = None
-                d["type"] = None
-                d["formula"] = None
-                d["formulaWeight"] = None
-                nameList = []
-                dC = myPersist.fetchObject(containerName=ccId, objectName="chem_comp")
-                if dC is not None:
-                    rowIt = PdbxChemCompIt(dC, self.__verbose, self.__lfh)
-                    for row in rowIt:
-                        name = row.getName()
-                        synonyms = row.getSynonyms()
-                        d["releaseStatus"] = row.getReleaseStatus()
-                        d["subcomponentList"] = row.getSubComponentList()
-                        d["name"] = name
-                        d["synonyms"] = synonyms
-                        d["type"] = row.getType()
-                        d["formula"] = row.getFormula()
-                        d["formulaWeight"] = row.getFormulaWeight()
-                        d["ambiguousFlag"] = row.getAmbiguousFlag()
-
-                    nameList.append(name)
-                    if synonyms is not None:
-                        if ";" in synonyms:
-                            sList = synonyms.split(";")
-                            nameList.extend(sList)
-                        else:
-                            nameList.append(synonyms)
-
-                # Compute element/type counts directly from the definition atom list
-                typeCounts = {}
-                dC = myPersist.fetchObject(containerName=ccId, objectName="chem_comp_atom")
-                if dC is not None:
-                    rowIt = PdbxChemCompAtomIt(dC, self.__verbose, self.__lfh)
-                    for row in rowIt:
-                        aType = row.getType()
-                        if row.getType() not in typeCounts:
-                            typeCounts[aType] = 1
-                        else:
-                            typeCounts[aType] += 1
-                    d["typeCounts"] = typeCounts
-
-                dC = myPersist.fetchObject(containerName=ccId, objectName="pdbx_chem_comp_descriptor")
-                if dC is not None:
-                    rowIt = PdbxChemCompDescriptorIt(dC, self.__verbose, self.__lfh)
-                    for row in rowIt:
-                        des = row.getDescriptor()
-                        desType = row.getType()
-                        desProgram = row.getProgram()
-                        if desType.startswith("SMILES"):
-                            d["smilesList"].append(des)
-                        if "OpenEye" in desProgram:
-                            if desType == "SMILES_CANNONICAL":
-                                d["smilesStereo"] = des
-                            elif desType == "SMILES":
-                                d["smiles"] = des
-                        elif "InChI" in desProgram:
-                            if desType == "InChI":
-                                d["InChI"] = des
-                            elif desType == "InChIKey":
-                                d["InChIKey"] = des
-                                d["InChIKey14"] = des[:14]
-
-                dC = myPersist.fetchObject(containerName=ccId, objectName="pdbx_chem_comp_identifier")
-                if dC is not None:
-                    rowIt = PdbxChemCompIdentifierIt(dC, self.__verbose, self.__lfh)
-                    for row in rowIt:
-                        iden = row.getIdentifier()
-                        idenType = row.getType()
-                        # idenProgram = row.getProgram()
-                        if "SYSTEMATIC" in idenType:
-                            nameList.append(iden)
-
-                d["nameList"] = nameList
-                ccIdx[ccId] = d
-
-            myPersist.close()
-            with open(indexPath, "wb") as fout:
-                # Maintain backwards compatibility with python 2
-                pickle.dump(ccIdx, fout, 2)
+            if numProc > 1:
+                ccIdx = self.__makeIndexMulti(storePath, numProc)
+            else:
+                myPersist = PdbxPersist(self.__verbose, self.__lfh)
+                myPersist.open(dbFileName=storePath)
+                ccIdx = self.indexComponents(myPersist, myPersist.getStoreContainerIndex())
+                myPersist.close()
+            self.__writeIndex(indexPath, [ccIdx])
 
         except:  # noqa: E722 pylint: disable=bare-except
             if self.__verbose:
@@ -185,6 +162,134 @@ class PdbxChemCompDictIndex:
 
         return ccIdx
 
+    def __makeIndexMulti(self, storePath, numProc):
+        """Build the search index in numProc worker processes.
+
+        The store lock is held here while workers read contiguous shards of the container
+        list through lock-free read-only handles.  Partial indices are merged in shard order
+        so the result is identical to the serial build.
+        """
+        ccIdx = {}
+        with LockFile(storePath, verbose=self.__verbose, log=self.__lfh):
+            myReader = PdbxChemCompStoreReader(self.__verbose, self.__lfh)
+            if not myReader.open(dbFileName=storePath):
+                raise OSError("Cannot open store %s" % storePath)
+            containerList = myReader.getStoreContainerIndex()
+            myReader.close()
+            nShard = min(len(containerList), numProc * 4)
+            if nShard == 0:
+                return ccIdx
+            shardSize = -(-len(containerList) // nShard)
+            argList = [
+                (storePath, containerList[ii : ii + shardSize]) for ii in range(0, len(containerList), shardSize)
+            ]
+            with multiprocessing.Pool(processes=numProc) as pool:
+                for partD in pool.imap(_makeIndexShard, argList):
+                    ccIdx.update(partD)
+        if self.__verbose:
+            self.__lfh.write(
+                "PdbxChemCompDictIndex(__makeIndexMulti) indexed %d components in %d shards with %d processes\n"
+                % (len(ccIdx), len(argList), numProc)
+            )
+        return ccIdx
+
+    def indexComponents(self, persist, ccIdList):
+        """Return the search index entries for the components in ccIdList read from an open store.
+
+        persist is an open PdbxPersist or PdbxChemCompStoreReader instance.
+        """
+        indexer = PdbxChemCompSearchIndexer(self.__verbose, self.__lfh)
+        self.__runIndexers(persist, ccIdList, [indexer])
+        return indexer.getIndex()
+
+    def makeIndices(
+        self,
+        storePath="chemcomp.db",
+        indexPath="chemcomp-index.pic",
+        parentIndexPath="chemcomp-parent-index.pic",
+        indexerList=None,
+        smilesIndexPath=None,
+        lineageIndexPath=None,
+        nameIndexPath=None,
+    ):
+        """Create the search index and the parent component index in a single pass over the
+        store.  Additional indexers (PdbxChemCompIndexerBase subclasses) in indexerList are
+        applied in the same pass.  If smilesIndexPath is set the reverse SMILES index
+        (see PdbxChemCompSmilesIndex) is also built and stored in smilesIndexPath, if
+        lineageIndexPath is set the lineage closure index (see PdbxChemCompLineageIndex) is
+        built and stored in lineageIndexPath, and if nameIndexPath is set the inverted name
+        index (see PdbxChemCompNameIndex) is built and stored in nameIndexPath.
+
+        Returns a dictionary of indices keyed by indexer name ('search', 'parent', ...) or {} on
+        failure.  Per-indexer timings are available from getTimingDict().
+        """
+        retD = {}
+        try:
+            indexers = [
+                PdbxChemCompSearchIndexer(self.__verbose, self.__lfh),
+                PdbxChemCompParentIndexer(self.__verbose, self.__lfh),
+            ]
+            if smilesIndexPath is not None:
+                indexers.append(PdbxChemCompSmilesIndexer(self.__verbose, self.__lfh))
+            if lineageIndexPath is not None:
+                indexers.append(PdbxChemCompLineageIndexer(self.__verbose, self.__lfh))
+            if nameIndexPath is not None:
+                indexers.append(PdbxChemCompNameIndexer(self.__verbose, self.__lfh))
+            indexers.extend(indexerList or [])
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.open(dbFileName=storePath)
+            self.__runIndexers(myPersist, myPersist.getStoreContainerIndex(), indexers)
+            myPersist.close()
+            for indexer in indexers:
+                retD[indexer.getName()] = indexer.getIndex()
+            self.__writeIndex(indexPath, [retD["search"]])
+            self.__writeIndex(parentIndexPath, list(retD["parent"]))
+            if smilesIndexPath is not None:
+                self.__writeIndex(smilesIndexPath, [retD["smiles"]])
+            if lineageIndexPath is not None:
+                PdbxChemCompLineageIndex(self.__verbose, self.__lfh).makeIndex(retD["lineage"], lineageIndexPath)
+            if nameIndexPath is not None:
+                PdbxChemCompNameIndex(self.__verbose, self.__lfh).makeIndex(retD["name"], nameIndexPath)
+            if self.__verbose:
+                for name, tS in self.__timingD.items():
+                    self.__lfh.write("PdbxChemCompDictIndex(makeIndices) %-20s %.3f seconds\n" % (name, tS))
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompDictIndex(makeIndices) index creation failed for %s index %s\n"
+                    % (storePath, indexPath)
+                )
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            retD = {}
+        return retD
+
+    def getTimingDict(self):
+        """Return the elapsed times (seconds) of the most recent indexing pass keyed by 'fetch' and indexer name."""
+        return self.__timingD
+
+    def __runIndexers(self, persist, ccIdList, indexers):
+        """Fetch the categories required by the input indexers once per component and apply each indexer."""
+        objNameList = []
+        for indexer in indexers:
+            for objName in indexer.getObjectNameList():
+                if objName not in objNameList:
+                    objNameList.append(objName)
+        timingD = {"fetch": 0.0}
+        for indexer in indexers:
+            timingD[indexer.getName()] = 0.0
+        for ccId in ccIdList:
+            t0 = time.time()
+            categoryD = {
+                objName: persist.fetchObject(containerName=ccId, objectName=objName) for objName in objNameList
+            }
+            timingD["fetch"] += time.time() - t0
+            for indexer in indexers:
+                t0 = time.time()
+                indexer.add(ccId, categoryD)
+                timingD[indexer.getName()] += time.time() - t0
+        self.__timingD = timingD
+
     def __makeParentIndex(self, storePath, indexPath):
         """Read serialized component dictionary and indices of parent/child relationships for modified residues.
 
@@ -196,48 +301,205 @@ class PdbxChemCompDictIndex:
             myPersist = PdbxPersist(self.__verbose, self.__lfh)
             myPersist.open(dbFileName=storePath)
             containerList = myPersist.getStoreContainerIndex()
+            indexer = PdbxChemCompParentIndexer(self.__verbose, self.__lfh)
+            self.__runIndexers(myPersist, containerList, [indexer])
+            myPersist.close()
+            pD, cD = indexer.getIndex()
+            # Compatbility with python 2 and not pickle.HIGHEST_PROTOCOL
+            self.__writeIndex(indexPath, [pD, cD])
+
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompDictIndex(__makeParentIndex) parent index creation failed for %s index %s\n"
+                    % (storePath, indexPath)
+                )
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+
+        return pD, cD
+
+    def findChangedComponents(self, storePath, indexPath="chemcomp-index.pic"):
+        """Compare the store with an existing search index and return (changedIdList, removedIdList).
 
+        Components are changed if they are new to the store or if pdbx_modified_date differs
+        from the value recorded in the index.  Removed components are in the index but no longer
+        in the store.
+        """
+        changedIdList = []
+        removedIdList = []
+        try:
+            ccIdx = self.__readIndex(indexPath)
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.open(dbFileName=storePath)
+            containerList = myPersist.getStoreContainerIndex()
             for ccId in containerList:
+                if ccId not in ccIdx or "modifiedDate" not in ccIdx[ccId]:
+                    changedIdList.append(ccId)
+                    continue
+                modDate = None
                 dC = myPersist.fetchObject(containerName=ccId, objectName="chem_comp")
                 if dC is not None:
-                    rowIt = PdbxChemCompIt(dC, self.__verbose, self.__lfh)
-                    for row in rowIt:
-                        pCompId = row.getNstdParentId()
-                        compId = row.getId()
-                        if (pCompId is not None) and (len(pCompId) > 0) and (pCompId not in ["?", "."]):
-                            if "," in pCompId:
-                                pList = pCompId.split(",")
-                                cD[compId] = pList
-                            elif len(pCompId) > 3:
-                                self.__lfh.write(
-                                    "PdbxChemCompDictIndex(__makeParentIndex) compId %s parent compId %s\n"
-                                    % (compId, pCompId)
-                                )
-                            else:
-                                pList = [pCompId]
-                                if pCompId not in pD:
-                                    pD[pCompId] = []
-                                pD[pCompId].append(compId)
-                                cD[compId] = pList
+                    for row in PdbxChemCompIt(dC, self.__verbose, self.__lfh):
+                        modDate = row.getModificationDate()
+                if modDate != ccIdx[ccId]["modifiedDate"]:
+                    changedIdList.append(ccId)
+            myPersist.close()
+            containerS = set(containerList)
+            removedIdList = [ccId for ccId in ccIdx if ccId not in containerS]
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompDictIndex(findChangedComponents) comparison failed for %s index %s\n"
+                    % (storePath, indexPath)
+                )
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+        return changedIdList, removedIdList
+
+    def updateIndex(
+        self,
+        storePath="chemcomp.db",
+        indexPath="chemcomp-index.pic",
+        changedIdList=None,
+        removedIdList=None,
+        nameIndexPath=None,
+    ):
+        """Update an existing search index for the changed and removed components and rewrite
+        it in place.  If both lists are None the changes are detected with findChangedComponents().
+        If nameIndexPath is set the inverted name index is rebuilt from the updated search index.
 
+        Returns the updated index or {} on failure.
+        """
+        ccIdx = {}
+        try:
+            if changedIdList is None and removedIdList is None:
+                changedIdList, removedIdList = self.findChangedComponents(storePath, indexPath)
+            oldIdx = self.__readIndex(indexPath)
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.open(dbFileName=storePath)
+            containerList = myPersist.getStoreContainerIndex()
+            containerS = set(containerList)
+            newIdx = self.indexComponents(myPersist, [ccId for ccId in changedIdList or [] if ccId in containerS])
             myPersist.close()
-            ofh = open(indexPath, "wb")
-            # Compatbility with python 2 and not pickle.HIGHEST_PROTOCOL
-            pickle.dump(pD, ofh, 2)
-            pickle.dump(cD, ofh, 2)
-            ofh.close()
+            removedS = set(removedIdList or [])
+            # Preserve store order so that the result matches a full rebuild --
+            for ccId in containerList:
+                if ccId in newIdx:
+                    ccIdx[ccId] = newIdx[ccId]
+                elif ccId in oldIdx and ccId not in removedS:
+                    ccIdx[ccId] = oldIdx[ccId]
+            self.__writeIndex(indexPath, [ccIdx])
+            if nameIndexPath is not None:
+                PdbxChemCompNameIndex(self.__verbose, self.__lfh).makeIndex(ccIdx, nameIndexPath)
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompDictIndex(updateIndex) updated %d removed %d index length %d\n"
+                    % (len(newIdx), len(set(oldIdx) - set(ccIdx)), len(ccIdx))
+                )
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompDictIndex(updateIndex) index update failed for %s index %s\n" % (storePath, indexPath)
+                )
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            ccIdx = {}
+        return ccIdx
+
+    def updateParentComponentIndex(
+        self,
+        storePath="chemcomp.db",
+        indexPath="chemcomp-parent-index.pic",
+        changedIdList=None,
+        removedIdList=None,
+        searchIndexPath="chemcomp-index.pic",
+    ):
+        """Update an existing parent component index for the changed and removed components and
+        rewrite it in place.  Component identifiers are assumed to match store container names.
+        If both lists are None the changes are detected with findChangedComponents() against the
+        search index in searchIndexPath, which must not yet have been updated (see updateIndices()).
 
+        Returns the updated (parentD, childD) or ({}, {}) on failure.
+        """
+        pD = {}
+        cD = {}
+        try:
+            if changedIdList is None and removedIdList is None:
+                changedIdList, removedIdList = self.findChangedComponents(storePath, searchIndexPath)
+            _, oldCD = self.__readParentIndex(indexPath)
+            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist.open(dbFileName=storePath)
+            containerList = myPersist.getStoreContainerIndex()
+            changedS = set(changedIdList or [])
+            indexer = PdbxChemCompParentIndexer(self.__verbose, self.__lfh)
+            self.__runIndexers(myPersist, [ccId for ccId in containerList if ccId in changedS], [indexer])
+            myPersist.close()
+            _, newCD = indexer.getIndex()
+            changedS.update(removedIdList or [])
+            for ccId in containerList:
+                if ccId in newCD:
+                    cD[ccId] = newCD[ccId]
+                elif ccId in oldCD and ccId not in changedS:
+                    cD[ccId] = oldCD[ccId]
+            pD = PdbxChemCompParentIndexer.getParentDict(cD)
+            self.__writeIndex(indexPath, [pD, cD])
         except:  # noqa: E722 pylint: disable=bare-except
             if self.__verbose:
                 self.__lfh.write(
-                    "PdbxChemCompDictIndex(__makeParentIndex) parent index creation failed for %s index %s\n"
+                    "PdbxChemCompDictIndex(updateParentComponentIndex) parent index update failed for %s index %s\n"
                     % (storePath, indexPath)
                 )
             if self.__debug:
                 traceback.print_exc(file=self.__lfh)
-
+            pD, cD = {}, {}
         return pD, cD
 
+    def updateIndices(
+        self,
+        storePath="chemcomp.db",
+        indexPath="chemcomp-index.pic",
+        parentIndexPath="chemcomp-parent-index.pic",
+        changedIdList=None,
+        removedIdList=None,
+        nameIndexPath=None,
+    ):
+        """Update the existing search and parent component indices for the changed and removed
+        components.  If both lists are None the changes are detected once with findChangedComponents()
+        before either index is rewritten, and the same changes are applied to both indices.  If
+        nameIndexPath is set the inverted name index is rebuilt from the updated search index.
+
+        Returns a dictionary of the updated indices keyed by indexer name ('search', 'parent') or {} on failure.
+        """
+        if changedIdList is None and removedIdList is None:
+            changedIdList, removedIdList = self.findChangedComponents(storePath, indexPath)
+        ccIdx = self.updateIndex(
+            storePath=storePath,
+            indexPath=indexPath,
+            changedIdList=changedIdList,
+            removedIdList=removedIdList or [],
+            nameIndexPath=nameIndexPath,
+        )
+        pD, cD = self.updateParentComponentIndex(
+            storePath=storePath,
+            indexPath=parentIndexPath,
+            changedIdList=changedIdList,
+            removedIdList=removedIdList or [],
+        )
+        if not ccIdx:
+            return {}
+        return {"search": ccIdx, "parent": (pD, cD)}
+
+    @staticmethod
+    def __writeIndex(indexPath, objList):
+        """Pickle the objects in objList to a temporary file and move it into place at indexPath."""
+        tmpPath = indexPath + "-tmp"
+        with open(tmpPath, "wb") as fout:
+            for obj in objList:
+                # Maintain backwards compatibility with python 2
+                pickle.dump(obj, fout, 2)
+        os.replace(tmpPath, indexPath)
+
     @staticmethod
     def __readParentIndex(indexPath):
         """Internal method to recover the pickled index file."""
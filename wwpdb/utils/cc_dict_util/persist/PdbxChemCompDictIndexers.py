@@ -0,0 +1,322 @@
+##
+# File: PdbxChemCompDictIndexers.py
+# Date: 18-Oct-2026
+#
+# Update:
+#
+#  18-Oct-2026     Add the reverse SMILES indexer
+#  18-Oct-2026     Add the lineage link indexer
+#  18-Oct-2026     Make the indexer base class abstract
+#  18-Oct-2026     Add the name indexer and share the name list extraction with the search indexer
+#  18-Oct-2026     Accept both spellings of the canonical SMILES descriptor type
+#
+##
+"""
+Indexers applied to each component in a single pass over a persistent store of the
+chemical component dictionary (see PdbxChemCompDictIndex.makeIndices()).
+
+An indexer declares the categories it reads, receives the fetched categories for each
+component in store order and returns its accumulated index when the pass is complete.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import abc
+import sys
+from typing import ClassVar
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompPersist import (
+    PdbxChemCompAtomIt,
+    PdbxChemCompDescriptorIt,
+    PdbxChemCompIdentifierIt,
+    PdbxChemCompIt,
+)
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompSmilesIndex import (
+    PdbxChemCompSmilesIndex,
+)
+
+
+class PdbxChemCompIndexerBase(abc.ABC):
+    """Base indexer class.
+
+    Subclasses set _name and _objectNameList and implement add() and getIndex().
+    """
+
+    _name: ClassVar[str] = ""
+    _objectNameList: ClassVar[list[str]] = []
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        self._verbose = verbose
+        self._lfh = log
+
+    def getName(self):
+        return self._name
+
+    def getObjectNameList(self):
+        """Return the names of the categories read by this indexer."""
+        return list(self._objectNameList)
+
+    @abc.abstractmethod
+    def add(self, ccId, categoryD):
+        """Index component ccId.  categoryD holds the fetched categories keyed by object name
+        (None for categories not in the store).
+        """
+
+    @abc.abstractmethod
+    def getIndex(self):
+        """Return the accumulated index."""
+
+    def _getNameList(self, categoryD):
+        """Return the component name, synonyms and systematic identifiers from the input categories."""
+        nameList = []
+        dC = categoryD.get("chem_comp")
+        if dC is not None:
+            name = synonyms = None
+            for row in PdbxChemCompIt(dC, self._verbose, self._lfh):
+                name = row.getName()
+                synonyms = row.getSynonyms()
+            nameList.append(name)
+            if synonyms is not None:
+                if ";" in synonyms:
+                    sList = synonyms.split(";")
+                    nameList.extend(sList)
+                else:
+                    nameList.append(synonyms)
+
+        dC = categoryD.get("pdbx_chem_comp_identifier")
+        if dC is not None:
+            rowIt = PdbxChemCompIdentifierIt(
+                dC,
+                self._verbose,
+                self._lfh,
+                rowFilter=[("type", "contains", "SYSTEMATIC")],
+                selectList=["identifier"],
+                asTuple=True,
+            )
+            for (iden,) in rowIt:
+                nameList.append(iden)
+        return nameList
+
+
+class PdbxChemCompSearchIndexer(PdbxChemCompIndexerBase):
+    """Search index of selected items such as name, synonyms, formula, status and descriptors."""
+
+    _name: ClassVar[str] = "search"
+    _objectNameList: ClassVar[list[str]] = [
+        "chem_comp",
+        "chem_comp_atom",
+        "pdbx_chem_comp_descriptor",
+        "pdbx_chem_comp_identifier",
+    ]
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        super(PdbxChemCompSearchIndexer, self).__init__(verbose, log)
+        self.__ccIdx = {}
+
+    def getIndex(self):
+        return self.__ccIdx
+
+    def add(self, ccId, categoryD):
+        d = {}
+        d["ccId"] = ccId
+        d["nameList"] = []
+        d["typeCounts"] = {}
+        d["InChI"] = None
+        d["InChIKey"] = None
+        d["InChIKey14"] = None
+        d["smiles"] = None
+        d["smilesList"] = []
+        d["smilesStereo"] = None
+        d["releaseStatus"] = None
+        d["subcomponentList"] = None
+        d["name"] = None
+        d["type"] = None
+        d["formula"] = None
+        d["formulaWeight"] = None
+        dC = categoryD.get("chem_comp")
+        if dC is not None:
+            rowIt = PdbxChemCompIt(dC, self._verbose, self._lfh)
+            for row in rowIt:
+                d["releaseStatus"] = row.getReleaseStatus()
+                d["subcomponentList"] = row.getSubComponentList()
+                d["name"] = row.getName()
+                d["synonyms"] = row.getSynonyms()
+                d["type"] = row.getType()
+                d["formula"] = row.getFormula()
+                d["formulaWeight"] = row.getFormulaWeight()
+                d["ambiguousFlag"] = row.getAmbiguousFlag()
+                d["modifiedDate"] = row.getModificationDate()
+
+        # Compute element/type counts directly from the definition atom list
+        typeCounts = {}
+        dC = categoryD.get("chem_comp_atom")
+        if dC is not None:
+            rowIt = PdbxChemCompAtomIt(dC, self._verbose, self._lfh)
+            for row in rowIt:
+                aType = row.getType()
+                if row.getType() not in typeCounts:
+                    typeCounts[aType] = 1
+                else:
+                    typeCounts[aType] += 1
+            d["typeCounts"] = typeCounts
+
+        dC = categoryD.get("pdbx_chem_comp_descriptor")
+        if dC is not None:
+            rowIt = PdbxChemCompDescriptorIt(
+                dC, self._verbose, self._lfh, selectList=["descriptor", "type", "program"], asTuple=True
+            )
+            for des, desType, desProgram in rowIt:
+                if desType.startswith("SMILES"):
+                    d["smilesList"].append(des)
+                if "OpenEye" in desProgram:
+                    # SMILES_CANNONICAL is the spelling used in older dictionary releases
+                    if desType in ("SMILES_CANONICAL", "SMILES_CANNONICAL"):
+                        d["smilesStereo"] = des
+                    elif desType == "SMILES":
+                        d["smiles"] = des
+                elif "InChI" in desProgram:
+                    if desType == "InChI":
+                        d["InChI"] = des
+                    elif desType == "InChIKey":
+                        d["InChIKey"] = des
+                        d["InChIKey14"] = des[:14]
+
+        d["nameList"] = self._getNameList(categoryD)
+        self.__ccIdx[ccId] = d
+
+
+class PdbxChemCompParentIndexer(PdbxChemCompIndexerBase):
+    """Parent/child relationships for modified residues.
+
+    The index is (parentD, childD) where childD holds the parent component list for each
+    child and parentD the child components of each parent for children with a single parent.
+    """
+
+    _name: ClassVar[str] = "parent"
+    _objectNameList: ClassVar[list[str]] = ["chem_comp"]
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        super(PdbxChemCompParentIndexer, self).__init__(verbose, log)
+        self.__cD = {}
+
+    def getIndex(self):
+        return self.getParentDict(self.__cD), self.__cD
+
+    def add(self, ccId, categoryD):  # noqa: ARG002 pylint: disable=unused-argument
+        dC = categoryD.get("chem_comp")
+        if dC is not None:
+            rowIt = PdbxChemCompIt(dC, self._verbose, self._lfh)
+            for row in rowIt:
+                pCompId = row.getNstdParentId()
+                compId = row.getId()
+                if (pCompId is not None) and (len(pCompId) > 0) and (pCompId not in ["?", "."]):
+                    if "," in pCompId:
+                        self.__cD[compId] = pCompId.split(",")
+                    elif len(pCompId) > 3:
+                        self._lfh.write(
+                            "PdbxChemCompDictIndex(__makeParentIndex) compId %s parent compId %s\n" % (compId, pCompId)
+                        )
+                    else:
+                        self.__cD[compId] = [pCompId]
+
+    @staticmethod
+    def getParentDict(cD):
+        """Return the dictionary of child component lists keyed by parent for children with a single parent."""
+        pD = {}
+        for compId, pList in cD.items():
+            if len(pList) == 1:
+                pD.setdefault(pList[0], []).append(compId)
+        return pD
+
+
+class PdbxChemCompSmilesIndexer(PdbxChemCompIndexerBase):
+    """Reverse index of SMILES descriptors {smiles: [(ccId, descriptorType, program), ...]}.
+
+    See PdbxChemCompSmilesIndex for the normalization of SMILES strings and program tags.
+    """
+
+    _name: ClassVar[str] = "smiles"
+    _objectNameList: ClassVar[list[str]] = ["pdbx_chem_comp_descriptor"]
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        super(PdbxChemCompSmilesIndexer, self).__init__(verbose, log)
+        self.__smilesD = {}
+
+    def getIndex(self):
+        return self.__smilesD
+
+    def add(self, ccId, categoryD):
+        dC = categoryD.get("pdbx_chem_comp_descriptor")
+        if dC is not None:
+            rowIt = PdbxChemCompDescriptorIt(
+                dC, self._verbose, self._lfh, selectList=["descriptor", "type", "program"], asTuple=True
+            )
+            for des, desType, desProgram in rowIt:
+                if desType.startswith("SMILES"):
+                    entry = (ccId, desType, PdbxChemCompSmilesIndex.normalizeProgram(desProgram))
+                    entryL = self.__smilesD.setdefault(PdbxChemCompSmilesIndex.normalizeSmiles(des), [])
+                    if entry not in entryL:
+                        entryL.append(entry)
+
+
+class PdbxChemCompLineageIndexer(PdbxChemCompIndexerBase):
+    """Lineage links {ccId: [linked ccId, ...]} from the parent components and the subcomponent list.
+
+    Unlike the parent index, all comma or whitespace separated parent identifiers of any
+    length are kept.  Subcomponents are linked as parents of the component they make up.
+    See PdbxChemCompLineageIndex for the transitive closure of these links.
+    """
+
+    _name: ClassVar[str] = "lineage"
+    _objectNameList: ClassVar[list[str]] = ["chem_comp"]
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        super(PdbxChemCompLineageIndexer, self).__init__(verbose, log)
+        self.__linkD = {}
+
+    def getIndex(self):
+        return self.__linkD
+
+    @staticmethod
+    def __splitIdList(value):
+        if value is None:
+            return []
+        return [tId for tId in value.replace(",", " ").split() if tId not in ["?", "."]]
+
+    def add(self, ccId, categoryD):  # noqa: ARG002 pylint: disable=unused-argument
+        dC = categoryD.get("chem_comp")
+        if dC is not None:
+            rowIt = PdbxChemCompIt(dC, self._verbose, self._lfh)
+            for row in rowIt:
+                compId = row.getId()
+                linkL = []
+                for tId in self.__splitIdList(row.getNstdParentId()) + self.__splitIdList(row.getSubComponentList()):
+                    if tId != compId and tId not in linkL:
+                        linkL.append(tId)
+                if linkL:
+                    self.__linkD[compId] = linkL
+
+
+class PdbxChemCompNameIndexer(PdbxChemCompIndexerBase):
+    """Component names {ccId: {"nameList": [...]}} in the form of the search index name lists.
+
+    See PdbxChemCompNameIndex for the inverted token and trigram index built from these names.
+    """
+
+    _name: ClassVar[str] = "name"
+    _objectNameList: ClassVar[list[str]] = ["chem_comp", "pdbx_chem_comp_identifier"]
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        super(PdbxChemCompNameIndexer, self).__init__(verbose, log)
+        self.__nameD = {}
+
+    def getIndex(self):
+        return self.__nameD
+
+    def add(self, ccId, categoryD):
+        self.__nameD[ccId] = {"nameList": self._getNameList(categoryD)}
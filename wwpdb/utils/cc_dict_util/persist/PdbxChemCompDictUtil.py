@@ -4,6 +4,18 @@
 #
 # Update:
 #    1-Feb-2017 jdw unified with chem_ref_data -
+#   18-Oct-2026     add parallel parsing of definition files and per-file read failure reporting
+#   18-Oct-2026     update the store from a path list in a single batched update
+#   18-Oct-2026     add streaming store construction in bounded batches; size check and move all dbm store files
+#   18-Oct-2026     split the dictionary file on a byte offset data block index and parse ranges in parallel
+#   18-Oct-2026     add a file manifest with content digests and incremental store synchronization
+#   18-Oct-2026     apply batched file updates with a single container index write
+#   18-Oct-2026     remove temporary store files when a store build is not moved into place
+#   18-Oct-2026     parse data block ranges from memory rather than through temporary files
+#   18-Oct-2026     rebuild path list stores incrementally and keep the manifest current on updates
+#   18-Oct-2026     bound the number of batches parsed ahead of the store writer
+#   18-Oct-2026     parse data block ranges with the core adapter and report failures by byte range
+#   18-Oct-2026     make incremental path list rebuilds opt-in; drop the containers of unreadable files on sync
 ##
 """
 A collection of classes supporting maintenance methods on chemical
@@ -17,42 +29,193 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Creative Commons Attribution 3.0 Unported"
 __version__ = "V0.01"
 
+import collections
+import hashlib
+import multiprocessing
 import os
 import sys
+import tempfile
 import traceback
+from itertools import islice
 
+try:
+    import cPickle as pickle  # type: ignore[import-not-found]  # noqa: S301,N813,S403
+except ImportError:
+    import pickle  # noqa: S301,S403
+
+from mmcif_utils.persist.LockFile import LockFile
 from mmcif_utils.persist.PdbxCoreIoAdapter import PdbxCoreIoAdapter as PdbxIoAdapter
 from mmcif_utils.persist.PdbxPersist import PdbxPersist
 
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompBlockIndex import (
+    PdbxChemCompBlockIndex,
+)
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompStore import (
+    PdbxChemCompStoreEditor,
+    PdbxChemCompStoreReader,
+    PdbxChemCompStoreWriter,
+)
+
+
+def _readDefinitionFile(pth):
+    """Worker -- read the definitions in the input file.  Returns (status, container list, error message)."""
+    try:
+        myReader = PdbxIoAdapter(verbose=False)
+        ok = myReader.read(pdbxFilePath=pth)
+        return ok, myReader.getContainerList(), None if ok else "read failed"
+    except Exception as e:  # noqa: BLE001
+        return False, [], str(e)
+
+
+def _readDefinitionRange(args):
+    """Worker -- read the definitions in the byte range [offset, offset + length) of the input file.
+
+    The range must be valid UTF-8 and is parsed through a temporary file with the same adapter
+    as whole files.  Returns (status, container list, error message), where the error message
+    identifies the failed range.
+    """
+    dictPath, offset, length = args
+    pth = None
+    try:
+        data = PdbxChemCompBlockIndex.readRange(dictPath, offset, length)
+        data.decode("utf-8")
+        with tempfile.NamedTemporaryFile(suffix=".cif", delete=False) as ofh:
+            pth = ofh.name
+            ofh.write(data)
+        ok, containerList, errMsg = _readDefinitionFile(pth)
+    except Exception as e:  # noqa: BLE001
+        ok, containerList, errMsg = False, [], str(e)
+    finally:
+        if pth is not None:
+            os.remove(pth)
+    if not ok:
+        return False, [], "%s in bytes %d-%d of %s" % (errMsg, offset, offset + length, dictPath)
+    return True, containerList, None
+
 
 class PdbxChemCompDictUtil:
     """Maintenance methods for creating and updating persistent stores of chemical dictionaries."""
 
+    # file name suffixes added to the store path by the dbm implementations behind shelve
+    _storeSuffixList = ("", ".db", ".dat", ".dir", ".bak", ".pag")
+
     def __init__(self, verbose=True, log=sys.stderr):
         self.__verbose = verbose
         self.__debug = False
         self.__lfh = log
+        self.__failedPathList = []
+        self.__containerCount = 0
+
+    def makeStoreFromFile(self, dictPath, storePath="chemcomp.db", minSize=10, batchSize=0, numProc=1):
+        """Create a new persistent store from input chemical dictionary file.
+
+        If batchSize > 0 the dictionary is read and stored in batches of batchSize data blocks,
+        so that memory use does not grow with the size of the dictionary.  If numProc > 1 the
+        batches are parsed in a pool of numProc processes (the default batch size is then chosen
+        to give each process several batches), and at most 2 * numProc parsed batches are held
+        ahead of the store writer.  Batches are located with a byte offset index of the data
+        blocks in the file (see PdbxChemCompBlockIndex).
+        """
+        if batchSize > 0 or numProc > 1:
+            ok = self.__makeStoreFromFileStreaming(
+                dictPath=dictPath, storePath=storePath, minSize=minSize, batchSize=batchSize, numProc=numProc
+            )
+        else:
+            ok = self.__makeStoreFromFile(dictPath=dictPath, storePath=storePath, minSize=minSize)
+        if ok:
+            # the store no longer corresponds to a definition file path list
+            self.__removeManifest(storePath)
+        return ok
+
+    def getContainerCount(self):
+        """Return the number of containers in the store after the last store build."""
+        return self.__containerCount
 
-    def makeStoreFromFile(self, dictPath, storePath="chemcomp.db", minSize=10):
-        """Create a new persistent store from input chemical dictionary file."""
-        return self.__makeStoreFromFile(dictPath=dictPath, storePath=storePath, minSize=minSize)
+    def makeStoreFromPathList(self, pathList, storePath="chemcomp.db", numProc=1, incremental=False):
+        """Create or rebuild a persistent store from a path list of chemical component definitions.
 
-    def makeStoreFromPathList(self, pathList, storePath="chemcomp.db"):
-        """Create a new persistent store from a path list of chemical component definitions."""
-        return self.__makeStoreFromPathList(pathList=pathList, storePath=storePath)
+        If numProc > 1 the definition files are parsed in a pool of numProc processes.  Files
+        which cannot be read are reported and are available from getFailedPathList().  A manifest
+        of the files read is stored alongside the store.  The store is built from the full path
+        list unless incremental is set, in which case the existing store is synchronized with
+        pathList in place (see syncStoreFromPathList()).
+        """
+        if incremental:
+            return self.__syncStoreFromPathList(pathList=pathList, storePath=storePath, numProc=numProc) is not None
+        return self.__makeStoreFromPathList(pathList=pathList, storePath=storePath, numProc=numProc)
+
+    def syncStoreFromPathList(self, pathList, storePath="chemcomp.db", numProc=1):
+        """Synchronize the persistent store with a path list of chemical component definitions.
+
+        The store manifest (see getManifestPath()) records the size, modification time, SHA-256
+        digest and container names of each definition file in the store.  Only new files and files
+        whose content digest has changed are read and written to the store (files with unchanged
+        size and modification time are not read at all), and the containers of files no longer in
+        pathList are removed.  A file in pathList which cannot be read is counted as failed and
+        its containers are also removed from the store (and counted as removed), so that the
+        synchronized store has the content of a full build from pathList.  If the store or its
+        manifest does not exist, the store is built from the full path list.  The store is
+        updated in place.  The manifest is kept current by updateStoreByFile() and
+        updateStoreByFileBatch(), and is deleted by store updates which are not made from
+        files.  Returns a dictionary of file counts:
+
+            {"added": n, "changed": n, "removed": n, "unchanged": n, "failed": n}
+
+        or None if the store cannot be updated.  The store content is unchanged when the added,
+        changed and removed counts are all zero, so that derived indices need not be rebuilt.
+        """
+        return self.__syncStoreFromPathList(pathList=pathList, storePath=storePath, numProc=numProc)
+
+    @staticmethod
+    def getManifestPath(storePath="chemcomp.db"):
+        """Return the path of the definition file manifest kept alongside the input store."""
+        return storePath + "-manifest.pic"
+
+    def getFailedPathList(self):
+        """Return the list of (path, error message) for the files which could not be read in the last store build or update."""
+        return self.__failedPathList
 
     def updateStoreByFile(self, pathList, storePath="chemcomp.db"):
-        """Update the persistant store with the contents of the input path list"""
-        return self.__updateStoreByFile(pathList, storePath=storePath)
+        """Update the persistant store with the contents of the input path list.
+
+        Returns True if every file was read and stored.  Files which cannot be read are available
+        from getFailedPathList().
+        """
+        summaryD = self.__updateStoreByFile(pathList, storePath=storePath)
+        return summaryD is not None and not self.__failedPathList
+
+    def updateStoreByFileBatch(self, pathList, storePath="chemcomp.db", numProc=1):
+        """Update the persistant store with the contents of the input path list in a single batched update.
+
+        All files are read first (in numProc processes if numProc > 1).  Containers with the same
+        name are de-duplicated with the last occurrence in pathList taking precedence, and the
+        store is updated in one pass with a single write of the container index (replaced
+        containers hold exactly the categories of the new definition).  Returns a summary
+        dictionary keyed by container name:
+
+            {containerName: {"status": "added" | "updated", "path": path, "supersededPathList": [...]}}
+
+        or None if the store cannot be read.  Files which cannot be read are reported and are
+        available from getFailedPathList().
+        """
+        return self.__updateStoreByFile(pathList, storePath=storePath, numProc=numProc)
 
     def updateStoreByObject(self, inpObject, containerName=None, containerType="data", storePath="chemcomp.db"):
-        """Update the persistant store with the contents of the input object in the input named container."""
+        """Update the persistant store with the contents of the input object in the input named container.
+
+        Any definition file manifest of the store is deleted, so that the next path list build is a full build.
+        """
+        self.__removeManifest(storePath)
         return self.__updateStoreByObject(
             inpObject, containerName=containerName, containerType=containerType, storePath=storePath
         )
 
     def updateStoreByContainer(self, containerList, storePath="chemcomp.db"):
-        """Update the persistant store with the contents of the input container list."""
+        """Update the persistant store with the contents of the input container list.
+
+        Any definition file manifest of the store is deleted, so that the next path list build is a full build.
+        """
+        self.__removeManifest(storePath)
         return self.__updateStoreByContainer(containerList=containerList, storePath=storePath)
 
     ##
@@ -65,20 +228,51 @@ class PdbxChemCompDictUtil:
         except:  # noqa: E722 pylint: disable=bare-except
             return 0
 
+    def __getStoreSize(self, storePath):
+        """Return the total size of the files making up the store (the dbm implementation may add suffixes)."""
+        return sum(self.__getFileSize(storePath + sfx) for sfx in self._storeSuffixList)
+
+    def __removeStore(self, storePath):
+        """Remove any of the files making up the store."""
+        for sfx in self._storeSuffixList:
+            try:
+                if os.path.exists(storePath + sfx):
+                    os.remove(storePath + sfx)
+            except OSError:
+                if self.__debug:
+                    traceback.print_exc(file=self.__lfh)
+
+    def __moveStore(self, srcPath, dstPath):
+        """Move all of the files making up the source store to the destination store with destination locking."""
+        try:
+            with LockFile(dstPath, verbose=self.__verbose, log=self.__lfh):
+                for sfx in self._storeSuffixList:
+                    if os.path.exists(srcPath + sfx):
+                        os.replace(srcPath + sfx, dstPath + sfx)
+                    elif os.path.exists(dstPath + sfx):
+                        os.remove(dstPath + sfx)
+            return True
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write("PdbxChemCompDictUtil(__moveStore) move failed for %s\n" % srcPath)
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return False
+
     def __makeStoreFromFile(self, dictPath, storePath="chemcomp.db", minSize=10):
         """Internal method to create a new persistent store from input chemical dictionary file."""
+        tmpPath = storePath + "-tmpstore"
         try:
             ok = False
-            tmpPath = storePath + "-tmpstore"
             myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
             ok = myReader.read(pdbxFilePath=dictPath)
 
             myPersist = PdbxPersist(self.__verbose, self.__lfh)
             myPersist.setContainerList(myReader.getContainerList())
             myPersist.store(dbFileName=tmpPath)
-            if self.__getFileSize(tmpPath) > minSize:
-                myPersist.moveStore(tmpPath, storePath)
-                ok = True
+            self.__containerCount = len(myReader.getContainerList())
+            if self.__getStoreSize(tmpPath) > minSize:
+                ok = self.__moveStore(tmpPath, storePath)
                 # if (self.__debug):
                 #   indexD = myPersist.getIndex(dbFileName=storePath)
                 #   self.__lfh.write("Persistent index dictionary %r\n" % indexD.items())
@@ -89,57 +283,335 @@ class PdbxChemCompDictUtil:
             if self.__debug:
                 traceback.print_exc(file=self.__lfh)
             return False
+        finally:
+            # nothing remains after a successful move
+            self.__removeStore(tmpPath)
+
+    def __makeStoreFromFileStreaming(self, dictPath, storePath="chemcomp.db", minSize=10, batchSize=0, numProc=1):
+        """Internal method to create a new persistent store from input chemical dictionary file
+        reading and storing batches of batchSize data blocks in numProc processes.
+        """
+        tmpPath = storePath + "-tmpstore"
+        self.__containerCount = 0
+        try:
+            blockList = PdbxChemCompBlockIndex.scan(dictPath)
+            if batchSize < 1:
+                batchSize = max(1, -(-len(blockList) // (numProc * 4)))
+            rangeList = PdbxChemCompBlockIndex.getRangeList({"blockList": blockList}, batchSize)
+            argList = [(dictPath, offset, length) for offset, length, _ in rangeList]
+            myWriter = PdbxChemCompStoreWriter(self.__verbose, self.__lfh)
+            if not myWriter.open(dbFileName=tmpPath):
+                return False
+            ok = True
+            nBatch = 0
+            if numProc > 1 and len(argList) > 1:
+                pool = multiprocessing.Pool(processes=numProc)  # pylint: disable=consider-using-with
+                resultIt = self.__iterBounded(pool, _readDefinitionRange, argList, 2 * numProc)
+            else:
+                pool = None
+                resultIt = (_readDefinitionRange(args) for args in argList)
+            try:
+                for bOk, containerList, errMsg in resultIt:
+                    if not bOk:
+                        self.__lfh.write(
+                            "PdbxChemCompDictUtil(__makeStoreFromFileStreaming) batch %d failed: %s\n"
+                            % (nBatch + 1, errMsg)
+                        )
+                        ok = False
+                        break
+                    myWriter.addContainerList(containerList)
+                    nBatch += 1
+            finally:
+                if pool is not None:
+                    pool.terminate()
+                    pool.join()
+            myWriter.close()
+            self.__containerCount = myWriter.getContainerCount()
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompDictUtil(__makeStoreFromFileStreaming) wrote %d containers in %d batches (%d processes)\n"
+                    % (self.__containerCount, nBatch, numProc)
+                )
+            if ok and self.__getStoreSize(tmpPath) > minSize:
+                return self.__moveStore(tmpPath, storePath)
+            return False
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return False
+        finally:
+            self.__removeStore(tmpPath)
 
-    def __makeStoreFromPathList(self, pathList, storePath="chemcomp.db", minSize=10):
+    @staticmethod
+    def __iterBounded(pool, func, argList, maxPending):
+        """Generate func(args) for each item of argList in order from the input pool keeping at
+        most maxPending tasks submitted but not yet consumed.
+        """
+        argIt = iter(argList)
+        pendingQ = collections.deque(pool.apply_async(func, (args,)) for args in islice(argIt, maxPending))
+        while pendingQ:
+            result = pendingQ.popleft().get()
+            for args in islice(argIt, 1):
+                pendingQ.append(pool.apply_async(func, (args,)))
+            yield result
+
+    def __readPathList(self, pathList, numProc=1):
+        """Internal method to read the definitions in the input path list in numProc processes.
+
+        Returns a list of (path, container list) for the files read in input path order.  Read
+        failures are logged per file and recorded in the failed path list.
+        """
+        readList = []
+        self.__failedPathList = []
+        if numProc > 1 and len(pathList) > 1:
+            chunkSize = max(1, len(pathList) // (numProc * 16))
+            with multiprocessing.Pool(processes=numProc) as pool:
+                resultList = list(pool.imap(_readDefinitionFile, pathList, chunkSize))
+        else:
+            resultList = [_readDefinitionFile(pth) for pth in pathList]
+        for pth, (ok, cList, errMsg) in zip(pathList, resultList):
+            if not ok:
+                self.__failedPathList.append((pth, errMsg))
+                if self.__verbose:
+                    self.__lfh.write("PdbxChemCompDictUtil(__readPathList) %s for %s\n" % (errMsg, pth))
+            else:
+                readList.append((pth, cList))
+        return readList
+
+    def __makeStoreFromPathList(self, pathList, storePath="chemcomp.db", minSize=10, numProc=1):
         """Internal method to create a new persistent store from a path list
         of chemical component definitions.
         """
+        tmpPath = storePath + "-tmpstore"
         try:
             ok = False
             # build the full container list from the input path list
-            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
-            for pth in pathList:
-                ok = myReader.read(pdbxFilePath=pth)
+            readList = self.__readPathList(pathList, numProc=numProc)
+            containerList = [container for _, cList in readList for container in cList]
 
             myPersist = PdbxPersist(self.__verbose, self.__lfh)
-            myPersist.setContainerList(myReader.getContainerList())
+            myPersist.setContainerList(containerList)
 
             if self.__verbose:
-                self.__lfh.write("Read completed for %d definitions\n" % len(pathList))
+                self.__lfh.write(
+                    "Read completed for %d definitions (%d failures)\n" % (len(pathList), len(self.__failedPathList))
+                )
 
-            tmpPath = storePath + "-tmpstore"
             myPersist.store(dbFileName=tmpPath)
-            if self.__getFileSize(tmpPath) > minSize:
-                ok = True
-                myPersist.moveStore(tmpPath, storePath)
+            self.__containerCount = len(containerList)
+            if self.__getStoreSize(tmpPath) > minSize:
+                ok = self.__moveStore(tmpPath, storePath)
                 #
                 # if (self.__debug):
                 #   indexD = myPersist.getIndex(dbFileName=storePath)
             else:
                 ok = False
+            if ok:
+                manifestD = {pth: self.__getFileInfo(pth, [c.getName() for c in cList]) for pth, cList in readList}
+                ok = self.__writeManifest(manifestD, storePath)
             return ok
         except:  # noqa: E722 pylint: disable=bare-except
             if self.__debug:
                 traceback.print_exc(file=self.__lfh)
             return False
+        finally:
+            self.__removeStore(tmpPath)
 
-    def __updateStoreByFile(self, pathList, storePath="chemcomp.db"):
-        """Internal method to update the persistant store with the contents of the input list of
-        chemical component definition files.
-        """
+    @staticmethod
+    def __getFileDigest(fPath, blockSize=1048576):
+        sha = hashlib.sha256()
+        with open(fPath, "rb") as ifh:
+            for block in iter(lambda: ifh.read(blockSize), b""):
+                sha.update(block)
+        return sha.hexdigest()
+
+    def __getFileInfo(self, fPath, containerNameList=None, digest=None):
+        """Return the manifest entry {"size", "mtime", "digest", "containerNameList"} for the input file."""
+        st = os.stat(fPath)
+        return {
+            "size": st.st_size,
+            "mtime": st.st_mtime,
+            "digest": digest if digest is not None else self.__getFileDigest(fPath),
+            "containerNameList": containerNameList if containerNameList is not None else [],
+        }
+
+    def __readManifest(self, storePath):
+        """Return the definition file manifest of the input store or None if it cannot be read."""
         try:
-            myReader = PdbxIoAdapter(self.__verbose, self.__lfh)
-            for rPath in pathList:
-                _ok = myReader.read(pdbxFilePath=rPath)  # noqa: F841
+            with open(self.getManifestPath(storePath), "rb") as fin:
+                return pickle.load(fin)  # noqa: S301
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return None
+
+    def __removeManifest(self, storePath):
+        manifestPath = self.getManifestPath(storePath)
+        if os.path.exists(manifestPath):
+            os.remove(manifestPath)
+
+    def __updateManifest(self, storePath, readList):
+        """Record the files in readList [(path, container list), ...] in an existing store manifest.
 
-                myPersist = PdbxPersist(self.__verbose, self.__lfh)
-                myPersist.updateContainerList(dbFileName=storePath, containerList=myReader.getContainerList())
+        Files whose containers have been superseded by the update are marked to be read again
+        by the next synchronization.
+        """
+        manifestD = self.__readManifest(storePath)
+        if manifestD is None:
+            return True
+        ownerD = {}
+        for pth, d in manifestD.items():
+            for name in d["containerNameList"]:
+                ownerD.setdefault(name, []).append(pth)
+        for pth, cList in readList:
+            nameList = [container.getName() for container in cList]
+            for name in nameList:
+                for oPth in ownerD.get(name, []):
+                    if oPth != pth and oPth in manifestD:
+                        manifestD[oPth] = dict(manifestD[oPth], size=-1, digest=None)
+                ownerD[name] = [pth]
+            manifestD[pth] = self.__getFileInfo(pth, nameList)
+        return self.__writeManifest(manifestD, storePath)
+
+    def __writeManifest(self, manifestD, storePath):
+        try:
+            manifestPath = self.getManifestPath(storePath)
+            tmpPath = manifestPath + "-tmp"
+            with open(tmpPath, "wb") as fout:
+                pickle.dump(manifestD, fout, 2)
+            os.replace(tmpPath, manifestPath)
             return True
         except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write("PdbxChemCompDictUtil(__writeManifest) manifest write failed for %s\n" % storePath)
             if self.__debug:
                 traceback.print_exc(file=self.__lfh)
             return False
 
+    def __syncStoreFromPathList(self, pathList, storePath="chemcomp.db", numProc=1):
+        """Internal method to apply the new, changed and removed definition files in the input
+        path list to the persistent store.  Returns the dictionary of file counts or None on failure.
+        """
+        try:
+            countD = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0, "failed": 0}
+            oldManifestD = self.__readManifest(storePath)
+            if oldManifestD is None or self.__getStoreSize(storePath) == 0:
+                if self.__verbose:
+                    self.__lfh.write("PdbxChemCompDictUtil(__syncStoreFromPathList) full build of %s\n" % storePath)
+                if not self.__makeStoreFromPathList(pathList, storePath=storePath, numProc=numProc):
+                    return None
+                countD["failed"] = len(self.__failedPathList)
+                countD["added"] = len(pathList) - countD["failed"]
+                return countD
+
+            manifestD = {}
+            readPathList = []
+            digestD = {}
+            for pth in pathList:
+                d = oldManifestD.get(pth)
+                try:
+                    st = os.stat(pth)
+                except OSError:
+                    # reported as a read failure
+                    readPathList.append(pth)
+                    continue
+                if d is not None and d["size"] == st.st_size and d["mtime"] == st.st_mtime:
+                    manifestD[pth] = d
+                    countD["unchanged"] += 1
+                    continue
+                digest = self.__getFileDigest(pth)
+                if d is not None and d["digest"] == digest:
+                    # touched but not modified -- refresh the file status only
+                    manifestD[pth] = self.__getFileInfo(pth, d["containerNameList"], digest=digest)
+                    countD["unchanged"] += 1
+                    continue
+                readPathList.append(pth)
+                digestD[pth] = digest
+
+            containerD = {}
+            for pth, cList in self.__readPathList(readPathList, numProc=numProc):
+                countD["changed" if pth in oldManifestD else "added"] += 1
+                manifestD[pth] = self.__getFileInfo(pth, [c.getName() for c in cList], digest=digestD.get(pth))
+                for container in cList:
+                    containerD[container.getName()] = container
+            # files which cannot be read are dropped from the store as in a full build
+            countD["failed"] = len(self.__failedPathList)
+
+            removedPathList = [pth for pth in oldManifestD if pth not in manifestD]
+            countD["removed"] = len(removedPathList)
+            # containers of removed files and containers dropped from changed files, unless still provided by another file
+            keepNameS = {name for d in manifestD.values() for name in d["containerNameList"]}
+            removeNameList = []
+            for pth in removedPathList + [pth for pth in readPathList if pth in oldManifestD and pth in manifestD]:
+                removeNameList.extend(name for name in oldManifestD[pth]["containerNameList"] if name not in keepNameS)
+
+            if containerD or removeNameList:
+                myEditor = PdbxChemCompStoreEditor(self.__verbose, self.__lfh)
+                if myEditor.update(storePath, list(containerD.values()), removeNameList) is None:
+                    return None
+            if not self.__writeManifest(manifestD, storePath):
+                return None
+            myReader = PdbxChemCompStoreReader(self.__verbose, self.__lfh)
+            if myReader.open(storePath):
+                self.__containerCount = len(myReader.getStoreContainerIndex())
+                myReader.close()
+            if self.__verbose:
+                self.__lfh.write("PdbxChemCompDictUtil(__syncStoreFromPathList) store %s %r\n" % (storePath, countD))
+            return countD
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompDictUtil(__syncStoreFromPathList) synchronization failed for %s\n" % storePath
+                )
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return None
+
+    def __updateStoreByFile(self, pathList, storePath="chemcomp.db", numProc=1):
+        """Internal method to update the persistant store with the contents of the input list of
+        chemical component definition files in a single batched update.
+
+        Returns the per-container summary dictionary or None if the store cannot be read.
+        """
+        try:
+            containerD = {}
+            summaryD = {}
+            readList = self.__readPathList(pathList, numProc=numProc)
+            for pth, cList in readList:
+                for container in cList:
+                    name = container.getName()
+                    if name in summaryD:
+                        summaryD[name]["supersededPathList"].append(summaryD[name]["path"])
+                        summaryD[name]["path"] = pth
+                    else:
+                        summaryD[name] = {"status": None, "path": pth, "supersededPathList": []}
+                    containerD[name] = container
+
+            myEditor = PdbxChemCompStoreEditor(self.__verbose, self.__lfh)
+            retD = myEditor.update(storePath, containerList=list(containerD.values()))
+            if retD is None:
+                return None
+            replacedS = set(retD["replaced"])
+            for name, d in summaryD.items():
+                d["status"] = "updated" if name in replacedS else "added"
+            self.__updateManifest(storePath, readList)
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompDictUtil(__updateStoreByFile) store %s files %d containers %d duplicates %d failed %d\n"
+                    % (
+                        storePath,
+                        len(pathList),
+                        len(summaryD),
+                        sum(len(d["supersededPathList"]) for d in summaryD.values()),
+                        len(self.__failedPathList),
+                    )
+                )
+            return summaryD
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return None
+
     def __updateStoreByObject(self, inpObject, containerName=None, containerType="data", storePath="chemcomp.db"):
         """Internal method to update the persistant store with the contents of the input object in the input named container."""
         try:
@@ -0,0 +1,108 @@
+##
+# File: PdbxChemCompInChIKeyIndex.py
+# Date: 18-Oct-2026
+#
+# Update:
+#  18-Oct-2026     strip the InChIKey= prefix without str.removeprefix()
+##
+"""
+Reverse lookup of chemical components by InChIKey and by the 14 character
+connectivity layer of the InChIKey (InChIKey14).
+
+The index is derived from the search index produced by PdbxChemCompDictIndex and
+is stored as a pickled dictionary alongside it.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import sys
+import traceback
+
+try:
+    import cPickle as pickle  # type: ignore[import-not-found]  # noqa: S301,N813,S403
+except ImportError:
+    import pickle  # noqa: S301,S403
+
+
+class PdbxChemCompInChIKeyIndex:
+    """Builds, reads and searches reverse maps InChIKey -> [ccId] and InChIKey14 -> [ccId].
+
+    The index is a dictionary {"InChIKey": {key: [ccId, ...]}, "InChIKey14": {key: [ccId, ...]}}
+    with component identifiers listed in search index order.
+    """
+
+    _keyTypeList = ("InChIKey", "InChIKey14")
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        self.__verbose = verbose
+        self.__debug = False
+        self.__lfh = log
+
+    def makeIndex(self, ccIdx, indexPath="chemcomp-inchikey-index.pic"):
+        """Create the reverse InChIKey maps from the search index ccIdx and store them in indexPath.
+
+        Returns the index or {} on failure.
+        """
+        keyD = {keyType: {} for keyType in self._keyTypeList}
+        try:
+            for ccId, d in ccIdx.items():
+                for keyType in self._keyTypeList:
+                    ky = d.get(keyType)
+                    if ky:
+                        keyD[keyType].setdefault(ky, []).append(ccId)
+            tmpPath = indexPath + "-tmp"
+            with open(tmpPath, "wb") as fout:
+                # Maintain backwards compatibility with python 2
+                pickle.dump(keyD, fout, 2)
+            os.replace(tmpPath, indexPath)
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompInChIKeyIndex(makeIndex) InChIKey count %d InChIKey14 count %d\n"
+                    % (len(keyD["InChIKey"]), len(keyD["InChIKey14"]))
+                )
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write("PdbxChemCompInChIKeyIndex(makeIndex) index creation failed for %s\n" % indexPath)
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return {}
+        return keyD
+
+    def readIndex(self, indexPath="chemcomp-inchikey-index.pic"):
+        """Read and return the reverse InChIKey index or {} on failure."""
+        try:
+            with open(indexPath, "rb") as fin:
+                return pickle.load(fin)  # noqa: S301
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return {}
+
+    @staticmethod
+    def lookup(keyD, keyList, keyType=None):
+        """Return a dictionary of matching component identifier lists for each key in keyList.
+
+        keyType is 'InChIKey' or 'InChIKey14'.  If keyType is None it is chosen per key:
+        14 character keys are matched against InChIKey14 and all others against InChIKey.
+        Any 'InChIKey=' prefix is ignored.  Keys without a match map to [].
+        """
+        retD = {}
+        for ky in keyList:
+            # str.removeprefix() requires Python 3.9
+            sKy = ky[len("InChIKey=") :] if ky.startswith("InChIKey=") else ky  # noqa: FURB188
+            kT = keyType if keyType is not None else ("InChIKey14" if len(sKy) == 14 else "InChIKey")
+            retD[ky] = list(keyD.get(kT, {}).get(sKy, []))
+        return retD
+
+    @staticmethod
+    def getDuplicateGroups(keyD, keyType="InChIKey14"):
+        """Return a dictionary of the keys of type keyType shared by more than one component
+        (e.g. stereo variants or tautomers) and their component identifier lists.
+        """
+        return {ky: list(ccIdL) for ky, ccIdL in keyD.get(keyType, {}).items() if len(ccIdL) > 1}
@@ -0,0 +1,178 @@
+##
+# File: PdbxChemCompLineageIndex.py
+# Date: 18-Oct-2026
+#
+# Update:
+#
+##
+"""
+Transitive closure of the parent/child and subcomponent links between chemical components
+stored in compressed sparse row (CSR) form with batch lineage queries.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import shutil
+import sys
+import traceback
+
+import numpy as np
+
+
+class PdbxChemCompLineageIndex:
+    """Builds, reads and queries the component lineage closure.
+
+    The input is a dictionary of direct links {ccId: [parent ccId, ...]}, such as the index
+    of PdbxChemCompLineageIndexer or the child dictionary of the parent component index.
+    Each relation is stored as a pair of arrays: <relation>Ptr (int64, length n+1) and
+    <relation>Idx (int32) such that the ordinals related to component ordinal i are
+    <relation>Idx[<relation>Ptr[i]:<relation>Ptr[i+1]].  Relations are:
+
+        parent       direct links
+        ancestor     all components reachable through links, nearest first
+        descendant   all components from which the component is reachable, in ordinal order
+
+    Component identifiers are stored sorted in ccId.npy.  Link cycles are tolerated and a
+    component is never its own ancestor.  Arrays are memory-mapped on reading.
+    """
+
+    _relationList = ("parent", "ancestor", "descendant")
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        self.__verbose = verbose
+        self.__debug = False
+        self.__lfh = log
+
+    @staticmethod
+    def __toCsr(listL):
+        ptrA = np.zeros(len(listL) + 1, dtype=np.int64)
+        ptrA[1:] = np.cumsum([len(tL) for tL in listL])
+        idxA = np.fromiter((ii for tL in listL for ii in tL), dtype=np.int32, count=int(ptrA[-1]))
+        return ptrA, idxA
+
+    def makeIndex(self, linkD, indexPath="chemcomp-lineage-index"):
+        """Compute the lineage closure of the links in linkD and store it in the directory indexPath.
+
+        Returns the number of components in the lineage index or 0 on failure.
+        """
+        try:
+            ccIdList = sorted(set(linkD) | {pId for pL in linkD.values() for pId in pL})
+            posD = {ccId: ii for ii, ccId in enumerate(ccIdList)}
+            parentL = [[] for _ in ccIdList]
+            for ccId, pL in linkD.items():
+                parentL[posD[ccId]] = [posD[pId] for pId in pL]
+            ancestorL = []
+            descendantL = [[] for _ in ccIdList]
+            for ii in range(len(ccIdList)):
+                # breadth first so that the nearest ancestors are listed first
+                seenS = {ii}
+                aL = []
+                queue = list(parentL[ii])
+                while queue:
+                    nextL = []
+                    for jj in queue:
+                        if jj not in seenS:
+                            seenS.add(jj)
+                            aL.append(jj)
+                            nextL.extend(parentL[jj])
+                    queue = nextL
+                ancestorL.append(aL)
+                for jj in aL:
+                    descendantL[jj].append(ii)
+            tmpPath = indexPath + "-tmp"
+            if os.path.exists(tmpPath):
+                shutil.rmtree(tmpPath)
+            os.makedirs(tmpPath)
+            np.save(os.path.join(tmpPath, "ccId.npy"), np.asarray(ccIdList, dtype=str), allow_pickle=False)
+            for relation, listL in zip(self._relationList, (parentL, ancestorL, descendantL)):
+                ptrA, idxA = self.__toCsr(listL)
+                np.save(os.path.join(tmpPath, relation + "Ptr.npy"), ptrA, allow_pickle=False)
+                np.save(os.path.join(tmpPath, relation + "Idx.npy"), idxA, allow_pickle=False)
+            if os.path.exists(indexPath):
+                shutil.rmtree(indexPath)
+            os.rename(tmpPath, indexPath)
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompLineageIndex(makeIndex) components %d ancestor links %d\n"
+                    % (len(ccIdList), sum(len(aL) for aL in ancestorL))
+                )
+            return len(ccIdList)
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write("PdbxChemCompLineageIndex(makeIndex) index creation failed for %s\n" % indexPath)
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+        return 0
+
+    def readIndex(self, indexPath="chemcomp-lineage-index", mmapMode="r"):
+        """Return the lineage index as a dictionary of arrays (memory-mapped unless mmapMode is None) or {}."""
+        indexD = {}
+        try:
+            for name in ["ccId"] + [relation + sfx for relation in self._relationList for sfx in ("Ptr", "Idx")]:
+                indexD[name] = np.load(os.path.join(indexPath, name + ".npy"), mmap_mode=mmapMode, allow_pickle=False)
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return {}
+        return indexD
+
+    @staticmethod
+    def __getOrdinals(indexD, ccIdList):
+        """Return the ordinals of the input components (-1 for components without lineage)."""
+        ccIdA = indexD["ccId"]
+        if len(ccIdA) == 0:
+            return np.full(len(ccIdList), -1, dtype=np.int64)
+        qA = np.asarray(ccIdList, dtype=str)
+        posA = np.minimum(np.searchsorted(ccIdA, qA), len(ccIdA) - 1)
+        return np.where(ccIdA[posA] == qA, posA, -1)
+
+    @classmethod
+    def getRelated(cls, indexD, ccIdList, relation="ancestor"):
+        """Return a dictionary of related component identifier lists for each component in ccIdList.
+
+        relation is one of 'parent', 'ancestor' or 'descendant'.  Components without lineage map to [].
+        """
+        if relation not in cls._relationList:
+            raise ValueError("Unsupported lineage relation %r" % relation)
+        ccIdA = indexD["ccId"]
+        ptrA = indexD[relation + "Ptr"]
+        idxA = indexD[relation + "Idx"]
+        retD = {}
+        for ccId, pos in zip(ccIdList, cls.__getOrdinals(indexD, ccIdList)):
+            retD[ccId] = [] if pos < 0 else [str(tId) for tId in ccIdA[idxA[ptrA[pos] : ptrA[pos + 1]]]]
+        return retD
+
+    @classmethod
+    def getAncestors(cls, indexD, ccIdList):
+        return cls.getRelated(indexD, ccIdList, relation="ancestor")
+
+    @classmethod
+    def getDescendants(cls, indexD, ccIdList):
+        return cls.getRelated(indexD, ccIdList, relation="descendant")
+
+    @classmethod
+    def getRoots(cls, indexD, ccIdList):
+        """Return a dictionary of the ancestors without parents (e.g. the standard residues) of each component in ccIdList."""
+        ptrA = indexD["parentPtr"]
+        noParentA = ptrA[1:] == ptrA[:-1]
+        ccIdA = indexD["ccId"]
+        retD = {}
+        for ccId, pos in zip(ccIdList, cls.__getOrdinals(indexD, ccIdList)):
+            if pos < 0:
+                retD[ccId] = []
+                continue
+            aA = indexD["ancestorIdx"][indexD["ancestorPtr"][pos] : indexD["ancestorPtr"][pos + 1]]
+            retD[ccId] = [str(tId) for tId in ccIdA[aA[noParentA[aA]]]]
+        return retD
+
+    @classmethod
+    def getLineage(cls, indexD, ccIdList):
+        """Return {ccId: {'parent': [...], 'ancestor': [...], 'descendant': [...]}} for each component in ccIdList."""
+        relD = {relation: cls.getRelated(indexD, ccIdList, relation) for relation in cls._relationList}
+        return {ccId: {relation: relD[relation][ccId] for relation in cls._relationList} for ccId in ccIdList}
@@ -0,0 +1,148 @@
+##
+# File: PdbxChemCompMappedIndex.py
+# Date: 18-Oct-2026
+#
+# Update:
+#
+##
+"""
+Memory-mapped on-disk format for the chemical component search index.
+
+File layout (all integers little-endian uint64):
+
+    header      magic (8 bytes), entry count n, key blob length, record blob length
+    keyOffset   (n+1) offsets of the sorted component identifiers in the key blob
+    recOffset   (n+1) offsets of the entry records in the record blob
+    order       (n)   position in sorted order of each entry in the original index order
+    keyBlob     concatenated UTF-8 component identifiers in sorted order
+    recBlob     concatenated pickled entry records in sorted identifier order
+
+Entries are decoded only when accessed, and forked processes that read the same
+file share its pages.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+
+try:
+    import cPickle as pickle  # type: ignore[import-not-found]  # noqa: S301,N813,S403
+except ImportError:
+    import pickle  # noqa: S301,S403
+
+import numpy as np
+
+
+class PdbxChemCompMappedIndex(Mapping):
+    """Read-only Mapping over a memory-mapped index file written by write().
+
+    May be used in place of the dictionary returned by PdbxChemCompDictIndex.readIndex().
+    Iteration follows the order of the index that was written.
+    """
+
+    _magic = b"CCIDX001"
+    _headerFormat = "<8sQQQ"
+
+    def __init__(self, indexPath):
+        self.__fh = open(indexPath, "rb")  # noqa: SIM115 pylint: disable=consider-using-with
+        self.__mm = mmap.mmap(self.__fh.fileno(), 0, access=mmap.ACCESS_READ)
+        hdrLen = struct.calcsize(self._headerFormat)
+        magic, n, keyLen, _ = struct.unpack_from(self._headerFormat, self.__mm, 0)
+        if magic != self._magic:
+            self.close()
+            raise ValueError("Not a mapped chemical component index file %s" % indexPath)
+        self.__n = n
+        offset = hdrLen
+        self.__keyOffsets = np.frombuffer(self.__mm, dtype="<u8", count=n + 1, offset=offset)
+        offset += 8 * (n + 1)
+        self.__recOffsets = np.frombuffer(self.__mm, dtype="<u8", count=n + 1, offset=offset)
+        offset += 8 * (n + 1)
+        self.__order = np.frombuffer(self.__mm, dtype="<u8", count=n, offset=offset)
+        offset += 8 * n
+        self.__keyStart = offset
+        self.__recStart = offset + keyLen
+
+    @classmethod
+    def write(cls, indexD, indexPath):
+        """Write the dictionary indexD to indexPath in the mapped format.  Returns the number of entries."""
+        keyL = list(indexD.keys())
+        sortedL = sorted(keyL)
+        posD = {ky: ii for ii, ky in enumerate(sortedL)}
+        keyBL = [ky.encode("utf-8") for ky in sortedL]
+        recBL = [pickle.dumps(indexD[ky], 2) for ky in sortedL]
+        keyOffsets = np.zeros(len(keyL) + 1, dtype="<u8")
+        keyOffsets[1:] = np.cumsum([len(b) for b in keyBL])
+        recOffsets = np.zeros(len(keyL) + 1, dtype="<u8")
+        recOffsets[1:] = np.cumsum([len(b) for b in recBL])
+        order = np.asarray([posD[ky] for ky in keyL], dtype="<u8")
+        tmpPath = indexPath + "-tmp"
+        with open(tmpPath, "wb") as fout:
+            fout.write(struct.pack(cls._headerFormat, cls._magic, len(keyL), int(keyOffsets[-1]), int(recOffsets[-1])))
+            fout.write(keyOffsets.tobytes())
+            fout.write(recOffsets.tobytes())
+            fout.write(order.tobytes())
+            fout.writelines(keyBL)
+            fout.writelines(recBL)
+        os.replace(tmpPath, indexPath)
+        return len(keyL)
+
+    def close(self):
+        if self.__mm is not None:
+            # release buffer views before closing the map
+            self.__keyOffsets = self.__recOffsets = self.__order = None
+            self.__mm.close()
+            self.__mm = None
+            self.__fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getKey(self, ii):
+        st = self.__keyStart
+        return self.__mm[st + int(self.__keyOffsets[ii]) : st + int(self.__keyOffsets[ii + 1])].decode("utf-8")
+
+    def __find(self, key):
+        """Return the sorted position of key or -1."""
+        lo, hi = 0, self.__n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.__getKey(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.__n and self.__getKey(lo) == key:
+            return lo
+        return -1
+
+    def __getRecord(self, ii):
+        st = self.__recStart
+        return pickle.loads(self.__mm[st + int(self.__recOffsets[ii]) : st + int(self.__recOffsets[ii + 1])])  # noqa: S301
+
+    def __getitem__(self, key):
+        if not isinstance(key, str):
+            raise KeyError(key)
+        ii = self.__find(key)
+        if ii < 0:
+            raise KeyError(key)
+        return self.__getRecord(ii)
+
+    def __contains__(self, key):
+        return isinstance(key, str) and self.__find(key) >= 0
+
+    def __len__(self):
+        return self.__n
+
+    def __iter__(self):
+        for ii in self.__order:
+            yield self.__getKey(int(ii))
@@ -0,0 +1,256 @@
+##
+# File: PdbxChemCompNameIndex.py
+# Date: 18-Oct-2026
+#
+# Update:
+#  18-Oct-2026     match short substring queries through the trigram keys containing the query
+##
+"""
+Inverted index of normalized tokens and character trigrams over component names,
+synonyms and systematic identifiers (the search index nameList) supporting exact,
+prefix, substring and fuzzy name search.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import bisect
+import os
+import re
+import sys
+import traceback
+
+try:
+    import cPickle as pickle  # type: ignore[import-not-found]  # noqa: S301,N813,S403
+except ImportError:
+    import pickle  # noqa: S301,S403
+
+import numpy as np
+
+_NON_ALNUM = re.compile(r"[^0-9A-Z]+")
+
+
+class PdbxChemCompNameIndex:
+    """Builds, reads and searches an inverted name index.
+
+    Index content:
+
+        ccIdList     component identifiers; the position in this list is the component ordinal
+        nameList     normalized names for each component ordinal
+        tokenD       token   -> sorted uint32 array of component ordinals
+        trigramD     trigram -> sorted uint32 array of component ordinals
+        tokenList    sorted tokens (for prefix search)
+
+    Names are normalized to upper case with runs of non-alphanumeric characters replaced
+    by a single space.
+    """
+
+    _modeList = ("exact", "prefix", "substring", "fuzzy")
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        self.__verbose = verbose
+        self.__debug = False
+        self.__lfh = log
+
+    @staticmethod
+    def normalize(name):
+        return _NON_ALNUM.sub(" ", str(name).upper()).strip()
+
+    @staticmethod
+    def getTrigrams(normName):
+        """Return the set of character trigrams of a normalized name padded with a leading and trailing space."""
+        s = " " + normName + " "
+        return {s[ii : ii + 3] for ii in range(len(s) - 2)}
+
+    def makeIndex(self, ccIdx, indexPath="chemcomp-name-index.pic"):
+        """Create the inverted name index from the search index ccIdx and store it in indexPath.
+
+        Returns the index or {} on failure.
+        """
+        try:
+            ccIdList = []
+            nameList = []
+            tokenD = {}
+            trigramD = {}
+            for ordinal, (ccId, d) in enumerate(ccIdx.items()):
+                ccIdList.append(ccId)
+                normL = []
+                for name in d.get("nameList", []):
+                    if name is None:
+                        continue
+                    normName = self.normalize(name)
+                    if normName and normName not in normL:
+                        normL.append(normName)
+                nameList.append(normL)
+                tokS = set()
+                triS = set()
+                for normName in normL:
+                    tokS.update(normName.split())
+                    triS.update(self.getTrigrams(normName))
+                for tok in tokS:
+                    tokenD.setdefault(tok, []).append(ordinal)
+                for tri in triS:
+                    trigramD.setdefault(tri, []).append(ordinal)
+            indexD = {
+                "ccIdList": ccIdList,
+                "nameList": nameList,
+                "tokenD": {ky: np.asarray(v, dtype=np.uint32) for ky, v in tokenD.items()},
+                "trigramD": {ky: np.asarray(v, dtype=np.uint32) for ky, v in trigramD.items()},
+                "tokenList": sorted(tokenD),
+            }
+            tmpPath = indexPath + "-tmp"
+            with open(tmpPath, "wb") as fout:
+                pickle.dump(indexD, fout, 2)
+            os.replace(tmpPath, indexPath)
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompNameIndex(makeIndex) components %d tokens %d trigrams %d\n"
+                    % (len(ccIdList), len(tokenD), len(trigramD))
+                )
+            return indexD
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write("PdbxChemCompNameIndex(makeIndex) index creation failed for %s\n" % indexPath)
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+        return {}
+
+    def readIndex(self, indexPath="chemcomp-name-index.pic"):
+        """Read and return the inverted name index or {} on failure."""
+        try:
+            with open(indexPath, "rb") as fin:
+                return pickle.load(fin)  # noqa: S301
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return {}
+
+    @classmethod
+    def search(cls, indexD, query, mode="prefix", maxHits=20, minScore=0.3):
+        """Search the component names in indexD and return a ranked list of (ccId, score, name).
+
+        Modes:
+
+            exact      a normalized name equals the normalized query
+            prefix     a name contains all query tokens, the last of which may be incomplete
+                       (type-ahead)
+            substring  a name contains the normalized query
+            fuzzy      trigram similarity of the best matching name is at least minScore
+
+        Scores lie in (0, 1]; for exact, prefix and substring matches names that start with
+        the query and shorter names rank higher.  Ties are broken by index order.
+        """
+        if mode not in cls._modeList:
+            raise ValueError("Unsupported name search mode %r" % mode)
+        nQuery = cls.normalize(query)
+        if not nQuery or not indexD:
+            return []
+        if mode == "fuzzy":
+            hitL = cls.__fuzzySearch(indexD, nQuery, minScore)
+        else:
+            candA = cls.__getCandidates(indexD, nQuery, mode)
+            hitL = []
+            for ordinal in candA:
+                bestScore, bestName = -1.0, None
+                for normName in indexD["nameList"][ordinal]:
+                    if not cls.__isMatch(normName, nQuery, mode):
+                        continue
+                    score = float(len(nQuery)) / len(normName)
+                    if not normName.startswith(nQuery):
+                        score *= 0.5
+                    if score > bestScore:
+                        bestScore, bestName = score, normName
+                if bestName is not None:
+                    hitL.append((bestScore, int(ordinal), bestName))
+        hitL.sort(key=lambda t: (-t[0], t[1]))
+        ccIdList = indexD["ccIdList"]
+        return [(ccIdList[ordinal], score, name) for score, ordinal, name in hitL[:maxHits]]
+
+    @staticmethod
+    def __isMatch(normName, nQuery, mode):
+        if mode == "exact":
+            return normName == nQuery
+        if mode == "substring":
+            return nQuery in normName
+        # prefix -- all complete query tokens are name tokens and the last is a token prefix
+        qTokL = nQuery.split()
+        nTokL = normName.split()
+        nTokS = set(nTokL)
+        if any(tok not in nTokS for tok in qTokL[:-1]):
+            return False
+        return any(tok.startswith(qTokL[-1]) for tok in nTokL)
+
+    @classmethod
+    def __getCandidates(cls, indexD, nQuery, mode):
+        """Return the sorted ordinals of the components which may match the query."""
+        empty = np.zeros(0, dtype=np.uint32)
+        if mode == "substring":
+            postL = [indexD["trigramD"].get(tri, empty) for tri in cls.getTrigrams(nQuery) - cls.__edgeTrigrams(nQuery)]
+            if not postL:
+                # queries of one or two characters have no interior trigrams but lie within
+                # at least one (padded) trigram of every name containing them
+                postL = [postA for tri, postA in indexD["trigramD"].items() if nQuery in tri]
+                if not postL:
+                    return empty
+                return np.unique(np.concatenate(postL))
+        else:
+            qTokL = nQuery.split()
+            postL = [indexD["tokenD"].get(tok, empty) for tok in qTokL[:-1]]
+            if mode == "exact":
+                postL.append(indexD["tokenD"].get(qTokL[-1], empty))
+            else:
+                postL.append(cls.__getPrefixPostings(indexD, qTokL[-1]))
+        postL.sort(key=len)
+        candA = postL[0]
+        for postA in postL[1:]:
+            if len(candA) == 0:
+                break
+            candA = np.intersect1d(candA, postA, assume_unique=True)
+        return candA
+
+    @staticmethod
+    def __getPrefixPostings(indexD, prefix):
+        """Return the union of the postings of all tokens starting with prefix."""
+        tokenList = indexD["tokenList"]
+        lo = bisect.bisect_left(tokenList, prefix)
+        postL = []
+        for ii in range(lo, len(tokenList)):
+            if not tokenList[ii].startswith(prefix):
+                break
+            postL.append(indexD["tokenD"][tokenList[ii]])
+        if not postL:
+            return np.zeros(0, dtype=np.uint32)
+        return np.unique(np.concatenate(postL))
+
+    @staticmethod
+    def __edgeTrigrams(nQuery):
+        # trigrams including the padding are only required at name boundaries
+        s = " " + nQuery + " "
+        return {s[:3], s[-3:]}
+
+    @classmethod
+    def __fuzzySearch(cls, indexD, nQuery, minScore):
+        """Return (score, ordinal, name) for names whose trigram Jaccard similarity to the query is at least minScore."""
+        qTriS = cls.getTrigrams(nQuery)
+        postL = [indexD["trigramD"][tri] for tri in qTriS if tri in indexD["trigramD"]]
+        if not postL:
+            return []
+        ordA, countA = np.unique(np.concatenate(postL), return_counts=True)
+        # a similarity of minScore requires at least this many shared trigrams
+        minShared = max(1, int(np.ceil(minScore * len(qTriS))))
+        hitL = []
+        for ordinal in ordA[countA >= minShared]:
+            bestScore, bestName = -1.0, None
+            for normName in indexD["nameList"][ordinal]:
+                nTriS = cls.getTrigrams(normName)
+                nShared = len(qTriS & nTriS)
+                score = float(nShared) / (len(qTriS) + len(nTriS) - nShared)
+                if score >= minScore and score > bestScore:
+                    bestScore, bestName = score, normName
+            if bestName is not None:
+                hitL.append((bestScore, int(ordinal), bestName))
+        return hitL
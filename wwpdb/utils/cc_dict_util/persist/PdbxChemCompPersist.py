@@ -6,6 +6,13 @@
 #  21-Feb-2012 jdw adapted for chemcomputil repository
 #  23-Feb-2012 jdw adapted for cc_dict_util repository
 #   1-Feb-2017 jdw update imports to pdbx_v2
+#  18-Oct-2026     compile attribute column positions once per distinct schema
+#  18-Oct-2026     add bulk NumPy coordinate extraction to PdbxChemCompAtomIt
+#  18-Oct-2026     use precomputed element lookup tables in getAtNo() and getIsotope()
+#  18-Oct-2026     add row filter and attribute projection options to category iterators
+#  18-Oct-2026     add frozen row mode and materialize() to category iterators
+#  18-Oct-2026     add len(), indexing, slicing, chunks() and window() to category iterators
+#  18-Oct-2026     move the value conversion helpers to PdbxChemCompValueConversion
 ##
 """
 A collection of access and iterator classes supporting chemical component dictionary data
@@ -19,18 +26,106 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Creative Commons Attribution 3.0 Unported"
 __version__ = "V0.01"
 
+import copy
 import sys
+from itertools import islice
+from typing import ClassVar
+
+import numpy as np
 
 # import traceback
 from wwpdb.utils.cc_dict_util.persist.PdbxChemCompConstants import PdbxChemCompConstants
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompValueConversion import toFloatArray
 
 
-class PdbxCategoryItBase:
-    """Base category iterator class."""
+def _identity(row):
+    return row
 
-    def __init__(self, dataCategory, func, verbose=True, log=sys.stderr):  # noqa: ARG002 pylint: disable=unused-argument
-        self.__rL = dataCategory.getRowList()
-        self.__func = func
+
+class PdbxCategoryItBase:
+    """Base category iterator class.
+
+    func is either a callable applied to each raw row or a row accessor class
+    which is bound once to the (projected) attribute list of the category.
+
+    Optional arguments:
+
+        rowFilter   list of (attributeName, op, value) conditions which must all be satisfied.
+                    Supported operators are 'eq', 'in' (value is a collection), 'prefix' and
+                    'contains'.  Conditions are evaluated on the raw rows before any accessor
+                    is bound.
+        selectList  list of attribute names to project.  Undefined attributes are projected
+                    as None.
+        asTuple     return rows as plain tuples rather than accessor objects.
+        frozen      yield a separate read-only accessor for each row rather than rebinding a
+                    single shared accessor.  Frozen accessors share the underlying row data
+                    (no copies are made) and may be retained or passed between threads.
+    """
+
+    _filterOpList = ("eq", "in", "prefix", "contains")
+
+    def __init__(
+        self,
+        dataCategory,
+        func,
+        verbose=True,
+        log=sys.stderr,
+        rowFilter=None,
+        selectList=None,
+        asTuple=False,
+        frozen=False,
+    ):
+        rL = dataCategory.getRowList()
+        aL = dataCategory.getAttributeList()
+        if rowFilter:
+            rL = self.__filterRows(rL, aL, rowFilter)
+        if selectList is not None:
+            rL, aL = self.__projectRows(rL, aL, selectList)
+        self.__rL = rL
+        self.__aL = aL
+        if asTuple:
+            self.__func = self.__recordFunc = _identity if selectList is not None else tuple
+        elif isinstance(func, type) and issubclass(func, PdbxRowAccessorBase):
+            indexD = PdbxAttributeIndex.get(aL).getIndexDict()
+            self.__recordFunc = lambda row: func.makeFrozen(row, indexD)
+            if frozen:
+                self.__func = self.__recordFunc
+            else:
+                self.__func = func([], attributeNameList=aL, verbose=verbose, log=log).set
+        else:
+            self.__func = self.__recordFunc = func
+
+    def __filterRows(self, rowList, attributeNameList, rowFilter):
+        """Return the rows satisfying all of the input conditions."""
+        aIdx = PdbxAttributeIndex.get(attributeNameList)
+        testL = []
+        for name, op, value in rowFilter:
+            if op not in self._filterOpList:
+                raise ValueError("Unsupported row filter operator %r" % op)
+            i = aIdx.index(name)
+            if i is None:
+                return []
+            if op == "eq":
+                testL.append(lambda row, i=i, v=value: row[i] == v)
+            elif op == "in":
+                testL.append(lambda row, i=i, vS=frozenset(value): row[i] in vS)
+            elif op == "prefix":
+                testL.append(lambda row, i=i, v=value: row[i].startswith(v))
+            else:
+                testL.append(lambda row, i=i, v=value: v in row[i])
+        if len(testL) == 1:
+            test = testL[0]
+            return [row for row in rowList if test(row)]
+        return [row for row in rowList if all(test(row) for test in testL)]
+
+    @staticmethod
+    def __projectRows(rowList, attributeNameList, selectList):
+        """Return the rows projected onto the input attribute list as tuples."""
+        aIdx = PdbxAttributeIndex.get(attributeNameList)
+        iL = [aIdx.index(name) for name in selectList]
+        if None in iL:
+            return [tuple(row[i] if i is not None else None for i in iL) for row in rowList], list(selectList)
+        return [tuple(row[i] for i in iL) for row in rowList], list(selectList)
 
     def get(self, index=0):
         try:
@@ -38,233 +133,348 @@ class PdbxCategoryItBase:
         except:  # noqa: E722 pylint: disable=bare-except
             return []
 
+    def getAttributeList(self):
+        return self.__aL
+
+    def getColumn(self, name):
+        """Return the list of raw values for the input attribute or None if the attribute is not defined."""
+        i = PdbxAttributeIndex.get(self.__aL).index(name)
+        if i is None:
+            return None
+        return [row[i] for row in self.__rL]
+
+    def getColumnArray(self, nameList):
+        """Return an (N, len(nameList)) string array of raw values.  Undefined attributes are filled with '?'."""
+        aIdx = PdbxAttributeIndex.get(self.__aL)
+        iL = [aIdx.index(name) for name in nameList]
+        vL = [[row[i] if i is not None else "?" for i in iL] for row in self.__rL]
+        return np.array(vL, dtype=str).reshape(len(self.__rL), len(iL))
+
+    def materialize(self):
+        """Return a list of records for all rows.  Accessor records are frozen as described above."""
+        recordFunc = self.__recordFunc
+        return [recordFunc(row) for row in self.__rL]
+
+    def __len__(self):
+        return len(self.__rL)
+
+    def __getitem__(self, index):
+        """Return the record for the row at index (frozen for accessor classes) or, for a slice,
+        a new iterator over the selected rows.  Row data are shared, but a sliced iterator binds
+        its own accessor so that slices may be consumed concurrently.
+        """
+        if isinstance(index, slice):
+            return copy.copy(self)._clone(self.__rL[index])
+        return self.__recordFunc(self.__rL[index])
+
+    def _clone(self, rowList):
+        """Rebind this (shallow copied) iterator to rowList with its own row accessor and return it."""
+        self.__rL = rowList
+        accessor = getattr(self.__func, "__self__", None)
+        if isinstance(accessor, PdbxRowAccessorBase):
+            self.__func = copy.copy(accessor).set
+        return self
+
+    def chunks(self, chunkSize):
+        """Generate iterators over consecutive blocks of at most chunkSize rows."""
+        if chunkSize < 1:
+            raise ValueError("Chunk size must be positive")
+        for start in range(0, len(self.__rL), chunkSize):
+            yield self[start : start + chunkSize]
+
+    def window(self, start, stop=None, step=1):
+        """Generate records for rows start:stop:step without building an intermediate row list."""
+        func = self.__func
+        for row in islice(self.__rL, start, stop, step):
+            yield func(row)
+
     def __iter__(self):
         return self.forward()
 
     def forward(self):
         # Forward generator
+        rL = self.__rL
+        func = self.__func
         current_row = 0
-        while current_row < len(self.__rL):
-            row = self.__rL[current_row]
+        nRows = len(rL)
+        while current_row < nRows:
+            row = rL[current_row]
             current_row += 1
-            yield self.__func(row)
+            yield func(row)
 
     def reverse(self):
         # The reverse generator
-        current_row = len(self.__rL)
+        rL = self.__rL
+        func = self.__func
+        current_row = len(rL)
         while current_row > 0:
             current_row -= 1
-            yield self.__func(self.__rL[current_row])
+            yield func(rL[current_row])
 
 
 class PdbxChemCompIt(PdbxCategoryItBase):
-    def __init__(self, dataCategory, verbose=True, log=sys.stderr):
-        o = PdbxChemCompPersist([], attributeNameList=dataCategory.getAttributeList(), verbose=verbose, log=log)
-        super(PdbxChemCompIt, self).__init__(dataCategory, o.set, verbose, log)
+    def __init__(self, dataCategory, verbose=True, log=sys.stderr, **kwargs):
+        super(PdbxChemCompIt, self).__init__(dataCategory, PdbxChemCompPersist, verbose, log, **kwargs)
 
 
 class PdbxChemCompAtomIt(PdbxCategoryItBase):
-    def __init__(self, dataCategory, verbose=True, log=sys.stderr):
-        o = PdbxChemCompAtomPersist([], attributeNameList=dataCategory.getAttributeList(), verbose=verbose, log=log)
-        super(PdbxChemCompAtomIt, self).__init__(dataCategory, o.set, verbose, log)
+    def __init__(self, dataCategory, verbose=True, log=sys.stderr, **kwargs):
+        super(PdbxChemCompAtomIt, self).__init__(dataCategory, PdbxChemCompAtomPersist, verbose, log, **kwargs)
+
+    def getModelCoordinateArray(self):
+        """Returns (xyz, missing) where xyz is an (N,3) float64 array of model coordinates and
+        missing is an (N,) boolean array marking atoms with any missing or unparsable coordinate.
+        """
+        return self.__getCoordinateArray(("model_Cartn_x", "model_Cartn_y", "model_Cartn_z"))
+
+    def getIdealCoordinateArray(self):
+        """Returns (xyz, missing) where xyz is an (N,3) float64 array of ideal coordinates and
+        missing is an (N,) boolean array marking atoms with any missing or unparsable coordinate.
+        """
+        return self.__getCoordinateArray(
+            ("pdbx_model_Cartn_x_ideal", "pdbx_model_Cartn_y_ideal", "pdbx_model_Cartn_z_ideal")
+        )
+
+    def __getCoordinateArray(self, nameList):
+        xyz, missing = toFloatArray(self.getColumnArray(nameList))
+        return xyz, missing.any(axis=1)
 
 
 class PdbxChemCompBondIt(PdbxCategoryItBase):
-    def __init__(self, dataCategory, verbose=True, log=sys.stderr):
-        o = PdbxChemCompBondPersist([], attributeNameList=dataCategory.getAttributeList(), verbose=verbose, log=log)
-        super(PdbxChemCompBondIt, self).__init__(dataCategory, o.set, verbose, log)
+    def __init__(self, dataCategory, verbose=True, log=sys.stderr, **kwargs):
+        super(PdbxChemCompBondIt, self).__init__(dataCategory, PdbxChemCompBondPersist, verbose, log, **kwargs)
 
 
 class PdbxChemCompDescriptorIt(PdbxCategoryItBase):
-    def __init__(self, dataCategory, verbose=True, log=sys.stderr):
-        o = PdbxChemCompDescriptorPersist(
-            [], attributeNameList=dataCategory.getAttributeList(), verbose=verbose, log=log
+    def __init__(self, dataCategory, verbose=True, log=sys.stderr, **kwargs):
+        super(PdbxChemCompDescriptorIt, self).__init__(
+            dataCategory, PdbxChemCompDescriptorPersist, verbose, log, **kwargs
         )
-        super(PdbxChemCompDescriptorIt, self).__init__(dataCategory, o.set, verbose, log)
 
 
 class PdbxChemCompIdentifierIt(PdbxCategoryItBase):
-    def __init__(self, dataCategory, verbose=True, log=sys.stderr):
-        o = PdbxChemCompIdentifierPersist(
-            [], attributeNameList=dataCategory.getAttributeList(), verbose=verbose, log=log
+    def __init__(self, dataCategory, verbose=True, log=sys.stderr, **kwargs):
+        super(PdbxChemCompIdentifierIt, self).__init__(
+            dataCategory, PdbxChemCompIdentifierPersist, verbose, log, **kwargs
         )
-        super(PdbxChemCompIdentifierIt, self).__init__(dataCategory, o.set, verbose, log)
 
 
 class PdbxChemCompAuditIt(PdbxCategoryItBase):
-    def __init__(self, dataCategory, verbose=True, log=sys.stderr):
-        o = PdbxChemCompAuditPersist([], attributeNameList=dataCategory.getAttributeList(), verbose=verbose, log=log)
-        super(PdbxChemCompAuditIt, self).__init__(dataCategory, o.set, verbose, log)
+    def __init__(self, dataCategory, verbose=True, log=sys.stderr, **kwargs):
+        super(PdbxChemCompAuditIt, self).__init__(dataCategory, PdbxChemCompAuditPersist, verbose, log, **kwargs)
 
 
-class PdbxChemCompPersist:
-    """Accessor methods chemical component attributes."""
+class PdbxAttributeIndex:
+    """Column positions for a category attribute list.
+
+    Positions are computed once for each distinct attribute list (schema) and shared
+    by all row accessors bound to that schema.  The cache is not bounded; its keys are
+    the attribute lists of the stored chemical component categories (or projections of
+    them), a small fixed set for any store.
+    """
+
+    __slots__ = ("__attributeNameList", "__indexD")
+    __schemaCache: ClassVar[dict[tuple[str, ...], "PdbxAttributeIndex"]] = {}
+
+    def __init__(self, attributeNameList):
+        self.__attributeNameList = list(attributeNameList)
+        self.__indexD = {}
+        for ii, name in enumerate(self.__attributeNameList):
+            # retain the first occurrence to match list.index() semantics
+            self.__indexD.setdefault(name, ii)
+
+    @classmethod
+    def get(cls, attributeNameList):
+        """Return the shared column index for the input attribute list."""
+        ky = tuple(attributeNameList) if attributeNameList is not None else ()
+        try:
+            return cls.__schemaCache[ky]
+        except KeyError:
+            aIdx = cls(ky)
+            cls.__schemaCache[ky] = aIdx
+            return aIdx
+
+    def getAttributeList(self):
+        return self.__attributeNameList
+
+    def getIndexDict(self):
+        return self.__indexD
+
+    def index(self, name):
+        """Return the column position of the input attribute name or None."""
+        return self.__indexD.get(name)
+
+
+class PdbxRowAccessorBase:
+    """Base accessor class binding a row of category data to its compiled schema.
+
+    Frozen accessors (see makeFrozen()) are permanently bound to a single row.
+    """
+
+    __slots__ = ("_frozen", "_indexD", "_rowData")
 
     def __init__(self, rowData, attributeNameList, verbose=True, log=sys.stderr):  # noqa: ARG002 pylint: disable=unused-argument
-        self.__rowData = rowData
-        self.__attributeNameList = attributeNameList
+        self._rowData = rowData
+        self._indexD = PdbxAttributeIndex.get(attributeNameList).getIndexDict()
+        self._frozen = False
+
+    @classmethod
+    def makeFrozen(cls, rowData, indexD):
+        """Return a read-only accessor for rowData using a compiled attribute index dictionary."""
+        obj = cls.__new__(cls)
+        obj._rowData = rowData
+        obj._indexD = indexD
+        obj._frozen = True
+        return obj
+
+    def isFrozen(self):
+        return self._frozen
 
     def set(self, rowData=None):
-        self.__rowData = rowData
+        if self._frozen:
+            raise AttributeError("%s row accessor is frozen" % self.__class__.__name__)
+        self._rowData = rowData
         return self
 
-    def __getAttribute(self, name):
+    def _getAttribute(self, name):
+        i = self._indexD.get(name)
+        if i is None:
+            return None
         try:
-            i = self.__attributeNameList.index(name)
-            return self.__rowData[i]
-        except:  # noqa: E722 pylint: disable=bare-except
+            return self._rowData[i]
+        except (IndexError, TypeError):
             return None
 
+
+class PdbxChemCompPersist(PdbxRowAccessorBase):
+    """Accessor methods chemical component attributes."""
+
+    __slots__ = ()
+
     def getId(self):
-        return self.__getAttribute("id")
+        return self._getAttribute("id")
 
     def getName(self):
-        return self.__getAttribute("name")
+        return self._getAttribute("name")
 
     def getType(self):
-        return self.__getAttribute("type")
+        return self._getAttribute("type")
 
     def getPdbxType(self):
-        return self.__getAttribute("pdbx_type")
+        return self._getAttribute("pdbx_type")
 
     def getFormula(self):
-        return self.__getAttribute("formula")
+        return self._getAttribute("formula")
 
     def getSynonyms(self):
-        return self.__getAttribute("pdbx_synonyms")
+        return self._getAttribute("pdbx_synonyms")
 
     def getFormalCharge(self):
-        return self.__getAttribute("pdbx_formal_charge")
+        return self._getAttribute("pdbx_formal_charge")
 
     def getModificationDate(self):
-        return self.__getAttribute("pdbx_modified_date")
+        return self._getAttribute("pdbx_modified_date")
 
     def getInitialDate(self):
-        return self.__getAttribute("pdbx_initial_date")
+        return self._getAttribute("pdbx_initial_date")
 
     def getReleaseStatus(self):
-        return self.__getAttribute("pdbx_release_status")
+        return self._getAttribute("pdbx_release_status")
 
     def getFormulaWeight(self):
-        return self.__getAttribute("formula_weight")
+        return self._getAttribute("formula_weight")
 
     def getSubComponentList(self):
-        return self.__getAttribute("pdbx_subcomponent_list")
+        return self._getAttribute("pdbx_subcomponent_list")
 
     def getAmbiguousFlag(self):
-        return self.__getAttribute("pdbx_ambiguous_flag")
+        return self._getAttribute("pdbx_ambiguous_flag")
 
     def getProcessingSite(self):
-        return self.__getAttribute("pdbx_processing_site")
+        return self._getAttribute("pdbx_processing_site")
 
     def getReplacesId(self):
-        return self.__getAttribute("pdbx_replaces")
+        return self._getAttribute("pdbx_replaces")
 
     def getReplacesById(self):
-        return self.__getAttribute("pdbx_replaced_by")
+        return self._getAttribute("pdbx_replaced_by")
 
     def getNstdParentId(self):
-        return self.__getAttribute("mon_nstd_parent_comp_id")
+        return self._getAttribute("mon_nstd_parent_comp_id")
 
     def getOneLetterCode(self):
-        return self.__getAttribute("one_letter_code")
+        return self._getAttribute("one_letter_code")
 
     def getThreeLetterCode(self):
-        return self.__getAttribute("three_letter_code")
+        return self._getAttribute("three_letter_code")
 
     def getModelCoordinatesPdbCode(self):
-        return self.__getAttribute("pdbx_model_coordinates_db_code")
+        return self._getAttribute("pdbx_model_coordinates_db_code")
 
     def getMissingModelCoordinates(self):
-        return self.__getAttribute("pdbx_model_coordinates_missing_flag")
+        return self._getAttribute("pdbx_model_coordinates_missing_flag")
 
     def getMissingIdealCoordinates(self):
-        return self.__getAttribute("pdbx_ideal_coordinates_missing_flag")
+        return self._getAttribute("pdbx_ideal_coordinates_missing_flag")
 
 
-class PdbxChemCompAtomPersist(PdbxChemCompConstants):
+class PdbxChemCompAtomPersist(PdbxRowAccessorBase, PdbxChemCompConstants):
     """Accessor methods chemical component atom attributes."""
 
-    def __init__(self, rowData, attributeNameList, verbose=True, log=sys.stderr):  # noqa: ARG002 pylint: disable=unused-argument
-        super(PdbxChemCompAtomPersist, self).__init__()
-        self.__rowData = rowData
-        self.__attributeNameList = attributeNameList
-
-    def __getAttribute(self, name):
-        try:
-            i = self.__attributeNameList.index(name)
-            return self.__rowData[i]
-        except:  # noqa: E722 pylint: disable=bare-except
-            return None
-
-    def set(self, rowData=None):
-        self.__rowData = rowData
-        return self
+    __slots__ = ()
 
     def getName(self):
-        return self.__getAttribute("atom_id")
+        return self._getAttribute("atom_id")
 
     def isChiral(self):
-        return self.__getAttribute("pdbx_stereo_config") != "N"
+        return self._getAttribute("pdbx_stereo_config") != "N"
 
     def getType(self):
-        return self.__getAttribute("type_symbol")
+        return self._getAttribute("type_symbol")
 
     def getLeavingAtomFlag(self):
-        return self.__getAttribute("pdbx_leaving_atom_flag")
+        return self._getAttribute("pdbx_leaving_atom_flag")
 
     def getAtNo(self):
-        try:
-            tyU = str(self.getType()).upper()
-            if (tyU == "D") or (tyU == "T"):  # noqa: PLR1714
-                tyU = "H"
-            return self._periodicTable.index(tyU) + 1
-        except:  # noqa: E722 pylint: disable=bare-except
-            # traceback.print_exc(file=self.__lfh)
-            return 0
+        return self._atomicNumberD.get(str(self.getType()).upper(), 0)
 
     def getIsotope(self):
-        ty = self.getType()
-        if ty == "D":
-            return 2
-        if ty == "T":
-            return 3
-        return 0
+        return self._isotopeD.get(str(self.getType()).upper(), 0)
 
     def isAromatic(self):
-        return self.__getAttribute("pdbx_aromatic_flag") != "N"
+        return self._getAttribute("pdbx_aromatic_flag") != "N"
 
     def getCIPStereo(self):
-        return self.__getAttribute("pdbx_stereo_config")
+        return self._getAttribute("pdbx_stereo_config")
 
     def getFormalCharge(self):
         try:
-            return int(self.__getAttribute("charge"))
+            return int(self._getAttribute("charge"))
         except:  # noqa: E722 pylint: disable=bare-except
             return 0
 
     def hasModelCoordinates(self):
         x, y, z = self.getModelCoordinates()
-        # x=self.__getAttribute('model_Cartn_x')
-        # y=self.__getAttribute('model_Cartn_y')
-        # z=self.__getAttribute('model_Cartn_z')
+        # x=self._getAttribute('model_Cartn_x')
+        # y=self._getAttribute('model_Cartn_y')
+        # z=self._getAttribute('model_Cartn_z')
         #
         return (x is not None) and (y is not None) and (z is not None)
 
     def hasIdealCoordinates(self):
         x, y, z = self.getIdealCoordinates()
-        # x=self.__getAttribute('pdbx_model_Cartn_x_ideal')
-        # y=self.__getAttribute('pdbx_model_Cartn_y_ideal')
-        # z=self.__getAttribute('pdbx_model_Cartn_z_ideal')
+        # x=self._getAttribute('pdbx_model_Cartn_x_ideal')
+        # y=self._getAttribute('pdbx_model_Cartn_y_ideal')
+        # z=self._getAttribute('pdbx_model_Cartn_z_ideal')
         #
         return (x is not None) and (y is not None) and (z is not None)
 
     def getModelCoordinates(self):
         """Returns (x,y,z)"""
         try:
-            x = float(self.__getAttribute("model_Cartn_x"))
-            y = float(self.__getAttribute("model_Cartn_y"))
-            z = float(self.__getAttribute("model_Cartn_z"))
+            x = float(self._getAttribute("model_Cartn_x"))
+            y = float(self._getAttribute("model_Cartn_y"))
+            z = float(self._getAttribute("model_Cartn_z"))
             return (x, y, z)
         except:  # noqa: E722 pylint: disable=bare-except
             return (None, None, None)
@@ -272,44 +482,31 @@ class PdbxChemCompAtomPersist(PdbxChemCompConstants):
     def getIdealCoordinates(self):
         """Returns (x,y,z)"""
         try:
-            x = float(self.__getAttribute("pdbx_model_Cartn_x_ideal"))
-            y = float(self.__getAttribute("pdbx_model_Cartn_y_ideal"))
-            z = float(self.__getAttribute("pdbx_model_Cartn_z_ideal"))
+            x = float(self._getAttribute("pdbx_model_Cartn_x_ideal"))
+            y = float(self._getAttribute("pdbx_model_Cartn_y_ideal"))
+            z = float(self._getAttribute("pdbx_model_Cartn_z_ideal"))
             return (x, y, z)
         except:  # noqa: E722 pylint: disable=bare-except
             return (None, None, None)
 
     def dump(self, ofh):
-        ofh.write("PdbxChemCompAtomPersist(dump) %r\n" % self.__rowData)
+        ofh.write("PdbxChemCompAtomPersist(dump) %r\n" % self._rowData)
 
 
-class PdbxChemCompBondPersist:
+class PdbxChemCompBondPersist(PdbxRowAccessorBase):
     """Accessor methods chemical component bond attributes."""
 
-    def __init__(self, rowData, attributeNameList, verbose=True, log=sys.stderr):  # noqa: ARG002 pylint: disable=unused-argument
-        self.__rowData = rowData
-        self.__attributeNameList = attributeNameList
-
-    def __getAttribute(self, name):
-        try:
-            i = self.__attributeNameList.index(name)
-            return self.__rowData[i]
-        except:  # noqa: E722 pylint: disable=bare-except
-            return None
-
-    def set(self, rowData=None):
-        self.__rowData = rowData
-        return self
+    __slots__ = ()
 
     def getBond(self):
         """Returns (atomI,atomJ) atom ids from the atom list."""
-        return (self.__getAttribute("atom_id_1"), self.__getAttribute("atom_id_2"))
+        return (self._getAttribute("atom_id_1"), self._getAttribute("atom_id_2"))
 
     def getType(self):
-        return self.__getAttribute("value_order")
+        return self._getAttribute("value_order")
 
     def getIntegerType(self):
-        bT = self.__getAttribute("value_order")
+        bT = self._getAttribute("value_order")
         if bT == "SING":
             return 1
         if bT == "DOUB":
@@ -321,122 +518,83 @@ class PdbxChemCompBondPersist:
         return 0
 
     def isAromatic(self):
-        return self.__getAttribute("pdbx_aromatic_flag") == "Y"
+        return self._getAttribute("pdbx_aromatic_flag") == "Y"
 
     def getStereo(self):
-        return self.__getAttribute("pdbx_stereo_config")
+        return self._getAttribute("pdbx_stereo_config")
 
     def hasStereo(self):
-        return self.__getAttribute("pdbx_stereo_config") != "N"
+        return self._getAttribute("pdbx_stereo_config") != "N"
 
     def dump(self, ofh):
-        ofh.write("PdbxChemCompBondPersist(dump) %r\n" % self.__rowData)
+        ofh.write("PdbxChemCompBondPersist(dump) %r\n" % self._rowData)
 
 
-class PdbxChemCompIdentifierPersist:
+class PdbxChemCompIdentifierPersist(PdbxRowAccessorBase):
     """Accessor methods chemical component identifier attributes."""
 
-    def __init__(self, rowData, attributeNameList, verbose=True, log=sys.stderr):  # noqa: ARG002 pylint: disable=unused-argument
-        self.__rowData = rowData
-        self.__attributeNameList = attributeNameList
-
-    def __getAttribute(self, name):
-        try:
-            i = self.__attributeNameList.index(name)
-            return self.__rowData[i]
-        except:  # noqa: E722 pylint: disable=bare-except
-            return None
-
-    def set(self, rowData=None):
-        self.__rowData = rowData
-        return self
+    __slots__ = ()
 
     def getIdentifier(self):
         """Returns the value of the identifier."""
-        return self.__getAttribute("identifier")
+        return self._getAttribute("identifier")
 
     def getType(self):
-        return self.__getAttribute("type")
+        return self._getAttribute("type")
 
     def getProgram(self):
-        return self.__getAttribute("program")
+        return self._getAttribute("program")
 
     def getProgramVersion(self):
-        return self.__getAttribute("program_version")
+        return self._getAttribute("program_version")
 
     def dump(self, ofh):
-        ofh.write("PdbxChemCompIdentifierPersist(dump) %r\n" % self.__rowData)
+        ofh.write("PdbxChemCompIdentifierPersist(dump) %r\n" % self._rowData)
 
 
-class PdbxChemCompDescriptorPersist:
+class PdbxChemCompDescriptorPersist(PdbxRowAccessorBase):
     """Accessor methods chemical component descriptor  attributes."""
 
-    def __init__(self, rowData, attributeNameList, verbose=True, log=sys.stderr):  # noqa: ARG002 pylint: disable=unused-argument
-        self.__rowData = rowData
-        self.__attributeNameList = attributeNameList
-
-    def __getAttribute(self, name):
-        try:
-            i = self.__attributeNameList.index(name)
-            return self.__rowData[i]
-        except:  # noqa: E722 pylint: disable=bare-except
-            return None
-
-    def set(self, rowData=None):
-        self.__rowData = rowData
-        return self
+    __slots__ = ()
 
     def getDescriptor(self):
         """Returns the value of the descriptor."""
-        return self.__getAttribute("descriptor")
+        return self._getAttribute("descriptor")
 
     def getType(self):
-        return self.__getAttribute("type")
+        return self._getAttribute("type")
 
     def getProgram(self):
-        return self.__getAttribute("program")
+        return self._getAttribute("program")
 
     def getProgramVersion(self):
-        return self.__getAttribute("program_version")
+        return self._getAttribute("program_version")
 
     def dump(self, ofh):
-        ofh.write("PdbxChemCompDescriptorPersist(dump) %r\n" % self.__rowData)
+        ofh.write("PdbxChemCompDescriptorPersist(dump) %r\n" % self._rowData)
 
 
-class PdbxChemCompAuditPersist:
+class PdbxChemCompAuditPersist(PdbxRowAccessorBase):
     """Accessor methods chemical component audit details."""
 
-    def __init__(self, rowData, attributeNameList, verbose=True, log=sys.stderr):  # noqa: ARG002 pylint: disable=unused-argument
-        self.__rowData = rowData
-        self.__attributeNameList = attributeNameList
-
-    def __getAttribute(self, name):
-        try:
-            i = self.__attributeNameList.index(name)
-            return self.__rowData[i]
-        except:  # noqa: E722 pylint: disable=bare-except
-            return None
-
-    def set(self, rowData=None):
-        self.__rowData = rowData
-        return self
+    __slots__ = ()
 
     def getActionType(self):
         """Returns the value of the action type."""
-        return self.__getAttribute("action_type")
+        return self._getAttribute("action_type")
 
     def getDate(self):
         """Returns the value of audit date."""
-        return self.__getAttribute("date")
+        return self._getAttribute("date")
 
     def getProcessingSite(self):
         """Returns the value of processing site."""
-        return self.__getAttribute("processing_site")
+        return self._getAttribute("processing_site")
 
     def getAnnotator(self):
         """Returns the value of audit annotator."""
-        return self.__getAttribute("annotator")
+        return self._getAttribute("annotator")
 
     def getDetails(self):
         """Returns the value of audit details."""
-        return self.__getAttribute("details")
+        return self._getAttribute("details")
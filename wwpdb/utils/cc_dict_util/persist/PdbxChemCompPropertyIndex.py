@@ -0,0 +1,160 @@
+##
+# File: PdbxChemCompPropertyIndex.py
+# Date: 18-Oct-2026
+#
+# Update:
+#
+##
+"""
+Sorted numeric property arrays (formula weight and heavy atom count) built from the
+search index with binary search range, nearest value and top-k queries.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import shutil
+import sys
+import traceback
+
+import numpy as np
+
+
+class PdbxChemCompPropertyIndex:
+    """Builds, reads and queries sorted component property arrays.
+
+    For each property the index directory holds the sorted values (<property>.npy) and the
+    permutation from sorted position to the component ordinal (<property>Perm.npy).  Component
+    identifiers are stored in search index order in ccId.npy.  Components with a missing or
+    unparsable value are omitted from the property arrays.  Arrays are memory-mapped on reading.
+    """
+
+    _propertyList = ("formulaWeight", "heavyAtomCount")
+    _hydrogenTypeList = ("H", "D", "T")
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        self.__verbose = verbose
+        self.__debug = False
+        self.__lfh = log
+
+    @staticmethod
+    def __toFloat(value):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+
+    def makeIndex(self, ccIdx, indexPath="chemcomp-property-index"):
+        """Create the sorted property arrays from the search index ccIdx and store them in the directory indexPath.
+
+        Returns the number of components indexed or 0 on failure.
+        """
+        try:
+            ccIdList = list(ccIdx.keys())
+            valueD = {
+                "formulaWeight": np.asarray(
+                    [self.__toFloat(ccIdx[ccId].get("formulaWeight")) for ccId in ccIdList], dtype=np.float64
+                ),
+                "heavyAtomCount": np.asarray(
+                    [
+                        sum(
+                            cnt
+                            for aType, cnt in ccIdx[ccId].get("typeCounts", {}).items()
+                            if aType not in self._hydrogenTypeList
+                        )
+                        for ccId in ccIdList
+                    ],
+                    dtype=np.float64,
+                ),
+            }
+            tmpPath = indexPath + "-tmp"
+            if os.path.exists(tmpPath):
+                shutil.rmtree(tmpPath)
+            os.makedirs(tmpPath)
+            np.save(os.path.join(tmpPath, "ccId.npy"), np.asarray(ccIdList, dtype=str), allow_pickle=False)
+            for prop in self._propertyList:
+                vA = valueD[prop]
+                # stable sort so that equal values keep the search index order
+                permA = np.flatnonzero(~np.isnan(vA))
+                permA = permA[np.argsort(vA[permA], kind="stable")].astype(np.int64)
+                np.save(os.path.join(tmpPath, prop + ".npy"), vA[permA], allow_pickle=False)
+                np.save(os.path.join(tmpPath, prop + "Perm.npy"), permA, allow_pickle=False)
+            if os.path.exists(indexPath):
+                shutil.rmtree(indexPath)
+            os.rename(tmpPath, indexPath)
+            return len(ccIdList)
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write("PdbxChemCompPropertyIndex(makeIndex) index creation failed for %s\n" % indexPath)
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+        return 0
+
+    def readIndex(self, indexPath="chemcomp-property-index", mmapMode="r"):
+        """Return the property index as a dictionary of arrays (memory-mapped unless mmapMode is None) or {}."""
+        indexD = {}
+        try:
+            for name in ["ccId"] + [prop + sfx for prop in self._propertyList for sfx in ("", "Perm")]:
+                indexD[name] = np.load(os.path.join(indexPath, name + ".npy"), mmap_mode=mmapMode, allow_pickle=False)
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return {}
+        return indexD
+
+    @classmethod
+    def __getArrays(cls, indexD, prop):
+        if prop not in cls._propertyList:
+            raise ValueError("Unsupported property %r" % prop)
+        return indexD[prop], indexD[prop + "Perm"]
+
+    @staticmethod
+    def __getHits(indexD, vA, permA, posL):
+        ccIdA = indexD["ccId"]
+        return [(str(ccIdA[permA[ii]]), float(vA[ii])) for ii in posL]
+
+    @classmethod
+    def rangeQuery(cls, indexD, prop, minValue=None, maxValue=None):
+        """Return [(ccId, value), ...] in increasing value order for components with minValue <= value <= maxValue.
+
+        Either bound may be None.
+        """
+        vA, permA = cls.__getArrays(indexD, prop)
+        lo = 0 if minValue is None else int(np.searchsorted(vA, minValue, side="left"))
+        hi = len(vA) if maxValue is None else int(np.searchsorted(vA, maxValue, side="right"))
+        return cls.__getHits(indexD, vA, permA, range(lo, max(lo, hi)))
+
+    @classmethod
+    def massWindow(cls, indexD, mass, tolerance=0.5):
+        """Return [(ccId, formulaWeight), ...] for components with formula weight within mass +/- tolerance."""
+        return cls.rangeQuery(indexD, "formulaWeight", mass - tolerance, mass + tolerance)
+
+    @classmethod
+    def nearest(cls, indexD, prop, value, k=5):
+        """Return the k components with property values nearest to value as [(ccId, value), ...] in order of distance."""
+        vA, permA = cls.__getArrays(indexD, prop)
+        n = len(vA)
+        hi = int(np.searchsorted(vA, value, side="left"))
+        lo = hi - 1
+        posL = []
+        while len(posL) < k and (lo >= 0 or hi < n):
+            if hi >= n or (lo >= 0 and value - vA[lo] <= vA[hi] - value):
+                posL.append(lo)
+                lo -= 1
+            else:
+                posL.append(hi)
+                hi += 1
+        return cls.__getHits(indexD, vA, permA, posL)
+
+    @classmethod
+    def topK(cls, indexD, prop, k=10, largest=True):
+        """Return the k components with the largest (or smallest) property values as [(ccId, value), ...]."""
+        vA, permA = cls.__getArrays(indexD, prop)
+        k = min(k, len(vA))
+        posL = range(len(vA) - 1, len(vA) - 1 - k, -1) if largest else range(k)
+        return cls.__getHits(indexD, vA, permA, posL)
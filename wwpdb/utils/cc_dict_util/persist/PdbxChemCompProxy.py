@@ -0,0 +1,126 @@
+##
+# File: PdbxChemCompProxy.py
+# Date: 18-Oct-2026
+#
+# Update:
+#
+##
+"""
+Lazy proxy for a single chemical component held in a persistent store.
+
+Categories are fetched from the store on first access and then memoized.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import sys
+import traceback
+from typing import ClassVar
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompPersist import (
+    PdbxChemCompAtomIt,
+    PdbxChemCompAuditIt,
+    PdbxChemCompBondIt,
+    PdbxChemCompDescriptorIt,
+    PdbxChemCompIdentifierIt,
+    PdbxChemCompIt,
+)
+
+
+class PdbxChemCompProxy:
+    """Proxy for the categories of chemical component ccId in an open PdbxPersist store.
+
+    Each category is fetched and wrapped in its iterator class only when first requested.
+    Iterator keyword arguments (e.g. rowFilter, selectList, frozen) may be passed to the
+    getters, in which case a new iterator is built over the memoized category.
+    """
+
+    _iteratorD: ClassVar = {
+        "chem_comp": PdbxChemCompIt,
+        "chem_comp_atom": PdbxChemCompAtomIt,
+        "chem_comp_bond": PdbxChemCompBondIt,
+        "pdbx_chem_comp_descriptor": PdbxChemCompDescriptorIt,
+        "pdbx_chem_comp_identifier": PdbxChemCompIdentifierIt,
+        "pdbx_chem_comp_audit": PdbxChemCompAuditIt,
+    }
+
+    def __init__(self, ccId, persist, verbose=True, log=sys.stderr):
+        self.__ccId = ccId
+        self.__persist = persist
+        self.__verbose = verbose
+        self.__debug = False
+        self.__lfh = log
+        self.__categoryD = {}
+        self.__iteratorD = {}
+
+    def getId(self):
+        return self.__ccId
+
+    def getCategory(self, objectName):
+        """Return the data category objectName for this component or None if it is not stored."""
+        try:
+            return self.__categoryD[objectName]
+        except KeyError:
+            pass
+        dC = None
+        try:
+            dC = self.__persist.fetchObject(containerName=self.__ccId, objectName=objectName)
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompProxy(getCategory) fetch failed for %s category %s\n" % (self.__ccId, objectName)
+                )
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return None
+        self.__categoryD[objectName] = dC
+        return dC
+
+    def isLoaded(self, objectName):
+        return objectName in self.__categoryD
+
+    def invalidate(self, objectName=None):
+        """Discard the memoized category objectName, or all categories if objectName is None,
+        so that they are fetched again on next access.
+        """
+        if objectName is None:
+            self.__categoryD = {}
+            self.__iteratorD = {}
+        else:
+            self.__categoryD.pop(objectName, None)
+            self.__iteratorD.pop(objectName, None)
+
+    def getChemComp(self, **kwargs):
+        return self.__getIterator("chem_comp", kwargs)
+
+    def getAtoms(self, **kwargs):
+        return self.__getIterator("chem_comp_atom", kwargs)
+
+    def getBonds(self, **kwargs):
+        return self.__getIterator("chem_comp_bond", kwargs)
+
+    def getDescriptors(self, **kwargs):
+        return self.__getIterator("pdbx_chem_comp_descriptor", kwargs)
+
+    def getIdentifiers(self, **kwargs):
+        return self.__getIterator("pdbx_chem_comp_identifier", kwargs)
+
+    def getAudit(self, **kwargs):
+        return self.__getIterator("pdbx_chem_comp_audit", kwargs)
+
+    def __getIterator(self, objectName, kwargs):
+        """Return the iterator for objectName or None if the category is not stored."""
+        if not kwargs and objectName in self.__iteratorD:
+            return self.__iteratorD[objectName]
+        dC = self.getCategory(objectName)
+        if dC is None:
+            return None
+        it = self._iteratorD[objectName](dC, self.__verbose, self.__lfh, **kwargs)
+        if not kwargs:
+            self.__iteratorD[objectName] = it
+        return it
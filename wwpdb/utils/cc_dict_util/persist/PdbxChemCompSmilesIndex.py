@@ -0,0 +1,93 @@
+##
+# File: PdbxChemCompSmilesIndex.py
+# Date: 18-Oct-2026
+#
+# Update:
+#  18-Oct-2026     document both spellings of the canonical SMILES descriptor type
+#  18-Oct-2026     report index read failures in verbose mode
+##
+"""
+Exact match reverse lookup of chemical components by SMILES descriptor.
+
+The index is built in the same pass over the store as the search index (see
+PdbxChemCompDictIndex.makeIndices()) and is stored as a pickled dictionary alongside it.
+It is intended as a fast first pass before any cheminformatics matching.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import sys
+import traceback
+
+try:
+    import cPickle as pickle  # type: ignore[import-not-found]  # noqa: S301,N813,S403
+except ImportError:
+    import pickle  # noqa: S301,S403
+
+
+class PdbxChemCompSmilesIndex:
+    """Reads and searches the reverse SMILES index.
+
+    The index is a dictionary {smiles: [(ccId, descriptorType, program), ...]} holding every
+    SMILES descriptor (stereo and non-stereo, all programs) with entries in store order.  SMILES
+    strings are stored with whitespace removed, and program tags are stored in upper case with
+    runs of whitespace collapsed to one space.  SMILES are otherwise matched exactly.
+    """
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        self.__verbose = verbose
+        self.__debug = False
+        self.__lfh = log
+
+    @staticmethod
+    def normalizeSmiles(smiles):
+        return "".join(str(smiles).split())
+
+    @staticmethod
+    def normalizeProgram(program):
+        return " ".join(str(program).upper().split())
+
+    def readIndex(self, indexPath="chemcomp-smiles-index.pic"):
+        """Read and return the reverse SMILES index or {} on failure."""
+        try:
+            with open(indexPath, "rb") as fin:
+                return pickle.load(fin)  # noqa: S301
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write("PdbxChemCompSmilesIndex(readIndex) reading index %s failed\n" % indexPath)
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return {}
+
+    @classmethod
+    def getEntries(cls, smilesD, smiles):
+        """Return the list of (ccId, descriptorType, program) entries matching the input SMILES string."""
+        return list(smilesD.get(cls.normalizeSmiles(smiles), []))
+
+    @classmethod
+    def lookup(cls, smilesD, smilesList, program=None, descriptorType=None):
+        """Return a dictionary of matching component identifier lists for each SMILES string in smilesList.
+
+        Matches may be restricted to descriptors from a program (e.g. 'OpenEye OEToolkits' or
+        'CACTVS', compared case-insensitively) and to a descriptor type compared exactly as
+        stored in the dictionary ('SMILES' or 'SMILES_CANONICAL', which is spelled
+        'SMILES_CANNONICAL' in older releases).  SMILES strings without a match map to [].
+        """
+        nProgram = cls.normalizeProgram(program) if program is not None else None
+        retD = {}
+        for smiles in smilesList:
+            ccIdL = []
+            for ccId, desType, desProgram in smilesD.get(cls.normalizeSmiles(smiles), []):
+                if nProgram is not None and nProgram != desProgram:
+                    continue
+                if descriptorType is not None and descriptorType != desType:
+                    continue
+                if ccId not in ccIdL:
+                    ccIdL.append(ccId)
+            retD[smiles] = ccIdL
+        return retD
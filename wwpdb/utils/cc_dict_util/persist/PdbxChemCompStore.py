@@ -0,0 +1,239 @@
+##
+# File: PdbxChemCompStore.py
+# Date: 18-Oct-2026
+#
+# Update:
+#  18-Oct-2026     Add an incremental writer for streaming store construction
+#  18-Oct-2026     Add an editor to replace and remove containers in an existing store
+#  18-Oct-2026     Locate containers by name in the editor and write the container index once
+#  18-Oct-2026     Share the store key encoding between the reader, writer and editor
+#
+##
+"""
+Lightweight access to the shelve persistent store written by PdbxPersist.
+
+PdbxPersist.open() takes an exclusive lock on the store, so concurrent readers are
+serialized.  The reader below opens the store read-only without taking the lock and is
+intended for worker processes whose parent holds the store lock for the duration of the
+work.
+
+The writer creates a new store in the same format as PdbxPersist.store() but accepts
+containers incrementally so that the full container list need not be held in memory.
+The editor replaces and removes containers of an existing store in a single locked pass.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import shelve
+import sys
+import traceback
+
+try:
+    import cPickle as pickle  # type: ignore[import-not-found]  # noqa: S301,N813,S403
+except ImportError:
+    import pickle  # noqa: S301,S403
+
+from mmcif.api.DataCategory import DataCategory
+from mmcif_utils.persist.LockFile import LockFile
+
+
+def _encodeKey(ky):
+    """Return the store key for ky with the same encoding as PdbxPersist."""
+    return ky.encode("ascii", errors="xmlcharrefreplace").decode("ascii")
+
+
+class PdbxChemCompStoreReader:
+    """Read-only, lock-free access to a PdbxPersist shelve store.
+
+    Provides the subset of the PdbxPersist interface used for reading an open store:
+    open(), getStoreContainerIndex(), fetchObject() and close().
+    """
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        self.__verbose = verbose
+        self.__debug = False
+        self.__lfh = log
+        self.__db = None
+
+    def open(self, dbFileName="my.db"):
+        try:
+            self.__db = shelve.open(dbFileName, flag="r")  # noqa: S301
+            return True
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write("PdbxChemCompStoreReader(open) open failed for %s\n" % dbFileName)
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return False
+
+    def close(self):
+        try:
+            self.__db.close()
+            self.__db = None
+            return True
+        except:  # noqa: E722 pylint: disable=bare-except
+            return False
+
+    def getStoreContainerIndex(self):
+        try:
+            return self.__db["__index__"]
+        except:  # noqa: E722 pylint: disable=bare-except
+            return []
+
+    def fetchObject(self, containerName=None, objectName=None):
+        """Return the data category objectName in containerName or None."""
+        try:
+            d = self.__db[_encodeKey(containerName + "||" + objectName)]
+            return DataCategory(name=d["name"], attributeNameList=d["aL"], rowList=d["rL"])
+        except:  # noqa: E722 pylint: disable=bare-except
+            return None
+
+
+class PdbxChemCompStoreWriter:
+    """Incremental creation of a new PdbxPersist shelve store.
+
+    Containers passed to addContainerList() are written immediately; the container index is
+    written by close().  No lock is taken, so the writer is intended for temporary stores
+    which are moved into place afterwards (see PdbxPersist.moveStore()).
+    """
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        self.__verbose = verbose
+        self.__debug = False
+        self.__lfh = log
+        self.__db = None
+        self.__containerNameList = []
+        self.__containerTypeList = []
+
+    def open(self, dbFileName="my.db"):
+        """Create a new empty store dbFileName (any existing store is replaced)."""
+        try:
+            self.__db = shelve.open(dbFileName, flag="n", protocol=pickle.HIGHEST_PROTOCOL)  # noqa: S301
+            self.__containerNameList = []
+            self.__containerTypeList = []
+            return True
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write("PdbxChemCompStoreWriter(open) open failed for %s\n" % dbFileName)
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return False
+
+    def addContainerList(self, containerList):
+        """Write the input containers to the store.  Returns the number of containers written."""
+        for container in containerList:
+            containerName = container.getName()
+            objNameList = container.getObjNameList()
+            self.__db[_encodeKey(containerName + "||__index__")] = objNameList
+            for objName in objNameList:
+                d = {}
+                d["name"], d["aL"], d["rL"] = container.getObj(objName).get()
+                self.__db[_encodeKey(containerName + "||" + objName)] = d
+            self.__containerNameList.append(containerName)
+            self.__containerTypeList.append(container.getType())
+        return len(containerList)
+
+    def getContainerCount(self):
+        return len(self.__containerNameList)
+
+    def close(self):
+        """Write the container index and close the store."""
+        try:
+            self.__db["__index__"] = self.__containerNameList
+            self.__db["__types__"] = self.__containerTypeList
+            self.__db.close()
+            self.__db = None
+            return True
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return False
+
+
+class PdbxChemCompStoreEditor:
+    """Replacement and removal of containers in an existing PdbxPersist shelve store.
+
+    Unlike PdbxPersist.updateContainerList(), categories which are no longer present in a
+    replaced container are removed from the store, and containers may be deleted.
+    """
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        self.__verbose = verbose
+        self.__debug = False
+        self.__lfh = log
+
+    def update(self, dbFileName="my.db", containerList=None, removeNameList=None):
+        """Replace or append the containers in containerList and remove the containers named in
+        removeNameList in one pass over the store dbFileName with the store locked.
+
+        Replaced containers keep their position in the store container index, and the container
+        index is written once.  Names in removeNameList which are also in containerList are replaced
+        rather than removed.  Returns a dictionary of container name lists
+        {"replaced": [...], "appended": [...], "removed": [...]} or None on failure.
+        """
+        retD = {"replaced": [], "appended": [], "removed": []}
+        try:
+            with LockFile(dbFileName, verbose=self.__verbose, log=self.__lfh):
+                db = shelve.open(dbFileName, flag="w", protocol=pickle.HIGHEST_PROTOCOL)  # noqa: S301
+                try:
+                    containerNameList = db["__index__"]
+                    containerTypeList = db["__types__"]
+                    positionD = {containerName: ii for ii, containerName in enumerate(containerNameList)}
+                    for container in containerList or []:
+                        containerName = container.getName()
+                        objNameList = container.getObjNameList()
+                        if containerName in positionD:
+                            self.__deleteObjects(db, containerName, objNameList)
+                            containerTypeList[positionD[containerName]] = container.getType()
+                            retD["replaced"].append(containerName)
+                        else:
+                            positionD[containerName] = len(containerNameList)
+                            containerNameList.append(containerName)
+                            containerTypeList.append(container.getType())
+                            retD["appended"].append(containerName)
+                        db[_encodeKey(containerName + "||__index__")] = objNameList
+                        for objName in objNameList:
+                            d = {}
+                            d["name"], d["aL"], d["rL"] = container.getObj(objName).get()
+                            db[_encodeKey(containerName + "||" + objName)] = d
+                    writtenS = set(retD["replaced"]) | set(retD["appended"])
+                    removeS = set()
+                    for containerName in removeNameList or []:
+                        if (
+                            containerName in positionD
+                            and containerName not in writtenS
+                            and containerName not in removeS
+                        ):
+                            self.__deleteObjects(db, containerName, [])
+                            del db[_encodeKey(containerName + "||__index__")]
+                            removeS.add(containerName)
+                            retD["removed"].append(containerName)
+                    if removeS:
+                        keepL = [
+                            ii for ii, containerName in enumerate(containerNameList) if containerName not in removeS
+                        ]
+                        containerNameList = [containerNameList[ii] for ii in keepL]
+                        containerTypeList = [containerTypeList[ii] for ii in keepL]
+                    db["__index__"] = containerNameList
+                    db["__types__"] = containerTypeList
+                finally:
+                    db.close()
+            return retD
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write("PdbxChemCompStoreEditor(update) update failed for %s\n" % dbFileName)
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+            return None
+
+    def __deleteObjects(self, db, containerName, keepObjNameList):
+        """Delete the stored objects of containerName which are not in keepObjNameList."""
+        keepS = set(keepObjNameList)
+        for objName in db[_encodeKey(containerName + "||__index__")]:
+            if objName not in keepS:
+                del db[_encodeKey(containerName + "||" + objName)]
@@ -0,0 +1,120 @@
+##
+# File: PdbxChemCompTypedColumns.py
+# Date: 18-Oct-2026
+#
+# Update:
+#  18-Oct-2026     use the shared value conversion helpers
+##
+"""
+Typed column extraction for chemical component dictionary categories.
+
+Item types are taken from PdbxChemCompCategoryDefinitions and whole category columns
+are converted in bulk to NumPy arrays.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import sys
+import traceback
+from typing import ClassVar
+
+import numpy as np
+
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompCategoryDefinitions import (
+    PdbxChemCompCategoryDefinitions,
+)
+from wwpdb.utils.cc_dict_util.persist.PdbxChemCompValueConversion import (
+    MISSING_VALUES,
+    toFloatArray,
+    toIntArray,
+)
+
+
+class PdbxChemCompTypedColumns(PdbxChemCompCategoryDefinitions):
+    """Bulk typed conversion of category columns using the item types in PdbxChemCompCategoryDefinitions.
+
+    Conversions by item type:
+
+        float   float64 array with NaN for missing or unparsable values
+        int     int64 array with intMissingValue for missing or unparsable values
+        str     list of values with None for missing values
+
+    Items without a definition are treated as 'str'.  Converted columns are cached per
+    component identifier, category and attribute (see getComponentColumn()).
+    """
+
+    intMissingValue = int(np.iinfo(np.int64).min)
+
+    __itemTypeD: ClassVar[dict[str, dict[str, str]]] = {}
+
+    def __init__(self, verbose=True, log=sys.stderr):
+        self.__verbose = verbose
+        self.__debug = False
+        self.__lfh = log
+        self.__cacheD = {}
+
+    @classmethod
+    def getItemType(cls, categoryName, attributeName):
+        """Return the item type ('str', 'int' or 'float') for the input category attribute."""
+        if not cls.__itemTypeD:
+            for itemList in cls._cDict.values():
+                for itemName, _fmt, itemType, _default in itemList:
+                    catName, attName = itemName[1:].split(".", 1)
+                    cls.__itemTypeD[(catName, attName)] = itemType
+        return cls.__itemTypeD.get((categoryName, attributeName), "str")
+
+    def convertColumn(self, dataCategory, attributeName):
+        """Return the typed column for the input attribute of dataCategory or None if the
+        attribute is not defined in the category.
+        """
+        try:
+            aL = dataCategory.getAttributeList()
+            if attributeName not in aL:
+                return None
+            i = aL.index(attributeName)
+            vL = [row[i] for row in dataCategory.getRowList()]
+            itemType = self.getItemType(dataCategory.getName(), attributeName)
+            if itemType == "float":
+                return toFloatArray(vL)[0]
+            if itemType == "int":
+                return toIntArray(vL, self.intMissingValue)[0]
+            return [v if v not in MISSING_VALUES else None for v in vL]
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                self.__lfh.write(
+                    "PdbxChemCompTypedColumns(convertColumn) conversion failed for %s.%s\n"
+                    % (dataCategory.getName(), attributeName)
+                )
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+        return None
+
+    def convertColumns(self, dataCategory, attributeNameList=None):
+        """Return a dictionary of typed columns keyed by attribute name.  All attributes of the
+        category are converted if attributeNameList is None.
+        """
+        if attributeNameList is None:
+            attributeNameList = dataCategory.getAttributeList()
+        return {name: self.convertColumn(dataCategory, name) for name in attributeNameList}
+
+    def getComponentColumn(self, ccId, dataCategory, attributeName):
+        """Return the typed column for component ccId, converting and caching it on first access."""
+        ky = (ccId, dataCategory.getName(), attributeName)
+        try:
+            return self.__cacheD[ky]
+        except KeyError:
+            col = self.convertColumn(dataCategory, attributeName)
+            self.__cacheD[ky] = col
+            return col
+
+    def clearCache(self, ccId=None):
+        """Discard cached columns for the input component or for all components if ccId is None."""
+        if ccId is None:
+            self.__cacheD = {}
+        else:
+            self.__cacheD = {ky: v for ky, v in self.__cacheD.items() if ky[0] != ccId}
@@ -0,0 +1,64 @@
+##
+# File: PdbxChemCompValueConversion.py
+# Date: 18-Oct-2026
+#
+# Update:
+#
+##
+"""
+Bulk conversion of arrays of CIF string values to NumPy numeric arrays, shared by the
+category iterators, the typed column extraction and the columnar atom table.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import numpy as np
+
+MISSING_VALUES = ("?", ".")
+
+
+def toFloatArray(valueArray):
+    """Convert an array of CIF string values to float64 in a single pass.
+
+    Returns (floatArray, missingMask) where missing ('?', '.') and unparsable values are NaN.
+    """
+    sA = np.asarray(valueArray, dtype=str)
+    missing = np.isin(sA, MISSING_VALUES)
+    sA = np.where(missing, "nan", sA)
+    try:
+        fA = sA.astype(np.float64)
+    except ValueError:
+        # fall back to element-wise conversion only when a malformed value is present
+        fA = np.empty(sA.shape, dtype=np.float64)
+        for ii, v in np.ndenumerate(sA):
+            try:
+                fA[ii] = float(v)
+            except ValueError:
+                fA[ii] = np.nan
+                missing[ii] = True
+    return fA, missing
+
+
+def toIntArray(valueArray, missingValue):
+    """Convert an array of CIF string values to int64 in a single pass.
+
+    Returns (intArray, missingMask) where missing ('?', '.') and unparsable values are set to missingValue.
+    """
+    sA = np.asarray(valueArray, dtype=str)
+    missing = np.isin(sA, MISSING_VALUES)
+    try:
+        iA = np.where(missing, "0", sA).astype(np.int64)
+    except ValueError:
+        iA = np.empty(sA.shape, dtype=np.int64)
+        for ii, v in np.ndenumerate(sA):
+            try:
+                iA[ii] = int(v)
+            except ValueError:
+                missing[ii] = True
+    iA[missing] = missingValue
+    return iA, missing